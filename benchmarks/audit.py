@@ -0,0 +1,48 @@
+# Benchmark: auditoria em lote (database.auditar_tabela) sobre um .csv sintético com senhas herdadas misturadas
+# (geradas, curtas, sequenciais, só letras, com acentos), backend python x numpy, em fluxo por blocos.
+#
+# Uso: python -m benchmarks.audit [linhas] [tamanho_do_bloco] [workers]   (requer pandas e numpy)
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+import database
+from passwords.generator import PasswordGenerator
+from passwords.rng import DeterministicRandom
+
+LEGADAS = np.array(["123456", "abcdef", "Senha@2020", "qwerty!", "João1234!", "aaaaaaaaaa", "P@ssw0rd"], dtype=object)
+
+
+def frame(rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    services = np.array(["Slack", "Onedrive", "Miro", "Ea", "Figma", "Heroku", "Notion", "Jira"], dtype=object)
+    senhas = np.array(PasswordGenerator(rng=DeterministicRandom(0)).generate_many(rows, 10), dtype=object)
+    legadas = rng.random(rows) < 0.2
+    senhas[legadas] = LEGADAS[rng.integers(0, len(LEGADAS), int(legadas.sum()))]
+    return pd.DataFrame({
+        "Serviço": services[rng.integers(0, len(services), rows)],
+        "Usuário": [f"Usuário {i:x}" for i in range(rows)],
+        "Senha": senhas,
+    })
+
+
+if __name__ == "__main__":
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    chunk = int(sys.argv[2]) if len(sys.argv) > 2 else 100_000
+    workers = int(sys.argv[3]) if len(sys.argv) > 3 else 1
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "legado.csv"
+        frame(rows).to_csv(path)
+        print(f"{rows:,} linhas em blocos de {chunk:,}, workers={workers}")
+        print(f"{'backend':<8} {'s':>8} {'linhas/s':>12} {'reprovadas':>11}")
+        for backend in ("python", "numpy"):
+            start = time.perf_counter()
+            relatorio = database.auditar_tabela(path, chunksize=chunk, workers=workers, backend=backend, progresso=None)
+            secs = time.perf_counter() - start
+            print(f"{backend:<8} {secs:>8.2f} {rows / secs:>12,.0f} {relatorio.reprovadas:>11,}")
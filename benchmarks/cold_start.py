@@ -0,0 +1,38 @@
+# Benchmark: tempo de partida a frio do CLI (python -m passwords 16), comparado ao interpretador vazio.
+# Mediana de N execuções em processos novos; o .pyc já compilado (primeira execução descartada).
+#
+# Uso: python -m benchmarks.cold_start [N]
+# Para ver o custo por módulo: python -X importtime -m passwords 16
+
+import statistics
+import subprocess
+import sys
+import time
+
+COMMANDS = {
+    "python -c pass": [sys.executable, "-c", "pass"],
+    "import passwords": [sys.executable, "-c", "import passwords"],
+    "pgen 16": [sys.executable, "-m", "passwords", "16"],
+    "pgen 16 -n 100": [sys.executable, "-m", "passwords", "16", "-n", "100"],
+    "pgen 16 --entropy": [sys.executable, "-m", "passwords", "16", "--entropy"],
+}
+
+
+def cold_start_ms(cmd: list[str], runs: int) -> float:
+    subprocess.run(cmd, check=True, capture_output=True)  # aquece o cache de .pyc e do sistema de arquivos
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(cmd, check=True, capture_output=True)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000
+
+
+if __name__ == "__main__":
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    base = None
+    print(f"{'comando':<22} {'ms':>8} {'acima do vazio':>15}")
+    for name, cmd in COMMANDS.items():
+        ms = cold_start_ms(cmd, runs)
+        base = ms if base is None else base
+        print(f"{name:<22} {ms:>8.1f} {ms - base:>14.1f}")
@@ -0,0 +1,72 @@
+# Benchmark: CSV (to_csv/read_csv, formato atual de Cadastros) x Parquet x Arrow IPC (columnar.py),
+# medindo escrita em blocos, leitura completa e tamanho do arquivo.
+#
+# Uso: python -m benchmarks.columnar [linhas] [tamanho_do_bloco]   (requer pandas e pyarrow)
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from columnar import ColumnarWriter, ler, ler_df
+from passwords.generator import PasswordGenerator
+from passwords.rng import DeterministicRandom
+
+
+def frame(rows: int) -> pd.DataFrame:
+    """Quadro no formato de saída do pipeline (Serviço, Usuário, Senha, Data, Horário)."""
+    rng = np.random.default_rng(0)
+    services = np.array(["Slack", "Onedrive", "Miro", "Ea", "Figma", "Heroku", "Notion", "Jira"], dtype=object)
+    users = np.array([f"Usuário {i:x}" for i in range(rows // 4 + 1)], dtype=object)
+    gen = PasswordGenerator(rng=DeterministicRandom(0))
+    return pd.DataFrame({
+        "Serviço": services[rng.integers(0, len(services), rows)],
+        "Usuário": users[rng.integers(0, len(users), rows)],
+        "Senha": gen.generate_many(rows, 10),
+        "Data": "17-10-2026",
+        "Horário": "12:00:00",
+    })
+
+
+def timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    chunk = int(sys.argv[2]) if len(sys.argv) > 2 else 100_000
+    df = frame(rows)
+    blocks = [df.iloc[i:i + chunk] for i in range(0, rows, chunk)]
+    instante = 1_792_238_400
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = {name: Path(tmp) / f"cadastros.{name}" for name in ("csv", "parquet", "arrow")}
+
+        def write_csv() -> None:
+            with open(paths["csv"], "w", newline="", encoding="utf-8") as out:
+                for i, block in enumerate(blocks):
+                    block.to_csv(out, header=i == 0)
+
+        def write_columnar(formato: str) -> None:
+            with ColumnarWriter(paths[formato], formato) as writer:
+                for block in blocks:
+                    writer.write(block.drop(columns=["Data", "Horário"]), instante)
+
+        results = {
+            "csv": (timed(write_csv), timed(lambda: pd.read_csv(paths["csv"], index_col=0))),
+            "parquet": (timed(lambda: write_columnar("parquet")), timed(lambda: ler_df(paths["parquet"]))),
+            "arrow": (timed(lambda: write_columnar("arrow")), timed(lambda: ler_df(paths["arrow"]))),
+        }
+        arrow_mmap = timed(lambda: ler(paths["arrow"]))  # só a tabela Arrow: zero-copy sobre o mmap
+
+        print(f"{rows:,} linhas em blocos de {chunk:,}")
+        print(f"{'formato':<10} {'escrita s':>10} {'leitura s':>10} {'MB':>8}")
+        for name, (write_s, read_s) in results.items():
+            print(f"{name:<10} {write_s:>10.3f} {read_s:>10.3f} {os.path.getsize(paths[name]) / 1e6:>8.1f}")
+        print(f"{'arrow mmap':<10} {'':>10} {arrow_mmap:>10.4f}   (pa.Table sem conversão para pandas)")
@@ -0,0 +1,55 @@
+# Benchmark: memória do Dataframe de normalizar_df (str por linha, Data/Horário em texto) x compact.CredentialTable
+# (senhas "S" de largura fixa, códigos int32 + dicionários, instantes int64), e o custo das conversões.
+#
+# Uso: python -m benchmarks.compact [linhas]   (requer pandas e numpy)
+
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from compact import CredentialTable
+from passwords.generator import PasswordGenerator
+from passwords.rng import DeterministicRandom
+
+
+def frame(rows: int, dtype: str | None) -> pd.DataFrame:
+    """Quadro no formato de normalizar_df; dtype=object reproduz a coluna de str Python por linha."""
+    rng = np.random.default_rng(0)
+    services = np.array(["Slack", "Onedrive", "Miro", "Ea", "Figma", "Heroku", "Notion", "Jira"], dtype=object)
+    users = np.array([f"Usuário {i:x}" for i in range(rows // 4 + 1)], dtype=object)
+    horas = np.array([f"{h:02d}:{m:02d}:00" for h in range(24) for m in range(60)], dtype=object)
+    gen = PasswordGenerator(rng=DeterministicRandom(0))
+    return pd.DataFrame({
+        "Serviço": services[rng.integers(0, len(services), rows)],
+        "Usuário": users[rng.integers(0, len(users), rows)],
+        "Senha": gen.generate_many(rows, 10),
+        "Data": "17-10-2026",
+        "Horário": horas[rng.integers(0, len(horas), rows)],
+    }, dtype=dtype)
+
+
+def timed(fn):
+    start = time.perf_counter()
+    out = fn()
+    return out, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    df_object = frame(rows, object)
+    df_default = df_object.astype({c: pd.StringDtype() if pd.__version__ < "3" else "str" for c in df_object.columns})
+    table, from_s = timed(lambda: CredentialTable.from_df(df_object))
+    _, to_s = timed(lambda: table.to_df())
+    _, slice_s = timed(lambda: table[rows // 4:rows // 2])
+
+    print(f"{rows:,} linhas")
+    print(f"{'representação':<34} {'MB':>8} {'bytes/linha':>12}")
+    for name, nbytes in (
+        ("Dataframe (object, atual)", df_object.memory_usage(deep=True).sum()),
+        ("Dataframe (dtype str padrão)", df_default.memory_usage(deep=True).sum()),
+        ("CredentialTable", table.nbytes),
+    ):
+        print(f"{name:<34} {nbytes / 1e6:>8.1f} {nbytes / rows:>12.1f}")
+    print(f"from_df {from_s:.3f}s | to_df {to_s:.3f}s | fatia de {rows // 4:,} linhas {slice_s * 1e6:.1f}µs (view)")
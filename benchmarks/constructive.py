@@ -0,0 +1,28 @@
+# Benchmark: laço de rejeição x modo construtivo (constructive=True)
+#
+# Uso: python -m benchmarks.constructive
+
+import time
+from passwords.generator import PasswordGenerator
+from passwords.policies import BasicPolicy, MinLengthPolicy, NoSequentialPolicy
+
+
+def _per_second(gen: PasswordGenerator, length: int, n: int) -> float:
+    start = time.perf_counter()
+    for _ in range(n):
+        gen.generate(length, unique_chars=False)
+    return n / (time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    n = 2_000
+    print(f"{'specials':>9} {'len':>4} {'retries evitados':>17} {'rejeição/s':>11} {'construtivo/s':>14}")
+    for specials in ("!@#$%&*/?", "!"):
+        policies = [BasicPolicy(specials=specials), MinLengthPolicy(4), NoSequentialPolicy()]
+        reject = PasswordGenerator(length_min=4, _specials=specials, policies=policies)
+        build = PasswordGenerator(length_min=4, _specials=specials, policies=policies, constructive=True)
+        for length in (4, 6, 10, 16):
+            print(
+                f"{specials:>9} {length:>4} {build.retries_avoided(length):>17.2f} "
+                f"{_per_second(reject, length, n):>11,.0f} {_per_second(build, length, n):>14,.0f}"
+            )
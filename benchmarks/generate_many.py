@@ -0,0 +1,31 @@
+# Benchmark: generate() em laço x generate_many() com entropia em bloco
+#
+# Uso: python -m benchmarks.generate_many
+
+import time
+from passwords.generator import PasswordGenerator
+from passwords.policies import BasicPolicy, MinLengthPolicy, NoSequentialPolicy
+
+
+def _rate(fn, n: int) -> float:
+    start = time.perf_counter()
+    fn(n)
+    return n / (time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    policies = [BasicPolicy(), MinLengthPolicy(), NoSequentialPolicy()]
+    gen = PasswordGenerator(policies=policies)
+    try:
+        vec = PasswordGenerator(policies=policies, backend="numpy")
+        vec.generate_many(1, 10)
+    except ImportError:
+        vec = None  # numpy ausente: coluna omitida
+    length = 10
+
+    print(f"{'N':>8} {'generate()/s':>14} {'generate_many()/s':>18} {'numpy/s':>10}")
+    for n in (1_000, 10_000, 100_000):
+        loop = _rate(lambda k: [gen.generate(length) for _ in range(k)], n)
+        bulk = _rate(lambda k: gen.generate_many(k, length), n)
+        numpy = f"{_rate(lambda k: vec.generate_many(k, length), n):>10,.0f}" if vec else f"{'-':>10}"
+        print(f"{n:>8} {loop:>14,.0f} {bulk:>18,.0f} {numpy}")
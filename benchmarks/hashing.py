@@ -0,0 +1,30 @@
+# Benchmark: hashes/s por número de threads (passwords.hashing.hash_many), para dimensionar o custo
+# (iterations / n) frente ao SLA de provisionamento.
+#
+# Uso: python -m benchmarks.hashing [N]
+
+import os
+import sys
+import time
+from passwords.generator import PasswordGenerator
+from passwords.hashing import HashParams, hash_many
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 64
+    senhas = PasswordGenerator().generate_many(n, 12)
+    cores = os.cpu_count() or 1
+    configs = [
+        HashParams(iterations=100_000),
+        HashParams(iterations=600_000),
+        HashParams("scrypt", n=2 ** 14),
+        HashParams("scrypt", n=2 ** 15),
+    ]
+
+    print(f"{'parâmetros':<36} {'threads':>7} {'hashes/s':>10} {'ms/hash':>8}")
+    for params in configs:
+        for workers in sorted({1, 2, 4, cores}):
+            start = time.perf_counter()
+            hash_many(senhas, params, workers)
+            rate = n / (time.perf_counter() - start)
+            print(f"{params.encode():<36} {workers:>7} {rate:>10,.1f} {1000 / rate * workers:>8.1f}")
@@ -0,0 +1,28 @@
+# Benchmark: provisionamento multi-core (passwords.parallel.provision) por número de workers
+#
+# Uso: python -m benchmarks.parallel [N]
+
+import os
+import sys
+import time
+from passwords.generator import PasswordGenerator
+from passwords.parallel import provision
+from passwords.policies import BasicPolicy, MinLengthPolicy, NoSequentialPolicy
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    gen = PasswordGenerator(policies=[BasicPolicy(), MinLengthPolicy(), NoSequentialPolicy()])
+    cores = os.cpu_count() or 1
+
+    start = time.perf_counter()
+    gen.generate_many(n, 10)
+    base = n / (time.perf_counter() - start)
+    print(f"{'workers':>8} {'senhas/s':>12} {'escala':>7}")
+    print(f"{'serial':>8} {base:>12,.0f} {1:>6.1f}x")
+
+    for workers in sorted({1, 2, 4, cores}):
+        start = time.perf_counter()
+        provision(gen, n, 10, workers=workers, chunk_size=max(1, n // (4 * workers)))
+        rate = n / (time.perf_counter() - start)
+        print(f"{workers:>8} {rate:>12,.0f} {rate / base:>6.1f}x")
@@ -0,0 +1,251 @@
+# Suíte de benchmarks reprodutível: gerador, políticas e pipeline de Dataframes.
+#
+# Uso:
+#   python -m benchmarks.suite                          -> roda e grava benchmarks/results.json
+#   python -m benchmarks.suite --save-baseline          -> roda e grava também benchmarks/baseline.json
+#   python -m benchmarks.suite --max-rows 10000000      -> inclui os Dataframes grandes (até 10M linhas)
+#   python -m benchmarks.suite --filter policy          -> só os casos cujo nome contém "policy"
+#
+# Com um baseline presente, cada caso é comparado a ele; queda de vazão acima de --threshold (padrão 20%)
+# é regressão e o processo termina com código 1.
+
+import argparse
+import json
+import platform
+import string
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from functools import lru_cache, partial
+from pathlib import Path
+from typing import Callable
+
+from passwords.blocklist import build_bloom
+from passwords.generator import PasswordGenerator
+from passwords.policies import (
+    BasicPolicy, BlocklistPolicy, MinLengthPolicy, NoSequentialPolicy, compile_policies,
+)
+from passwords.rng import DeterministicRandom
+
+HERE = Path(__file__).resolve().parent
+SPECIALS = {3: "!@#", 9: "!@#$%&*/?", 30: string.punctuation.replace("\\", "").replace('"', "")[:30]}
+LENGTHS = (10, 16, 32, 64)
+ROWS = (1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+
+# ------------------ Registro e medição ------------------
+
+# nome, fábrica da função medida, operações por chamada, unidade. A fábrica monta as entradas do caso (geradores,
+# amostras, Dataframes) e só é chamada para os casos que passam por --filter.
+Case = tuple[str, Callable[[], Callable[[], object]], int, str]
+
+def _measure(fn: Callable[[], object], ops: int, min_time: float, repeat: int) -> float:
+    """Melhor tempo por operação: calibra o número de chamadas até min_time e repete `repeat` vezes."""
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time or elapsed * 10 > 5 * min_time:
+            break
+        loops *= 10
+    best = elapsed / loops
+    if elapsed < 1.0: # casos baratos: mais repetições para reduzir ruído; caros: uma medição basta
+        for _ in range(repeat - 1):
+            start = time.perf_counter()
+            for _ in range(loops):
+                fn()
+            best = min(best, (time.perf_counter() - start) / loops)
+    return best / ops
+
+# ------------------ Casos ------------------
+
+STACKS = {
+    "basic": lambda sp: [BasicPolicy(specials=sp)],
+    "full": lambda sp: [BasicPolicy(specials=sp), MinLengthPolicy(), NoSequentialPolicy()],
+}
+
+@lru_cache(maxsize=None)
+def _generator(specials: str, stack: str) -> PasswordGenerator:
+    """Um gerador por configuração, compartilhado pelos casos que a usam."""
+    return PasswordGenerator(_specials=specials, policies=STACKS[stack](specials))
+
+
+def _generator_cases() -> list[Case]:
+    def generate(specials: str, stack: str, length: int, unique: bool = True):
+        gen = _generator(specials, stack)
+        return lambda: gen.generate(length, unique_chars=unique)
+
+    def generate_many(length: int):
+        gen = _generator(SPECIALS[9], "full")
+        return lambda: gen.generate_many(1000, length)
+
+    cases: list[Case] = []
+    for size, specials in SPECIALS.items():
+        for stack in STACKS:
+            for length in LENGTHS:
+                cases.append((f"generate/len={length}/specials={size}/policies={stack}",
+                              partial(generate, specials, stack, length), 1, "senha"))
+    for length in LENGTHS:
+        cases.append((f"generate/len={length}/specials=9/policies=full/unique=False",
+                      partial(generate, SPECIALS[9], "full", length, False), 1, "senha"))
+        cases.append((f"generate_many/len={length}/specials=9/policies=full",
+                      partial(generate_many, length), 1000, "senha"))
+    return cases
+
+
+def _dedupe_cases() -> list[Case]:
+    def deduplicate(length: int):
+        gen = PasswordGenerator(rng=DeterministicRandom(length))
+        tokens = [gen._random_token(length) for _ in range(200)]
+        return lambda: [gen._deduplicate(x) for x in tokens]
+
+    return [(f"deduplicate/len={length}", partial(deduplicate, length), 200, "senha") for length in LENGTHS]
+
+
+def _policy_cases(tmp: Path) -> list[Case]:
+    @lru_cache(maxsize=None)
+    def samples() -> list[str]:
+        gen = PasswordGenerator(rng=DeterministicRandom(1))
+        return [gen._random_token(16) for _ in range(1000)]
+
+    def blocklist() -> BlocklistPolicy:
+        gen = PasswordGenerator(rng=DeterministicRandom(2))
+        bloom = tmp / "blocklist.bloom"
+        build_bloom((gen._random_token(10) for _ in range(10_000)), bloom, 10_000)
+        return BlocklistPolicy(str(bloom))
+
+    policies = {
+        "BasicPolicy": BasicPolicy,
+        "MinLengthPolicy": MinLengthPolicy,
+        "NoSequentialPolicy": NoSequentialPolicy,
+        "BlocklistPolicy": blocklist,
+        "compiled[Basic+MinLength+NoSequential]": lambda: compile_policies(
+            [BasicPolicy(), MinLengthPolicy(), NoSequentialPolicy()]
+        ),
+    }
+
+    def validate(make: Callable[[], object]):
+        policy, pws = make(), samples()
+        return lambda: [policy.validate(pw) for pw in pws]
+
+    return [(f"policy/{name}", partial(validate, make), 1000, "senha") for name, make in policies.items()]
+
+
+@lru_cache(maxsize=1) # os casos de um mesmo tamanho são consecutivos: só o Dataframe da vez fica em memória
+def _frame(rows: int):
+    """Dataframe sintético no formato de users*.csv, com ~1% de células nulas ou em branco."""
+    import numpy as np
+    import pandas as pd
+
+    rng = np.random.default_rng(0)
+    services = np.array(["slack", "onedrive", "miro", "ea", "figma", "heroku", "notion", "jira"], dtype=object)
+    users = np.array([f"usuário {i:x}" for i in range(4096)], dtype=object)
+    df = pd.DataFrame({
+        "Serviço": services[rng.integers(0, len(services), rows)],
+        "Usuário": users[rng.integers(0, len(users), rows)],
+    })
+    noisy = rng.random(rows) < 0.01
+    df.loc[noisy & (rng.random(rows) < 0.5), "Serviço"] = " "
+    df.loc[noisy & (rng.random(rows) >= 0.5), "Usuário"] = None
+    return df
+
+
+def _pipeline_cases(max_rows: int) -> list[Case]:
+    def ruidos(rows: int):
+        import database
+        df = _frame(rows)
+        return lambda: database.ruidos(df)
+
+    def normalizar_df(rows: int):
+        import database
+        df = _frame(rows)
+        return lambda: database.normalizar_df(df.copy())
+
+    def juntar_dfs(rows: int):
+        import database
+        # quadro já "normalizado" (Senha preenchida): mede só a junção, sem geração de senhas
+        pronto = _frame(rows).assign(Senha="x" * 10, Data="01-01-2025", Horário="00:00:00")
+        return lambda: database.juntar_dfs(pronto, pronto)
+
+    cases: list[Case] = []
+    for rows in (r for r in ROWS if r <= max_rows):
+        cases += [
+            (f"pipeline/ruidos/rows={rows}", partial(ruidos, rows), rows, "linha"),
+            (f"pipeline/normalizar_df/rows={rows}", partial(normalizar_df, rows), rows, "linha"),
+            (f"pipeline/juntar_dfs/rows={rows}", partial(juntar_dfs, rows), 2 * rows, "linha"),
+        ]
+    return cases
+
+# ------------------ Execução e comparação ------------------
+
+def run(filter_: str, max_rows: int, min_time: float, repeat: int) -> dict:
+    """Filtra pelos nomes antes de montar qualquer caso: só as entradas dos casos selecionados são construídas."""
+    with tempfile.TemporaryDirectory() as tmp:
+        cases = _generator_cases() + _dedupe_cases() + _policy_cases(Path(tmp)) + _pipeline_cases(max_rows)
+        results = {}
+        for name, make, ops, unit in cases:
+            if filter_ and filter_ not in name:
+                continue
+            try:
+                fn = make()
+            except ImportError as exc: # pandas ausente (casos de pipeline)
+                print(f"{name} ignorado: {exc}", file=sys.stderr)
+                continue
+            per_op = _measure(fn, ops, min_time, repeat)
+            results[name] = {"ops_per_sec": 1 / per_op, "sec_per_op": per_op, "unit": unit}
+            print(f"{name:<60} {1 / per_op:>14,.0f} {unit}s/s", flush=True)
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        },
+        "results": results,
+    }
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> list[str]:
+    """Casos presentes nos dois relatórios cuja vazão caiu mais que threshold (fração)."""
+    regressions = []
+    print(f"\n{'caso':<60} {'baseline':>12} {'atual':>12} {'razão':>7}")
+    for name, cur in current["results"].items():
+        base = baseline["results"].get(name)
+        if base is None:
+            continue
+        ratio = cur["ops_per_sec"] / base["ops_per_sec"]
+        flag = "  <-- regressão" if ratio < 1 - threshold else ""
+        print(f"{name:<60} {base['ops_per_sec']:>12,.0f} {cur['ops_per_sec']:>12,.0f} {ratio:>6.2f}x{flag}")
+        if flag:
+            regressions.append(name)
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Suíte de benchmarks do gerador, políticas e pipeline.")
+    parser.add_argument("--output", type=Path, default=HERE / "results.json")
+    parser.add_argument("--baseline", type=Path, default=HERE / "baseline.json")
+    parser.add_argument("--save-baseline", action="store_true", help="grava os resultados como novo baseline")
+    parser.add_argument("--threshold", type=float, default=0.20, help="queda tolerada de vazão (fração)")
+    parser.add_argument("--max-rows", type=int, default=100_000, help="maior Dataframe sintético (até 10M)")
+    parser.add_argument("--min-time", type=float, default=0.2, help="segundos mínimos por medição")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--filter", default="", help="só casos cujo nome contém este texto")
+    args = parser.parse_args()
+
+    report = run(args.filter, args.max_rows, args.min_time, args.repeat)
+    args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    print(f"\nresultados -> {args.output}")
+
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"baseline -> {args.baseline}")
+    elif args.baseline.exists():
+        regressions = compare(report, json.loads(args.baseline.read_text(encoding="utf-8")), args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regressão(ões) acima de {args.threshold:.0%}", file=sys.stderr)
+            sys.exit(1)
+    else:
+        print(f"sem baseline em {args.baseline}; use --save-baseline para criar")
@@ -0,0 +1,39 @@
+# Benchmark: unique_chars=True pelo caminho anterior (token -> políticas -> _deduplicate -> revalidação ->
+# embaralhamento) x sorteio nativo sem reposição (generate), de 10 até len(alphabet_all).
+#
+# Uso: python -m benchmarks.unique_chars
+
+import time
+from passwords.generator import PasswordGenerator
+from passwords.policies import BasicPolicy, MinLengthPolicy
+
+
+def _legacy(gen: PasswordGenerator, length: int, max_tries: int = 10000) -> str:
+    for _ in range(max_tries):
+        pw = gen._random_token(length)
+        if not gen._passes_policies(pw):
+            continue
+        pw = gen._deduplicate(pw)
+        if not gen._passes_policies(pw):
+            continue
+        return gen._shuffle(pw)
+    raise ValueError("Failed to generate a valid password after maximum attempts.")
+
+
+def _per_second(fn, n: int) -> float:
+    start = time.perf_counter()
+    for _ in range(n):
+        fn()
+    return n / (time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    gen = PasswordGenerator(policies=[BasicPolicy(), MinLengthPolicy()])
+    top = len(gen.alphabet_all)
+    n = 2_000
+
+    print(f"{'len':>4} {'anterior/s':>11} {'nativo/s':>10} {'ganho':>7}")
+    for length in sorted({10, 20, 30, 40, 50, 60, top}):
+        legacy = _per_second(lambda: _legacy(gen, length), n)
+        native = _per_second(lambda: gen.generate(length, unique_chars=True), n)
+        print(f"{length:>4} {legacy:>11,.0f} {native:>10,.0f} {native / legacy:>6.1f}x")
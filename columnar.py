@@ -0,0 +1,150 @@
+import pandas as pd
+from pathlib import Path
+from typing import Iterator
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError as exc:  # dependência opcional, só para a saída colunar
+    raise ImportError("columnar output requires pyarrow (pip install pyarrow).") from exc
+
+# ------------------ Saída colunar (Parquet / Arrow IPC) ------------------
+
+"""
+Alternativa a to_csv("Cadastros") com esquema tipado, sem coluna de índice e sem datas em texto:
+- servico: dictionary<int32, string> (categórica; o dicionário cresce entre blocos e é gravado como delta);
+- usuario / senha: string; parametros: categórica;
+- hash / salt: fixed_size_binary (bytes crus, não hex);
+- atualizado_em: timestamp[s, UTC].
+ColumnarWriter recebe os blocos do pipeline em fluxo (um row group / record batch por bloco).
+Leitura: Arrow IPC via pa.memory_map é zero-copy (as colunas apontam para as páginas do arquivo); Parquet é menor,
+mas decodifica as páginas na leitura. Comparação com CSV: python -m benchmarks.columnar
+"""
+
+FORMATS = ("parquet", "arrow")
+_ARROW_MAGIC = b"ARROW1" # início de um arquivo Arrow IPC; Parquet começa por PAR1
+
+
+def schema(senha: bool = True, hash_len: int | None = None, salt_len: int = 16) -> pa.Schema:
+    """Esquema da tabela de credenciais: senha em texto e/ou hash + salt (ver database.hashear_df)."""
+    fields = [
+        pa.field("servico", pa.dictionary(pa.int32(), pa.string()), nullable=False),
+        pa.field("usuario", pa.string(), nullable=False),
+    ]
+    if senha:
+        fields.append(pa.field("senha", pa.string(), nullable=False))
+    if hash_len is not None:
+        fields += [
+            pa.field("hash", pa.binary(hash_len), nullable=False),
+            pa.field("salt", pa.binary(salt_len), nullable=False),
+            pa.field("parametros", pa.dictionary(pa.int32(), pa.string()), nullable=False),
+        ]
+    fields.append(pa.field("atualizado_em", pa.timestamp("s", tz="UTC"), nullable=False))
+    return pa.schema(fields)
+
+
+class ColumnarWriter:
+    """
+    Escrita em blocos de Dataframes do pipeline (Serviço, Usuário, Senha e/ou Hash, Salt, Parametros).
+    As colunas categóricas mantêm um dicionário acumulado: os códigos de blocos anteriores continuam válidos,
+    o que o formato de arquivo IPC exige (só deltas, nunca substituição do dicionário).
+    """
+    def __init__(self, path: str | Path, formato: str = "parquet", schema: pa.Schema | None = None) -> None:
+        if formato not in FORMATS:
+            raise ValueError("formato deve ser 'parquet' ou 'arrow'.")
+        self.path = Path(path)
+        self.formato = formato
+        self.schema = schema
+        self.linhas = 0
+        self._writer = None
+        self._sink = None
+        self._categorias: dict[str, dict[str, int]] = {}
+
+    # ---------- Conversão ----------
+    def _categorica(self, nome: str, valores: pd.Series) -> pa.DictionaryArray:
+        vistos = self._categorias.setdefault(nome, {})
+        for valor in pd.unique(valores):
+            vistos.setdefault(valor, len(vistos))
+        codigos = pa.array(valores.map(vistos).to_numpy(dtype="int32"))
+        return pa.DictionaryArray.from_arrays(codigos, pa.array(list(vistos), pa.string()))
+
+    def tabela(self, df: pd.DataFrame, instante: int) -> pa.Table:
+        """Bloco do pipeline -> tabela no esquema; instante (segundos Unix) vale para todas as linhas do bloco."""
+        hashed = "Hash" in df.columns
+        if self.schema is None:
+            hash_len = len(df["Hash"].iat[0]) // 2 if hashed and len(df) else (32 if hashed else None)
+            salt_len = len(df["Salt"].iat[0]) // 2 if hashed and len(df) else 16
+            self.schema = schema("Senha" in df.columns, hash_len, salt_len)
+        colunas = {
+            "servico": self._categorica("servico", df["Serviço"]),
+            "usuario": pa.array(df["Usuário"], pa.string()),
+        }
+        if "senha" in self.schema.names:
+            colunas["senha"] = pa.array(df["Senha"], pa.string())
+        if "hash" in self.schema.names:
+            colunas["hash"] = pa.array(map(bytes.fromhex, df["Hash"]), self.schema.field("hash").type, size=len(df))
+            colunas["salt"] = pa.array(map(bytes.fromhex, df["Salt"]), self.schema.field("salt").type, size=len(df))
+            colunas["parametros"] = self._categorica("parametros", df["Parametros"])
+        colunas["atualizado_em"] = pa.array([instante] * len(df), pa.timestamp("s", tz="UTC"))
+        return pa.Table.from_pydict(colunas, schema=self.schema)
+
+    # ---------- Escrita ----------
+    def write(self, df: pd.DataFrame, instante: int) -> None:
+        table = self.tabela(df, instante)
+        if self._writer is None:
+            if self.formato == "parquet":
+                self._writer = pq.ParquetWriter(self.path, self.schema)
+            else:
+                self._sink = pa.OSFile(str(self.path), "wb")
+                options = pa.ipc.IpcWriteOptions(emit_dictionary_deltas=True)
+                self._writer = pa.ipc.new_file(self._sink, self.schema, options=options)
+        self._writer.write_table(table)
+        self.linhas += len(df)
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+        if self._sink is not None:
+            self._sink.close()
+
+    def __enter__(self) -> "ColumnarWriter":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+# ------------------ Leitura ------------------
+
+def _formato(path: str, formato: str | None) -> str:
+    """formato explícito, ou pelos bytes iniciais: ARROW1 é Arrow IPC (qualquer sufixo, inclusive nenhum); senão Parquet."""
+    if formato is None:
+        with open(path, "rb") as fh:
+            formato = "arrow" if fh.read(len(_ARROW_MAGIC)) == _ARROW_MAGIC else "parquet"
+    if formato not in FORMATS:
+        raise ValueError(f"formato must be one of {', '.join(FORMATS)}.")
+    return formato
+
+
+def ler(path: str | Path, formato: str | None = None) -> pa.Table:
+    """Arrow IPC: mapeado em memória, sem cópia. Parquet: memory_map evita a leitura via buffer, mas decodifica."""
+    path = str(path)
+    if _formato(path, formato) == "arrow":
+        return pa.ipc.open_file(pa.memory_map(path, "r")).read_all()
+    return pq.read_table(path, memory_map=True)
+
+
+def ler_em_blocos(path: str | Path, chunksize: int = 100_000, formato: str | None = None) -> Iterator[pd.DataFrame]:
+    """Leitura em fluxo: um Dataframe por lote (Parquet: iter_batches; Arrow IPC: record batches do mmap)."""
+    path = str(path)
+    if _formato(path, formato) == "arrow":
+        reader = pa.ipc.open_file(pa.memory_map(path, "r"))
+        batches = (reader.get_batch(i) for i in range(reader.num_record_batches))
+    else:
+        batches = pq.ParquetFile(path, memory_map=True).iter_batches(batch_size=chunksize)
+    for batch in batches:
+        yield batch.to_pandas()
+
+
+def ler_df(path: str | Path, formato: str | None = None) -> pd.DataFrame:
+    """Como ler(), já em pandas: servico/parametros viram category e atualizado_em datetime64 com fuso."""
+    return ler(path, formato).to_pandas()
@@ -0,0 +1,159 @@
+import numpy as np
+import pandas as pd
+from dataclasses import dataclass
+from typing import Iterable, Sequence
+
+# ------------------ Tabela compacta em memória ------------------
+
+"""
+Alternativa em memória ao Dataframe de normalizar_df (uma str Python por senha e Data/Horário em texto):
+- senhas: array NumPy "S" de largura fixa (bytes UTF-8 contíguos, sem objeto por linha);
+- servico / usuario: códigos int32 sobre dicionários de valores distintos (também "S", UTF-8);
+- instantes: int64 (segundos Unix, como atualizado_em no CredentialStore).
+Fatiar com slice devolve views (sem cópia) que compartilham os dicionários. from_df/to_df convertem nos dois
+sentidos; to_df devolve Serviço/Usuário como Categorical (os códigos são reaproveitados, sem str por linha).
+Comparação de memória com o Dataframe atual: python -m benchmarks.compact
+"""
+
+_DATA, _HORA = "%d-%m-%Y", "%H:%M:%S" # formato das colunas Data e Horário do pipeline
+
+
+def _bytes(values: Sequence[str]) -> np.ndarray:
+    """str -> "S" UTF-8 de largura = maior valor codificado (o atalho ASCII evita a codificação por elemento)."""
+    try:
+        return np.array(values, dtype="S")
+    except UnicodeEncodeError:
+        return np.char.encode(np.array(values, dtype=str), "utf-8")
+
+
+def _text(values: np.ndarray) -> np.ndarray:
+    try:
+        return values.astype("U") # ASCII: conversão direta, sem decodificar elemento a elemento
+    except UnicodeDecodeError:
+        return np.char.decode(values, "utf-8")
+
+
+def _encode(values: pd.Series) -> tuple[np.ndarray, np.ndarray]:
+    """(códigos int32, dicionário "S"), com o dicionário na ordem da primeira ocorrência."""
+    codes, uniques = pd.factorize(values, sort=False)
+    if (codes < 0).any():
+        raise ValueError("Serviço and Usuário must not contain null values.")
+    return codes.astype(np.int32), _bytes(list(uniques))
+
+
+@dataclass(frozen=True)
+class CredentialTable:
+    servicos: np.ndarray # int32, códigos em dic_servicos
+    usuarios: np.ndarray # int32, códigos em dic_usuarios
+    senhas: np.ndarray # "S<largura>", UTF-8
+    instantes: np.ndarray # int64, segundos Unix
+    dic_servicos: np.ndarray # "S", valores distintos
+    dic_usuarios: np.ndarray
+
+    # ---------- Construção ----------
+    @classmethod
+    def from_df(cls, df: pd.DataFrame) -> "CredentialTable":
+        """
+        Dataframe do pipeline (Serviço, Usuário, Senha e Data + Horário, ou atualizado_em em segundos/datetime).
+        Data/Horário são hora local sem fuso: viram segundos desse relógio, e to_df devolve exatamente o mesmo texto.
+        """
+        servicos, dic_servicos = _encode(df["Serviço"])
+        usuarios, dic_usuarios = _encode(df["Usuário"])
+        if "atualizado_em" in df.columns:
+            instantes = df["atualizado_em"]
+            if pd.api.types.is_datetime64_any_dtype(instantes):
+                if instantes.dt.tz is not None: # com fuso -> UTC, a referência de atualizado_em
+                    instantes = instantes.dt.tz_convert(None)
+                instantes = instantes.astype("datetime64[s]").astype(np.int64)
+        else: # poucos instantes distintos por bloco: só os distintos são interpretados
+            codes, textos = pd.factorize(df["Data"] + " " + df["Horário"])
+            distintos = pd.to_datetime(textos, format=f"{_DATA} {_HORA}").astype("datetime64[s]").astype(np.int64)
+            instantes = np.asarray(distintos)[codes]
+        return cls(
+            servicos=servicos,
+            usuarios=usuarios,
+            senhas=_bytes(df["Senha"].tolist()),
+            instantes=np.asarray(instantes, dtype=np.int64),
+            dic_servicos=dic_servicos,
+            dic_usuarios=dic_usuarios,
+        )
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[tuple[str, str, str, int]]) -> "CredentialTable":
+        """Linhas (servico, usuario, senha, atualizado_em), ex.: CredentialStore.iter_chunks."""
+        return cls.from_df(pd.DataFrame(list(rows), columns=["Serviço", "Usuário", "Senha", "atualizado_em"]))
+
+    @classmethod
+    def concat(cls, tables: Sequence["CredentialTable"]) -> "CredentialTable":
+        """Junta tabelas (ex.: uma por bloco do pipeline) unificando os dicionários e remapeando os códigos."""
+        if not tables:
+            raise ValueError("concat requires at least one table.")
+
+        def unify(codes: list[np.ndarray], dics: list[np.ndarray]) -> tuple[np.ndarray, np.ndarray]:
+            uniques, inverse = np.unique(np.concatenate(dics), return_inverse=True)
+            starts = np.cumsum([0] + [len(d) for d in dics[:-1]])
+            remapped = [inverse[start:start + len(d)][c] for c, d, start in zip(codes, dics, starts)]
+            return np.concatenate(remapped).astype(np.int32), uniques
+
+        servicos, dic_servicos = unify([t.servicos for t in tables], [t.dic_servicos for t in tables])
+        usuarios, dic_usuarios = unify([t.usuarios for t in tables], [t.dic_usuarios for t in tables])
+        return cls(
+            servicos=servicos,
+            usuarios=usuarios,
+            senhas=np.concatenate([t.senhas for t in tables]), # largura final = a maior entre as tabelas
+            instantes=np.concatenate([t.instantes for t in tables]),
+            dic_servicos=dic_servicos,
+            dic_usuarios=dic_usuarios,
+        )
+
+    # ---------- Acesso ----------
+    def __len__(self) -> int:
+        return len(self.senhas)
+
+    def __getitem__(self, key):
+        """
+        Inteiro -> (servico, usuario, senha, atualizado_em), como store.Credential.
+        slice -> tabela com views das colunas (sem cópia); máscara booleana ou índices -> tabela copiada.
+        """
+        if isinstance(key, (int, np.integer)):
+            return (
+                self.dic_servicos[self.servicos[key]].decode("utf-8"),
+                self.dic_usuarios[self.usuarios[key]].decode("utf-8"),
+                self.senhas[key].decode("utf-8"),
+                int(self.instantes[key]),
+            )
+        return CredentialTable(
+            servicos=self.servicos[key],
+            usuarios=self.usuarios[key],
+            senhas=self.senhas[key],
+            instantes=self.instantes[key],
+            dic_servicos=self.dic_servicos,
+            dic_usuarios=self.dic_usuarios,
+        )
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes ocupados pelas colunas e dicionários (dicionários contam inteiros mesmo numa fatia)."""
+        return sum(a.nbytes for a in (
+            self.servicos, self.usuarios, self.senhas, self.instantes, self.dic_servicos, self.dic_usuarios
+        ))
+
+    # ---------- Conversão ----------
+    def to_df(self, datas: bool = True) -> pd.DataFrame:
+        """
+        Dataframe no formato do pipeline. datas=True -> Data e Horário em texto (como normalizar_df);
+        datas=False -> atualizado_em int64. Serviço e Usuário saem como Categorical sobre os dicionários.
+        """
+        df = pd.DataFrame({
+            "Serviço": pd.Categorical.from_codes(self.servicos, categories=_text(self.dic_servicos)),
+            "Usuário": pd.Categorical.from_codes(self.usuarios, categories=_text(self.dic_usuarios)),
+            "Senha": _text(self.senhas),
+        })
+        if datas: # formata só os instantes distintos e replica por código
+            codes, distintos = pd.factorize(self.instantes)
+            distintos = pd.DatetimeIndex(distintos.astype("datetime64[s]"))
+            df["Data"] = np.asarray(distintos.strftime(_DATA), dtype=object)[codes]
+            df["Horário"] = np.asarray(distintos.strftime(_HORA), dtype=object)[codes]
+        else:
+            df["atualizado_em"] = self.instantes
+        return df
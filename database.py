@@ -1,78 +1,684 @@
+import sqlite3
+import sys
+import tempfile
+import time
+import numpy as np
 import pandas as pd
+from collections import Counter, deque
+from contextlib import closing
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
+from typing import Callable, Iterable, Iterator
 from passwords.generator import PasswordGenerator
 from passwords.policies import BasicPolicy, MinLengthPolicy, NoSequentialPolicy
+from passwords.parallel import provision
+from passwords.hashing import HashParams, hash_many
+from passwords.uniqueness import DigestSet
+from passwords.audit import AuditResult, audit_batch, policy_names
+from store import CredentialStore, now
 
 from pathlib import Path
 
-df1 = pd.read_csv("users1.csv")
-df2 = pd.read_csv("users2.csv")
-
 gen = PasswordGenerator(policies=[BasicPolicy(), MinLengthPolicy(), NoSequentialPolicy()]) # Gerador de senha.
 
+# ------------------ Limpeza ------------------
+
+@dataclass
+class RelatorioLimpeza:
+    """Resumo compacto de uma limpeza: quantas linhas saíram, por quê, e quais índices (rótulos de entrada)."""
+    linhas_entrada: int
+    linhas_nulas: int # linhas com pelo menos um None/NaN
+    linhas_vazias: int # linhas com pelo menos uma string vazia ou só de espaços
+    indices_removidos: list = field(default_factory=list)
+    colunas_renomeadas: dict[str, str] = field(default_factory=dict) # cabeçalho original -> normalizado
+
+    @property
+    def descartadas(self) -> int:
+        return len(self.indices_removidos)
+
+def normalizar_colunas(df: pd.DataFrame) -> tuple[pd.DataFrame, dict[str, str]]:
+    """Remove espaços nas pontas dos cabeçalhos (users1.csv tem " Usuário"); não copia os dados."""
+    novas = [str(c).strip() for c in df.columns]
+    renomeadas = {str(c): n for c, n in zip(df.columns, novas) if str(c) != n}
+    if renomeadas:
+        df = df.set_axis(novas, axis=1)
+    return df, renomeadas
+
+def limpar(df: pd.DataFrame) -> tuple[pd.DataFrame, RelatorioLimpeza]:
+    """
+    Etapa de limpeza reutilizável (pipeline em blocos, ruidos, auditorias):
+    - cabeçalhos normalizados;
+    - nulos e strings vazias/só de espaços detectados por operações vetorizadas, uma passada por coluna
+      (sem lambda por célula);
+    - um único recorte do Dataframe no fim.
+    """
+    df, renomeadas = normalizar_colunas(df)
+
+    mask_null = df.isna().any(axis=1).to_numpy()
+    mask_empty = np.zeros(len(df), dtype=bool)
+    for col in df.columns:
+        serie = df[col]
+        if pd.api.types.is_object_dtype(serie.dtype) or pd.api.types.is_string_dtype(serie.dtype):
+            # fullmatch só vale para str; None/NaN e não-strings viram False (nulos já estão em mask_null)
+            mask_empty |= serie.str.fullmatch(r"\s*", na=False).to_numpy(dtype=bool)
+
+    remover = mask_null | mask_empty
+    relatorio = RelatorioLimpeza(
+        linhas_entrada=len(df),
+        linhas_nulas=int(mask_null.sum()),
+        linhas_vazias=int(mask_empty.sum()),
+        indices_removidos=df.index[remover].tolist(),
+        colunas_renomeadas=renomeadas,
+    )
+    if remover.any():
+        df = df[~remover]
+    return df.reset_index(drop=True), relatorio # Reestrutura os índices após excluir linhas nulas e vazias.
+
 def ruidos(df: pd.DataFrame) -> pd.DataFrame:
     """
     Verifica se há dados faltantes no .csv.
     - Por se tratar de dados categóricos, não podemos realocar valores com médias, modas e medianas, apenas excluir.
+    - Atalho para limpar() quando o relatório não interessa.
     """
+    return limpar(df)[0]
 
-    nulls = df.isnull() # Dataframe booleano -> retorna None/NaN
-    empty = df.map(lambda x: isinstance(x, str) and x.strip() == "") # Dataframe booleano -> retorna strings vazias
+def normalizar_df(data: pd.DataFrame, workers: int = 1) -> pd.DataFrame:
+    """
+    workers > 1 -> as senhas são geradas em paralelo (passwords.parallel.provision), na mesma ordem das linhas.
+    """
+    return _normalizar_limpo(ruidos(data), workers)
 
-    mask_null = nulls.any(axis=1)
-    mask_empty = empty.any(axis=1)
+def _normalizar_limpo(df: pd.DataFrame, workers: int = 1, guard: DigestSet | None = None) -> pd.DataFrame:
+    df = _padronizar(df)
 
-    n_null = int(mask_null.sum()) # Número de linhas nulas
-    n_empty = int(mask_empty.sum()) # Número de linhas com strings vazis
+    df["Senha"] = _gerar_senhas(len(df), workers, guard)
+    agora = datetime.now() # um único instante: Data e Horário não podem discordar na virada do dia
+    df["Data"] = agora.strftime("%d-%m-%Y")
+    df["Horário"] = agora.strftime("%H:%M:%S")
 
-    idx_null = df.index[mask_null].tolist() # Monta uma lista com os índices de linhas nulas
-    idx_empty = df.index[mask_empty].tolist() # Monta uma lista com os índices de linhas de string vazias
+    return df
 
-    linhas_nulas = df.loc[mask_null] # Retorna um Dataframe apenas com os índices de linhas nulas
-    linhas_vazias = df.loc[mask_empty] # Retorna um Dataframe apenas com os índices de linhas com strings vazias
+def _padronizar(df: pd.DataFrame) -> pd.DataFrame:
+    df["Serviço"] = df["Serviço"].str.title()
+    df["Usuário"] = df["Usuário"].str.title()
+    return df
 
-    df = df.drop(index=idx_null)
-    df = df.drop(index=idx_empty)
+def _gerar_senhas(n: int, workers: int = 1, guard: DigestSet | None = None) -> list[str]:
+    """guard -> nenhuma senha repete outra já emitida (nesta execução ou nas anteriores, se persistido)."""
+    if workers > 1:
+        return provision(gen, n, 10, workers=workers, guard=guard)
+    return gen.generate_many(n, 10, guard=guard) # lote com entropia em bloco
 
-    df_new = df.reset_index(drop=True) # Reestrutura os índices após excluir linhas nulas e vazias.
+def juntar_dfs(data1: pd.DataFrame, data2: pd.DataFrame, regra: str | None = None) -> pd.DataFrame:
+    """
+    1) Pode-se utilizar a função pd.concat() -> empilha diferentes Dataframes do Pandas
+    - pode ser empilhado tanto um em cima do outro quanto de lado
+    - Desvantagem: não casa chaves, apenas se baseia em índices e ordem de colunas
+    - UNION ALL em SQL (padrão, regra=None)
 
-    return df_new
+    2) Pode-se utilizar a função pd.merge() -> Combina os Daframes baseados em valores de chaves
+    - INNER JOIN / LEFT JOIN em SQL
+    - No caso dos Dataframes aqui (df1 e df2) não possuem chaves em comum para serem linkados.
 
-def normalizar_df(data: pd.DataFrame) -> pd.DataFrame:
-    df = ruidos(data)
+    3) Junção por chave (regra="primeira", "ultima" ou "existente", ver deduplicar): cada Dataframe passa por
+    limpar e _padronizar (como cada fonte em processar_csvs) e as linhas são casadas por (Serviço, Usuário);
+    cada chave repetida fica com uma única linha.
+    - UNION em SQL, com critério de desempate
+    - Nenhuma senha é gerada aqui: as existentes são mantidas e as que faltam ficam para a etapa de geração.
+    """
+    if regra is None:
+        return pd.concat([data1, data2], ignore_index=True)
 
-    df["Serviço"] = df["Serviço"].str.title()
-    df["Usuário"] = df["Usuário"].str.title()
+    # df_merge = pd.merge(data1, data2)
 
-    df["Senha"] = [gen.generate(10) for _ in range(len(df))]
-    df["Data"] = datetime.now().strftime("%d-%m-%Y")
-    df["Horário"] = datetime.now().strftime("%H:%M:%S")
+    df = pd.concat([_padronizar(limpar(data)[0]) for data in (data1, data2)], ignore_index=True)
+    df = deduplicar(df.assign(_ordem=np.arange(len(df))), regra)
+    return df.drop(columns="_ordem").reset_index(drop=True)
 
+def hashear_df(df: pd.DataFrame, params: HashParams = HashParams(), workers: int | None = None, manter_senha: bool = False) -> pd.DataFrame:
+    """
+    Substitui a coluna Senha (texto puro) por Hash, Salt (hex) e Parametros, calculados em paralelo (hash_many).
+    manter_senha=True preserva o texto puro, ex.: para entregar a senha uma única vez ao usuário.
+    """
+    registros = hash_many(df["Senha"], params, workers)
+    df["Hash"] = [r.hash.hex() for r in registros]
+    df["Salt"] = [r.salt.hex() for r in registros]
+    df["Parametros"] = params.encode()
+    if not manter_senha:
+        df = df.drop(columns="Senha")
     return df
 
-def juntar_dfs(data1: pd.DataFrame, data2: pd.DataFrame) -> pd.DataFrame:
+# ------------------ Pipeline em blocos ------------------
+
+"""
+Versão em fluxo de juntar_dfs + to_csv: em vez de carregar todos os .csv, concatenar e escrever de uma vez,
+cada arquivo é lido em blocos (chunksize), limpo (ruidos), normalizado com senhas (normalizar_df) e anexado à saída.
+A memória fica limitada a um bloco, independente do tamanho ou da quantidade de arquivos de entrada.
+O índice da saída continua sequencial entre blocos e arquivos, como no pd.concat(ignore_index=True) anterior.
+"""
+
+# Colunas gravadas, nesta ordem, em todos os blocos: o cabeçalho do .csv vem do primeiro bloco, então blocos com
+# colunas em outra ordem ou a mais (entradas diferentes) sairiam desalinhados sem o reindex.
+COLUNAS_SAIDA = ["Serviço", "Usuário", "Senha", "Data", "Horário"]
+COLUNAS_SAIDA_HASH = ["Serviço", "Usuário", "Data", "Horário", "Hash", "Salt", "Parametros"]
+
+@dataclass
+class PipelineStats:
+    arquivos: int = 0
+    blocos: int = 0
+    linhas_lidas: int = 0
+    linhas_gravadas: int = 0
+    linhas_descartadas: int = 0 # removidas na limpeza (nulas/vazias)
+    inicio: float = field(default_factory=time.perf_counter)
+
+    @property
+    def segundos(self) -> float:
+        return time.perf_counter() - self.inicio
+
+    @property
+    def linhas_por_segundo(self) -> float:
+        return self.linhas_lidas / self.segundos if self.segundos else 0.0
+
+def imprimir_progresso(stats: PipelineStats) -> None:
+    print(
+        f"[{stats.arquivos} arq | {stats.blocos} blocos] lidas={stats.linhas_lidas:,} "
+        f"gravadas={stats.linhas_gravadas:,} descartadas={stats.linhas_descartadas:,} ({stats.linhas_por_segundo:,.0f} linhas/s)",
+        file=sys.stderr,
+    )
+
+def ler_em_blocos(caminho: str | Path, chunksize: int, **opcoes) -> Iterator[pd.DataFrame]:
+    yield from pd.read_csv(caminho, chunksize=chunksize, **opcoes)
+
+def processar_csvs(
+    entradas: Iterable[str | Path],
+    saida: str | Path = "Cadastros",
+    chunksize: int = 100_000,
+    workers: int = 1,
+    progresso: Callable[[PipelineStats], None] | None = imprimir_progresso,
+    hash_params: HashParams | None = None,
+    unicidade: str | Path | None = None,
+    formato: str = "csv",
+    regra: str | None = None,
+    particoes: int = 1,
+) -> PipelineStats:
     """
-    1) Pode-se utilizar a função pd.concat() -> empilha diferentes Dataframes do Pandas
-    - pode ser empilhado tanto um em cima do outro quanto de lado
-    - Desvantagem: não casa chaves, apenas se baseia em índices e ordem de colunas
-    - UNION ALL em SQL
+    Lê qualquer número de .csv em blocos, gera as senhas por bloco e anexa ao arquivo de saída.
+    - workers > 1 -> senhas de cada bloco geradas em paralelo (ver normalizar_df)
+    - progresso -> chamado a cada bloco gravado (None desliga)
+    - hash_params -> grava Hash/Salt/Parametros no lugar da senha em texto puro (ver hashear_df)
+    - unicidade -> arquivo de digests (passwords.uniqueness.DigestSet): nenhuma senha se repete entre linhas
+      nem entre execuções que usam o mesmo arquivo
+    - formato -> "csv" (padrão), ou "parquet"/"arrow" com esquema tipado (columnar.py, requer pyarrow)
+    - regra -> junção por chave entre todas as entradas ("primeira", "ultima", "existente"; ver Junção por chave):
+      uma linha por (Serviço, Usuário) e senha só para as sobreviventes; particoes > 1 limita a memória a uma
+      partição por vez (None = cada bloco segue direto, sem casar chaves)
     """
+    guard = DigestSet.open(unicidade) if unicidade is not None else None
+    stats = PipelineStats() if regra is None else UnificacaoStats()
+    if regra is None:
+        blocos = lambda: _blocos_normalizados(entradas, chunksize, workers, hash_params, guard, stats)
+    else:
+        blocos = lambda: _blocos_unificados(entradas, chunksize, workers, hash_params, guard, stats, regra, particoes)
+    if formato != "csv":
+        from columnar import ColumnarWriter # import tardio: pyarrow só é exigido pela saída colunar
+        with ColumnarWriter(saida, formato) as writer:
+            for df in blocos():
+                writer.write(df.drop(columns=["Data", "Horário"]), now())
+                _bloco_gravado(stats, len(df), progresso)
+    else:
+        with open(saida, "w", newline="", encoding="utf-8") as out:
+            colunas = COLUNAS_SAIDA if hash_params is None else COLUNAS_SAIDA_HASH
+            for df in blocos():
+                df = df.reindex(columns=colunas)
+                df.index = range(stats.linhas_gravadas, stats.linhas_gravadas + len(df))
+                df.to_csv(out, header=stats.blocos == 0)
+                _bloco_gravado(stats, len(df), progresso)
+    if guard is not None:
+        guard.save(unicidade)
+    return stats
+
+def _blocos_normalizados(
+    entradas: Iterable[str | Path],
+    chunksize: int,
+    workers: int,
+    hash_params: HashParams | None,
+    guard: DigestSet | None,
+    stats: PipelineStats,
+) -> Iterator[pd.DataFrame]:
+    """Blocos lidos, limpos, com senha (e hash, se pedido), prontos para gravar."""
+    for caminho in entradas:
+        stats.arquivos += 1
+        for bloco in ler_em_blocos(caminho, chunksize):
+            stats.linhas_lidas += len(bloco)
+            df, relatorio = limpar(bloco)
+            stats.linhas_descartadas += relatorio.descartadas
+            df = _normalizar_limpo(df, workers, guard)
+            if hash_params is not None:
+                df = hashear_df(df, hash_params)
+            yield df
 
-    df_concat = pd.concat([data1, data2], ignore_index=True)
+def _bloco_gravado(stats: PipelineStats, linhas: int, progresso: Callable[[PipelineStats], None] | None) -> None:
+    stats.blocos += 1
+    stats.linhas_gravadas += linhas
+    if progresso is not None:
+        progresso(stats)
 
+def provisionar_banco(
+    entradas: Iterable[str | Path],
+    banco: str | Path = "Cadastros.db",
+    chunksize: int = 100_000,
+    workers: int = 1,
+    progresso: Callable[[PipelineStats], None] | None = imprimir_progresso,
+    unicidade: str | Path | None = None,
+    hash_params: HashParams | None = None,
+) -> PipelineStats:
     """
-    2) Pode-se utilizar a função pd.merge() -> Combina os Daframes baseados em valores de chaves
-    - INNER JOIN / LEFT JOIN em SQL
-    - No caso dos Dataframes aqui (df1 e df2) não possuem chaves em comum para serem linkados.
+    Mesmo fluxo em blocos de processar_csvs, mas gravando no CredentialStore (SQLite) em vez de reescrever Cadastros:
+    só chaves (Serviço, Usuário) ainda ausentes recebem senha e são inseridas; as existentes não são tocadas.
+    Reexecutar com os mesmos arquivos custa apenas as consultas ao índice.
+    unicidade -> como em processar_csvs; o arquivo acompanha o banco entre as execuções incrementais.
+    hash_params -> o banco recebe só hash, salt e parametros (CredentialStore com hash_params), nunca a senha.
     """
+    guard = DigestSet.open(unicidade) if unicidade is not None else None
+    stats = PipelineStats()
+    with CredentialStore(banco, hash_params) as store:
+        for caminho in entradas:
+            stats.arquivos += 1
+            for bloco in ler_em_blocos(caminho, chunksize):
+                stats.linhas_lidas += len(bloco)
+                df, relatorio = limpar(bloco)
+                stats.linhas_descartadas += relatorio.descartadas
+                df = _padronizar(df)
+                novas = store.missing(zip(df["Serviço"], df["Usuário"]))
+                senhas = _gerar_senhas(len(novas), workers, guard)
+                instante = now()
+                stats.linhas_gravadas += store.upsert_many(
+                    (servico, usuario, senha, instante) for (servico, usuario), senha in zip(novas, senhas)
+                )
+                stats.blocos += 1
+                if progresso is not None:
+                    progresso(stats)
+    if guard is not None:
+        guard.save(unicidade)
+    return stats
 
-    # df_merge = pd.merge(data1, data2)
+# ------------------ Rotação incremental ------------------
+
+"""
+Rotação no CredentialStore, com custo proporcional às linhas que vencem e não ao tamanho da tabela:
+- vencidas: atualizado_em (instante inteiro único por linha) mais antigo que idade_maxima, selecionadas pelo índice
+  de atualizado_em em lotes de chunksize;
+- alteradas na fonte: cada linha de entrada limpa e padronizada recebe um hash de conteúdo
+  (pd.util.hash_pandas_object, vetorizado) comparado à origem gravada; só as ausentes ou diferentes recebem senha
+  nova. Cada chave é comparada uma vez por execução (a primeira ocorrência entre todas as entradas vence), então
+  uma chave repetida em várias fontes, ou escrita com outra caixa, não alterna de origem a cada execução.
+As linhas são atualizadas no lugar (upsert por chave); o restante da tabela não é lido nem reescrito.
+"""
+
+DIA = 86_400 # segundos
+
+@dataclass
+class RotacaoStats(PipelineStats):
+    novas: int = 0 # chaves que ainda não existiam
+    alteradas: int = 0 # origem mudou na fonte
+    vencidas: int = 0 # mais antigas que idade_maxima
+
+def hash_linhas(df: pd.DataFrame) -> np.ndarray:
+    """
+    Hash de conteúdo por linha já padronizada, como int64 para a coluna origem do SQLite: a chave (Serviço, Usuário)
+    e as demais colunas de entrada em ordem de nome (a ordem das colunas no arquivo não conta). Senha, Data e
+    Horário são gerados aqui e ficam de fora; o índice também.
+    """
+    extras = sorted(set(df.columns) - {*_CHAVE, *COLUNAS_SAIDA})
+    return pd.util.hash_pandas_object(df[[*_CHAVE, *extras]], index=False).to_numpy().view(np.int64)
+
+def rotacionar_banco(
+    entradas: Iterable[str | Path] = (),
+    banco: str | Path = "Cadastros.db",
+    idade_maxima: float = 90 * DIA,
+    chunksize: int = 100_000,
+    workers: int = 1,
+    progresso: Callable[[PipelineStats], None] | None = imprimir_progresso,
+    unicidade: str | Path | None = None,
+    hash_params: HashParams | None = None,
+) -> RotacaoStats:
+    """
+    Regera apenas as senhas que precisam: chaves novas ou alteradas nas entradas (opcionais) e senhas com mais de
+    idade_maxima segundos. Todas as linhas rotacionadas numa execução recebem o mesmo instante.
+    hash_params -> como em provisionar_banco: as senhas novas são gravadas só como hash.
+    """
+    if idade_maxima < 0:
+        raise ValueError("idade_maxima must be non-negative.")
+    guard = DigestSet.open(unicidade) if unicidade is not None else None
+    stats = RotacaoStats()
+    instante = now()
+    vistas: set[tuple[str, str]] = set() # chaves já comparadas nesta execução (memória proporcional às chaves)
+    with CredentialStore(banco, hash_params) as store:
+        for caminho in entradas:
+            stats.arquivos += 1
+            for bloco in ler_em_blocos(caminho, chunksize):
+                stats.linhas_lidas += len(bloco)
+                df, relatorio = limpar(bloco)
+                stats.linhas_descartadas += relatorio.descartadas
+                df = _padronizar(df).drop_duplicates(_CHAVE) # primeira ocorrência de cada chave no bloco
+                chaves = list(zip(df["Serviço"], df["Usuário"]))
+                df = df[np.fromiter((chave not in vistas for chave in chaves), dtype=bool, count=len(chaves))]
+                vistas.update(chaves)
+                origens = hash_linhas(df)
+                alvo = store.changed(zip(df["Serviço"], df["Usuário"], origens.tolist()))
+                senhas = _gerar_senhas(len(alvo), workers, guard)
+                stats.linhas_gravadas += store.rotate_many(
+                    (servico, usuario, senha, instante, origem)
+                    for (servico, usuario, origem, _), senha in zip(alvo, senhas)
+                )
+                novas = sum(nova for *_, nova in alvo)
+                stats.novas += novas
+                stats.alteradas += len(alvo) - novas
+                stats.blocos += 1
+                if progresso is not None:
+                    progresso(stats)
+
+        limite = instante - int(idade_maxima)
+        while vencidas := store.expired(limite, chunksize): # linhas rotacionadas saem da faixa: o laço termina
+            senhas = _gerar_senhas(len(vencidas), workers, guard)
+            stats.linhas_gravadas += store.rotate_many(
+                (servico, usuario, senha, instante, None) for (servico, usuario), senha in zip(vencidas, senhas)
+            )
+            stats.vencidas += len(vencidas)
+            stats.blocos += 1
+            if progresso is not None:
+                progresso(stats)
+    if guard is not None:
+        guard.save(unicidade)
+    return stats
+
+# ------------------ Junção por chave ------------------
+
+"""
+Versão em fluxo de juntar_dfs para muitas fontes grandes (processar_csvs(..., regra=...)):
+- cada fonte é lida em blocos, limpa e padronizada; cada linha recebe _ordem (posição global de leitura);
+- particoes > 1: as linhas vão para arquivos temporários pelo hash da chave (pd.util.hash_pandas_object de
+  Serviço e Usuário), então linhas da mesma chave caem sempre na mesma partição e cada partição cabe na memória;
+- cada partição é deduplicada (drop_duplicates: índice de hash da chave) e só as sobreviventes sem senha recebem
+  uma. Fontes que já têm Senha (ex.: um Cadastros anterior) mantêm a senha com regra="existente".
+Ordem da saída: a da primeira leitura dentro de cada partição (com particoes=1, a ordem global).
+"""
+
+REGRAS = ("primeira", "ultima", "existente")
+_CHAVE = ["Serviço", "Usuário"]
+
+@dataclass
+class UnificacaoStats(PipelineStats):
+    duplicadas: int = 0 # linhas descartadas por repetir uma chave
+    mantidas: int = 0 # sobreviventes que já tinham senha (não geraram outra)
+
+def hash_chaves(df: pd.DataFrame) -> np.ndarray:
+    """Hash uint64 por linha da chave (Serviço, Usuário), vetorizado."""
+    return pd.util.hash_pandas_object(df[_CHAVE], index=False).to_numpy()
+
+def deduplicar(df: pd.DataFrame, regra: str = "primeira") -> pd.DataFrame:
+    """
+    Uma linha por chave (Serviço, Usuário), na ordem de _ordem:
+    - "primeira": a primeira lida; "ultima": a última lida;
+    - "existente": a primeira que já tem Senha (mantém a senha emitida antes); sem nenhuma, a primeira lida.
+    """
+    if regra not in REGRAS:
+        raise ValueError(f"regra must be one of {', '.join(REGRAS)}.")
+    if regra == "existente" and "Senha" in df.columns:
+        df = df.assign(_sem_senha=df["Senha"].isna()).sort_values(["_sem_senha", "_ordem"], kind="stable")
+        df = df.drop_duplicates(_CHAVE, keep="first").drop(columns="_sem_senha")
+    else:
+        df = df.sort_values("_ordem", kind="stable").drop_duplicates(_CHAVE, keep="last" if regra == "ultima" else "first")
+    return df.sort_values("_ordem", kind="stable")
+
+def _completar_senhas(df: pd.DataFrame, workers: int = 1, guard: DigestSet | None = None) -> pd.DataFrame:
+    """Gera senha (com Data e Horário do instante atual) só para as linhas que ainda não têm."""
+    df = df.reindex(columns=list(dict.fromkeys([*df.columns, *COLUNAS_SAIDA[2:]])))
+    df = df.astype({coluna: object for coluna in COLUNAS_SAIDA[2:]}) # colunas só de ausentes chegam como float
+    faltam = df["Senha"].isna().to_numpy()
+    if faltam.any():
+        agora = datetime.now()
+        df.loc[faltam, "Senha"] = _gerar_senhas(int(faltam.sum()), workers, guard)
+        df.loc[faltam, "Data"] = agora.strftime("%d-%m-%Y")
+        df.loc[faltam, "Horário"] = agora.strftime("%H:%M:%S")
+    return df
+
+def _particoes_por_chave(
+    entradas: Iterable[str | Path], chunksize: int, particoes: int, pasta: Path, stats: PipelineStats
+) -> Iterator[pd.DataFrame]:
+    """Lê, limpa e padroniza as fontes; devolve o conteúdo de cada partição (uma por vez, na ordem das partições)."""
+    memoria: list[pd.DataFrame] = []
+    arquivos = [pasta / f"particao_{p}.csv" for p in range(particoes)]
+    ordem = 0
+    for caminho in entradas:
+        stats.arquivos += 1
+        for bloco in ler_em_blocos(caminho, chunksize):
+            stats.linhas_lidas += len(bloco)
+            df, relatorio = limpar(bloco)
+            stats.linhas_descartadas += relatorio.descartadas
+            df = _padronizar(df).reindex(columns=COLUNAS_SAIDA)
+            df["_ordem"] = np.arange(ordem, ordem + len(df))
+            ordem += len(df)
+            if particoes == 1:
+                memoria.append(df)
+                continue
+            destino = hash_chaves(df) % np.uint64(particoes)
+            for p, grupo in df.groupby(destino):
+                grupo.to_csv(arquivos[p], mode="a", header=not arquivos[p].exists(), index=False)
+    if particoes == 1:
+        yield pd.concat(memoria, ignore_index=True) if memoria else pd.DataFrame(columns=[*COLUNAS_SAIDA, "_ordem"])
+        return
+    for arquivo in arquivos:
+        if arquivo.exists(): # vazio, "" é ausência (Senha/Data/Horário); o resto é texto como veio na fonte
+            yield pd.read_csv(arquivo, dtype=str, keep_default_na=False, na_values=[""]).astype({"_ordem": np.int64})
+            arquivo.unlink()
+
+def _blocos_unificados(
+    entradas: Iterable[str | Path],
+    chunksize: int,
+    workers: int,
+    hash_params: HashParams | None,
+    guard: DigestSet | None,
+    stats: UnificacaoStats,
+    regra: str,
+    particoes: int,
+) -> Iterator[pd.DataFrame]:
+    """Blocos deduplicados por chave, com senha só para as sobreviventes que não tinham, prontos para gravar."""
+    if particoes < 1:
+        raise ValueError("particoes must be at least 1.")
+    if regra not in REGRAS:
+        raise ValueError(f"regra must be one of {', '.join(REGRAS)}.")
+    with tempfile.TemporaryDirectory(prefix="pgen_particoes_") as pasta:
+        for df in _particoes_por_chave(entradas, chunksize, particoes, Path(pasta), stats):
+            sobreviventes = deduplicar(df, regra)
+            stats.duplicadas += len(df) - len(sobreviventes)
+            stats.mantidas += int(sobreviventes["Senha"].notna().sum())
+            for inicio in range(0, len(sobreviventes), chunksize):
+                bloco = sobreviventes.iloc[inicio:inicio + chunksize]
+                bloco = _completar_senhas(bloco.drop(columns="_ordem").reset_index(drop=True), workers, guard)
+                if hash_params is not None:
+                    bloco = hashear_df(bloco, hash_params)
+                yield bloco
+
+# ------------------ Auditoria em lote ------------------
+
+"""
+Avalia as políticas configuradas (gen.policies por padrão) sobre a coluna Senha de uma tabela de credenciais já
+existente, em fluxo: Cadastros/.csv (read_csv em blocos), banco SQLite (.db, cursor em lotes) ou .parquet/.arrow
+(columnar.py, requer pyarrow). Cada bloco passa por passwords.audit.audit_batch (backend numpy vetorizado por padrão);
+workers > 1 distribui os blocos entre processos, com no máximo 2 * workers blocos em voo.
+Relatório: violações por política, por serviço (e política) e, opcionalmente, por linha num .csv gravado em fluxo;
+entropia estimada por linha (ver passwords.audit.estimate_entropy), resumida em média, mínimo e faixas.
+"""
+
+FAIXAS_ENTROPIA = (28, 36, 60, 128) # bits: muito fraca < 28 <= fraca < 36 <= razoável < 60 <= forte < 128 <= muito forte
+
+@dataclass
+class RelatorioAuditoria(PipelineStats):
+    politicas: tuple[str, ...] = ()
+    reprovadas: int = 0 # linhas que violam ao menos uma política
+    violacoes: Counter = field(default_factory=Counter) # política -> linhas que a violam
+    por_servico: pd.DataFrame | None = None # índice Serviço; colunas linhas, reprovadas e uma por política
+    entropia_soma: float = 0.0
+    entropia_min: float = float("inf")
+    faixas: Counter = field(default_factory=Counter) # limite inferior da faixa (bits) -> linhas
+
+    @property
+    def entropia_media(self) -> float:
+        return self.entropia_soma / self.linhas_gravadas if self.linhas_gravadas else 0.0
+
+    def resumo(self) -> dict:
+        """Resumo serializável (json) do relatório."""
+        return {
+            "linhas": self.linhas_gravadas,
+            "descartadas": self.linhas_descartadas,
+            "reprovadas": self.reprovadas,
+            "violacoes": {nome: self.violacoes[nome] for nome in self.politicas},
+            "por_servico": {} if self.por_servico is None else {
+                str(servico): {col: int(v) for col, v in linha.items()} for servico, linha in self.por_servico.iterrows()
+            },
+            "entropia_bits": {
+                "media": round(self.entropia_media, 2),
+                "minima": round(self.entropia_min, 2) if self.linhas_gravadas else None,
+                "faixas": {f">={limite}": self.faixas[limite] for limite in (0, *FAIXAS_ENTROPIA)},
+            },
+        }
+
+_ASSINATURAS = ((b"SQLite format 3\0", "db"), (b"ARROW1", "arrow"), (b"PAR1", "parquet"))
+
+def formato_tabela(caminho: str | Path) -> str:
+    """
+    "db", "arrow", "parquet" ou "csv", pelos bytes iniciais do arquivo e não pelo sufixo: a saída padrão
+    "Cadastros" não tem extensão qualquer que seja o formato gravado por processar_csvs.
+    """
+    with open(caminho, "rb") as fh: # arquivo ausente -> FileNotFoundError (CredentialStore criaria um banco vazio)
+        inicio = fh.read(16)
+    for assinatura, formato in _ASSINATURAS:
+        if inicio.startswith(assinatura):
+            return formato
+    # em WAL, um banco ainda aberto por outro processo pode não ter o cabeçalho gravado no arquivo principal
+    return "db" if Path(caminho).suffix.lower() == ".db" else "csv"
+
+def ler_tabela_em_blocos(caminho: str | Path, chunksize: int = 100_000) -> Iterator[pd.DataFrame]:
+    """Tabela de credenciais em blocos com as colunas Serviço, Usuário e Senha, qualquer que seja a origem."""
+    formato = formato_tabela(caminho)
+    if formato == "db":
+        # somente leitura e sem CredentialStore: auditar não migra o esquema nem passa o banco para WAL
+        uri = Path(caminho).absolute().as_uri() + "?mode=ro"
+        with closing(sqlite3.connect(uri, uri=True)) as conn:
+            cur = conn.execute("SELECT servico, usuario, senha, atualizado_em FROM credenciais ORDER BY rowid")
+            while linhas := cur.fetchmany(chunksize):
+                df = pd.DataFrame(linhas, columns=["Serviço", "Usuário", "Senha", "atualizado_em"])
+                if df["Senha"].isna().any():
+                    raise ValueError(f"{caminho} stores hashed passwords, which cannot be audited.")
+                yield df
+        return
+    if formato in ("parquet", "arrow"):
+        from columnar import ler_em_blocos as ler_colunar # import tardio: pyarrow só é exigido por esses formatos
+        for df in ler_colunar(caminho, chunksize, formato):
+            if "senha" not in df.columns:
+                raise ValueError(f"{caminho} has no password column (hashed output cannot be audited).")
+            yield df.rename(columns={"servico": "Serviço", "usuario": "Usuário", "senha": "Senha"})
+        return
+    # tudo como texto: "NA"/"null" e senhas só de dígitos são senhas, não NaN nem float
+    for df in ler_em_blocos(caminho, chunksize, dtype=str, keep_default_na=False):
+        df, _ = normalizar_colunas(df)
+        if "Senha" not in df.columns:
+            raise ValueError(f"{caminho} has no Senha column (hashed output cannot be audited).")
+        yield df
+
+def _auditar(senhas: list[str], policies: tuple, backend: str) -> AuditResult:
+    return audit_batch(senhas, policies, backend)
+
+def _auditorias(
+    blocos: Iterator[pd.DataFrame], policies: tuple, backend: str, workers: int
+) -> Iterator[tuple[pd.DataFrame, AuditResult]]:
+    """Pares (bloco, resultado) na ordem de leitura; em paralelo, a leitura segue à frente dos processos."""
+    if workers <= 1:
+        for df in blocos:
+            yield df, audit_batch(df["Senha"].tolist(), policies, backend)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        em_voo: deque = deque()
+        for df in blocos:
+            em_voo.append((df, pool.submit(_auditar, df["Senha"].tolist(), policies, backend)))
+            if len(em_voo) >= 2 * workers:
+                df, futuro = em_voo.popleft()
+                yield df, futuro.result()
+        while em_voo:
+            df, futuro = em_voo.popleft()
+            yield df, futuro.result()
+
+def auditar_tabela(
+    caminho: str | Path = "Cadastros",
+    policies: Iterable | None = None,
+    chunksize: int = 100_000,
+    workers: int = 1,
+    backend: str = "numpy",
+    saida_linhas: str | Path | None = None,
+    todas_linhas: bool = False,
+    progresso: Callable[[PipelineStats], None] | None = imprimir_progresso,
+) -> RelatorioAuditoria:
+    """
+    Audita a coluna Senha de caminho (.csv/Cadastros, .db, .parquet ou .arrow) sem carregá-la inteira.
+    - policies -> padrão gen.policies (as mesmas que regem a geração)
+    - saida_linhas -> .csv por linha (Serviço, Usuário, uma coluna booleana por política, Entropia); por padrão
+      só as linhas reprovadas, todas_linhas=True grava todas
+    Senhas nulas/vazias contam como descartadas (limpar), não como reprovadas.
+    """
+    policies = tuple(gen.policies if policies is None else policies)
+    relatorio = RelatorioAuditoria(politicas=policy_names(policies))
+    nomes = list(relatorio.politicas)
+
+    def blocos() -> Iterator[pd.DataFrame]:
+        relatorio.arquivos += 1
+        for bloco in ler_tabela_em_blocos(caminho, chunksize):
+            relatorio.linhas_lidas += len(bloco)
+            df, limpeza = limpar(bloco[["Serviço", "Usuário", "Senha"]])
+            relatorio.linhas_descartadas += limpeza.descartadas
+            yield df
+
+    out = open(saida_linhas, "w", newline="", encoding="utf-8") if saida_linhas is not None else None
+    try:
+        for df, resultado in _auditorias(blocos(), policies, backend, workers):
+            passou = np.asarray(resultado.passed, dtype=bool).reshape(len(df), len(nomes))
+            entropia = np.asarray(resultado.entropy, dtype=np.float64)
+            violou = pd.DataFrame(~passou, columns=nomes)
+            reprovada = violou.any(axis=1)
 
-    return df_concat
+            relatorio.reprovadas += int(reprovada.sum())
+            relatorio.violacoes.update({nome: int(n) for nome, n in violou.sum().items()})
+            violou.insert(0, "reprovadas", reprovada)
+            violou.insert(0, "linhas", 1)
+            parcial = violou.groupby(df["Serviço"].to_numpy()).sum()
+            relatorio.por_servico = parcial if relatorio.por_servico is None else \
+                relatorio.por_servico.add(parcial, fill_value=0).astype(np.int64)
+            if len(df):
+                relatorio.entropia_soma += float(entropia.sum())
+                relatorio.entropia_min = min(relatorio.entropia_min, float(entropia.min()))
+                faixa = np.searchsorted(FAIXAS_ENTROPIA, entropia, side="right")
+                limites = (0, *FAIXAS_ENTROPIA)
+                relatorio.faixas.update({limites[i]: int(n) for i, n in enumerate(np.bincount(faixa)) if n})
 
-df1_norm = normalizar_df(ruidos(df1))
-df2_norm = normalizar_df(ruidos(df2))
+            if out is not None:
+                linhas = pd.DataFrame(passou, columns=nomes)
+                linhas.insert(0, "Usuário", df["Usuário"].to_numpy())
+                linhas.insert(0, "Serviço", df["Serviço"].to_numpy())
+                linhas["Entropia"] = entropia.round(2)
+                if not todas_linhas:
+                    linhas = linhas[reprovada.to_numpy()]
+                linhas.to_csv(out, header=relatorio.blocos == 0, index=False)
+            _bloco_gravado(relatorio, len(df), progresso)
+    finally:
+        if out is not None:
+            out.close()
+    if relatorio.por_servico is not None:
+        relatorio.por_servico.index.name = "Serviço"
+    return relatorio
 
-new_data = pd.DataFrame(juntar_dfs(df1_norm, df2_norm)).to_csv("Cadastros")
+if __name__ == "__main__":
+    # python database.py [entrada.csv ...] -> padrão: users1.csv e users2.csv, gravando em Cadastros
+    processar_csvs(sys.argv[1:] or ["users1.csv", "users2.csv"], "Cadastros")
 
 
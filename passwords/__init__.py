@@ -1,11 +1,23 @@
 from .generator import PasswordGenerator
-from .policies import BasicPolicy, MinLengthPolicy, NoSequentialPolicy
-from .rng import SecretsRandom
+from .policies import BasicPolicy, BlocklistPolicy, MinLengthPolicy, NoSequentialPolicy
+from .rng import BufferedRandom, DeterministicRandom, SecretsRandom
 
 __all__ = [
     "PasswordGenerator",
+    "PassphraseGenerator",
     "BasicPolicy",
     "MinLengthPolicy",
     "NoSequentialPolicy",
-    "SecretsRandom"
-]
\ No newline at end of file
+    "BlocklistPolicy",
+    "SecretsRandom",
+    "BufferedRandom",
+    "DeterministicRandom",
+]
+
+
+def __getattr__(name: str):
+    """PassphraseGenerator é carregado sob demanda: importar o pacote não paga pelo módulo de frases-senha."""
+    if name == "PassphraseGenerator":
+        from .passphrase import PassphraseGenerator
+        return PassphraseGenerator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,143 @@
+import math
+import string
+from dataclasses import dataclass
+from typing import Iterable, Sequence
+from .contracts import PasswordPolicy
+from .policies import (
+    BasicPolicy, MinLengthPolicy, NoSequentialPolicy, _SPECIAL, _SUCCESSOR, _class_table,
+)
+
+# ------------------ Auditoria de senhas existentes ------------------
+
+"""
+Avalia cada política configurada, separadamente, sobre um lote de senhas herdadas (comprimentos e caracteres
+arbitrários), e estima a entropia de cada uma.
+- backend="python": validate() de cada política em cada senha (referência).
+- backend="numpy": o lote vira uma matriz de códigos (UCS-4) e as políticas conhecidas viram operações sobre ela,
+  como em passwords/vectorized.py; senhas longas (> MAX_VECTOR_LEN) e políticas desconhecidas usam validate().
+Entropia estimada por senha: len * log2(tamanho dos grupos de caracteres presentes) (minúsculas 26, maiúsculas 26,
+dígitos 10, pontuação/espaço 33, demais 100). É o espaço de busca de força bruta por classes, um limite superior
+para senhas escolhidas por pessoas; para senhas deste gerador use PasswordGenerator.exact_entropy_bits.
+"""
+
+MAX_VECTOR_LEN = 128 # acima disso a linha sai da matriz (evita que uma senha enorme infle o lote inteiro)
+
+_POOLS = (
+    (str.islower, 26),
+    (str.isupper, 26),
+    (str.isdigit, 10),
+    (lambda ch: ch in string.punctuation or ch == " ", 33),
+)
+_OTHER_POOL = 100
+
+
+def policy_names(policies: Sequence[PasswordPolicy]) -> tuple[str, ...]:
+    """Nome de coluna por política: nome da classe, com sufixo #n quando a mesma classe se repete."""
+    names, seen = [], {}
+    for policy in policies:
+        name = type(policy).__name__
+        seen[name] = seen.get(name, 0) + 1
+        names.append(name if seen[name] == 1 else f"{name}#{seen[name]}")
+    return tuple(names)
+
+
+def _char_pool_bits(ch: str) -> int:
+    for bit, (test, _) in enumerate(_POOLS):
+        if test(ch):
+            return 1 << bit
+    return 1 << len(_POOLS)
+
+
+def _pool_size(bits: int) -> int:
+    sizes = [size for _, size in _POOLS] + [_OTHER_POOL]
+    return sum(size for i, size in enumerate(sizes) if bits >> i & 1)
+
+
+def estimate_entropy(pw: str) -> float:
+    bits = 0
+    for ch in set(pw):
+        bits |= _char_pool_bits(ch)
+    pool = _pool_size(bits)
+    return len(pw) * math.log2(pool) if pool else 0.0
+
+
+@dataclass(frozen=True)
+class AuditResult:
+    """passed[i][j]: senha i cumpre a política j (na ordem de names); entropy[i] em bits."""
+    names: tuple[str, ...]
+    passed: Sequence # list[list[bool]] (python) ou np.ndarray bool (linhas x políticas) (numpy)
+    entropy: Sequence
+
+
+def audit_batch(passwords: Sequence[str], policies: Iterable[PasswordPolicy], backend: str = "python") -> AuditResult:
+    policies = tuple(policies)
+    if backend == "numpy":
+        return _audit_numpy(list(passwords), policies)
+    if backend != "python":
+        raise ValueError("backend deve ser 'python' ou 'numpy'.")
+    return AuditResult(
+        names=policy_names(policies),
+        passed=[[policy.validate(pw) for policy in policies] for pw in passwords],
+        entropy=[estimate_entropy(pw) for pw in passwords],
+    )
+
+# ------------------ Caminho vetorizado ------------------
+
+def _audit_numpy(passwords: list[str], policies: tuple[PasswordPolicy, ...]) -> AuditResult:
+    try:
+        import numpy as np
+    except ImportError as exc:  # dependência opcional, como em passwords/vectorized.py
+        raise ImportError("backend='numpy' requires numpy (pip install numpy).") from exc
+    from .vectorized import run_free
+
+    rows = len(passwords)
+    lengths = np.fromiter(map(len, passwords), dtype=np.int64, count=rows)
+    passed = np.ones((rows, len(policies)), dtype=bool)
+    entropy = np.zeros(rows)
+    long_rows = np.flatnonzero(lengths > MAX_VECTOR_LEN)
+    short = lengths <= MAX_VECTOR_LEN
+
+    width = max(1, int(lengths[short].max()) if short.any() else 0) # largura 1 cobre lotes só de senhas vazias
+    if rows:
+        matrix = np.array([pw if n <= MAX_VECTOR_LEN else "" for pw, n in zip(passwords, lengths)], dtype=f"<U{width}")
+        codes = matrix.view(np.uint32).reshape(rows, width)
+        uniq, inverse = np.unique(codes, return_inverse=True)
+        inverse = inverse.reshape(rows, width)
+        chars = [chr(c) for c in uniq.tolist()]
+        pad = uniq == 0 # posições além do fim da senha
+
+        # entropia: grupos de caracteres presentes -> tamanho do espaço
+        pool_bits = np.array([_char_pool_bits(ch) for ch in chars], dtype=np.int64)
+        pool_bits[pad] = 0
+        seen_pool = np.bitwise_or.reduce(pool_bits[inverse], axis=1)
+        sizes = np.array([_pool_size(b) for b in range(1 << (len(_POOLS) + 1))], dtype=np.float64)
+        pool = sizes[seen_pool]
+        entropy = np.where(pool > 0, lengths * np.log2(np.maximum(pool, 1)), 0.0)
+
+        specials = tuple(dict.fromkeys(p.specials for p in policies if type(p) is BasicPolicy))
+        table = _class_table(specials)
+        class_bits = np.array([table[ch] for ch in chars], dtype=np.int64)
+        class_bits[pad] = 0
+        seen = np.bitwise_or.reduce(class_bits[inverse], axis=1) if specials else None
+        succ = np.array([ord(_SUCCESSOR[ch]) if _SUCCESSOR.get(ch) else -1 for ch in chars], dtype=np.int64)
+        in_seq = np.array([ch in _SUCCESSOR for ch in chars], dtype=bool)
+        in_seq[pad] = False
+        steps = succ[inverse[:, :-1]] == codes[:, 1:]
+
+        for j, policy in enumerate(policies):
+            kind = type(policy)
+            if kind is MinLengthPolicy:
+                passed[:, j] = lengths >= policy.min_len
+            elif kind is BasicPolicy:
+                need = policy.required_bits(_SPECIAL << specials.index(policy.specials))
+                passed[:, j] = (seen & need) == need
+            elif kind is NoSequentialPolicy:
+                passed[:, j] = run_free(steps, in_seq[inverse] if policy.run_len == 1 else None, policy.run_len, rows)
+            else:
+                passed[:, j] = [policy.validate(pw) for pw in passwords]
+
+    for i in long_rows.tolist(): # fora da matriz: caminho de referência
+        pw = passwords[i]
+        passed[i] = [policy.validate(pw) for policy in policies]
+        entropy[i] = estimate_entropy(pw)
+    return AuditResult(policy_names(policies), passed, entropy)
@@ -0,0 +1,118 @@
+import hashlib
+import math
+import mmap
+import os
+import struct
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable
+
+# ------------------ Filtro de Bloom em arquivo ------------------
+
+"""
+Filtro de Bloom para listas grandes de senhas vazadas/comuns, usado por BlocklistPolicy.
+- Formato: cabeçalho fixo (_HEADER) seguido do vetor de bits. O arquivo é aberto via mmap somente leitura:
+  abrir não lê o arquivo, só as páginas consultadas entram na memória, e processos diferentes que abrem
+  o mesmo arquivo compartilham essas páginas pelo cache do sistema.
+- Consulta: um blake2b de 16 bytes gera h1 e h2; as k posições são h1 + i*h2 (double hashing), sem
+  nenhum conjunto de strings em memória.
+- Falsos positivos (senha boa recusada) ocorrem na taxa configurada; falsos negativos nunca.
+"""
+
+_MAGIC = b"PGBLOOM1"
+_HEADER = struct.Struct("<8sQIQ") # magic, m (bits), k (hashes), n (itens inseridos)
+
+
+def _hashes(item: str) -> tuple[int, int]:
+    # surrogateescape: linhas não UTF-8 da wordlist (lidas assim) voltam aos bytes originais; UTF-8 válido não muda
+    digest = hashlib.blake2b(item.encode("utf-8", "surrogateescape"), digest_size=16).digest()
+    h1, h2 = struct.unpack("<QQ", digest)
+    return h1, h2 | 1 # h2 ímpar: as k posições não colapsam quando m é par
+
+
+def optimal_size(n: int, fp_rate: float) -> tuple[int, int]:
+    """(m bits, k hashes) que minimizam o tamanho para n itens com taxa de falso positivo fp_rate."""
+    if not 0 < fp_rate < 1:
+        raise ValueError("fp_rate must be between 0 and 1.")
+    n = max(1, n)
+    m = max(8, math.ceil(-n * math.log(fp_rate) / (math.log(2) ** 2)))
+    k = max(1, round(m / n * math.log(2)))
+    return m, k
+
+
+class BloomFilter:
+    """Filtro somente leitura sobre um arquivo gerado por build_bloom()."""
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        with open(self.path, "rb") as fh:
+            self._mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.m, self.k, self.n = _HEADER.unpack_from(self._mm, 0)
+        if magic != _MAGIC:
+            raise ValueError(f"{self.path} is not a Bloom filter file.")
+
+    def __contains__(self, item: str) -> bool:
+        h1, h2 = _hashes(item)
+        mm, m, base = self._mm, self.m, _HEADER.size
+        for i in range(self.k):
+            bit = (h1 + i * h2) % m
+            if not mm[base + (bit >> 3)] & (1 << (bit & 7)):
+                return False
+        return True
+
+    def close(self) -> None:
+        self._mm.close()
+
+
+@lru_cache(maxsize=None)
+def open_bloom(path: str) -> BloomFilter:
+    """Um mmap por arquivo e por processo, reaproveitado por todas as políticas que apontam para ele."""
+    return BloomFilter(path)
+
+
+def build_bloom(words: Iterable[str], path: str | Path, expected: int, fp_rate: float = 1e-3) -> int:
+    """
+    Construtor offline: grava em path um filtro dimensionado para expected itens com taxa fp_rate.
+    Grava de forma atômica (arquivo temporário + os.replace), como DigestSet.save: truncar um arquivo que outro
+    processo mantém em mmap o derrubaria com SIGBUS. Retorna quantos itens foram inseridos.
+    """
+    m, k = optimal_size(expected, fp_rate)
+    bits = bytearray((m + 7) // 8)
+    n = 0
+    for word in words:
+        h1, h2 = _hashes(word)
+        for i in range(k):
+            bit = (h1 + i * h2) % m
+            bits[bit >> 3] |= 1 << (bit & 7)
+        n += 1
+    tmp = f"{path}.tmp" # mesmo diretório: os.replace é atômico e quem mapeou o arquivo antigo segue com ele
+    with open(tmp, "wb") as fh:
+        fh.write(_HEADER.pack(_MAGIC, m, k, n))
+        fh.write(bits)
+    os.replace(tmp, path)
+    open_bloom.cache_clear() # um filtro reconstruído no mesmo caminho não deve usar o mmap antigo
+    return n
+
+
+def build_bloom_from_wordlist(wordlist: str | Path, path: str | Path, fp_rate: float = 1e-3) -> int:
+    """Lista em texto, uma senha por linha: uma passada para contar e outra para inserir (memória constante)."""
+    def lines() -> Iterable[str]:
+        with open(wordlist, encoding="utf-8", errors="surrogateescape") as fh:
+            for line in fh:
+                word = line.rstrip("\r\n")
+                if word:
+                    yield word
+
+    expected = sum(1 for _ in lines())
+    return build_bloom(lines(), path, expected, fp_rate)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Gera o filtro de Bloom usado por BlocklistPolicy.")
+    parser.add_argument("wordlist", help="arquivo texto, uma senha por linha")
+    parser.add_argument("output", help="arquivo do filtro a gerar")
+    parser.add_argument("--fp-rate", type=float, default=1e-3, help="taxa de falso positivo (padrão 0.001)")
+    args = parser.parse_args()
+    count = build_bloom_from_wordlist(args.wordlist, args.output, args.fp_rate)
+    print(f"{count:,} senhas -> {args.output}")
@@ -0,0 +1,194 @@
+import sys
+
+# ------------------ CLI pgen ------------------
+
+"""
+Ponto de entrada de linha de comando: python -m passwords. O repositório não é um pacote instalável, então não há
+executável pgen; nos exemplos abaixo, pgen abrevia python -m passwords (ou um alias de shell com esse comando).
+  pgen 16                                   -> uma senha de 16 caracteres
+  pgen 16 -n 5 --format json --entropy      -> cinco senhas em JSON, com a entropia exata da configuração
+  pgen csv users1.csv users2.csv -o Cadastros [--workers 4] [--hash] [--unicidade senhas.uniq] [--formato arrow]
+  pgen csv Cadastros users1.csv users2.csv -o Cadastros.novo --dedup existente [--particoes 16]
+  pgen db users1.csv users2.csv --banco Cadastros.db [--hash]
+  pgen rotate [users1.csv ...] --banco Cadastros.db --max-age-days 90 [--hash]
+  pgen audit Cadastros [--por-linha violacoes.csv] [--policies basic,minlen] [--workers 4]
+Os subcomandos de lote (csv, db, rotate, audit) importam database.py, store.py e columnar.py, scripts da raiz do
+repositório e não módulos do pacote: rode-os a partir da raiz (ou com ela no PYTHONPATH).
+Partida rápida: este módulo só importa sys no topo. argparse, o gerador e, nos subcomandos de provisionamento,
+pandas (via database.py) são importados apenas pelo caminho que os usa. Medição: python -m benchmarks.cold_start
+"""
+
+POLICIES = ("basic", "minlen", "noseq")
+FORMATS = ("text", "json", "csv")
+BULK = ("csv", "db", "rotate", "audit")
+
+
+def _gen_parser():
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="pgen", description="Gera senhas (subcomandos de lote: pgen csv | pgen db | pgen rotate | pgen audit).")
+    parser.add_argument("length", type=int, help="tamanho da senha")
+    parser.add_argument("-n", "--count", type=int, default=1, help="quantidade de senhas (padrão 1)")
+    parser.add_argument("--specials", default="!@#$%&*/?", help="caracteres especiais do alfabeto")
+    parser.add_argument("--policies", default=",".join(POLICIES),
+                        help=f"políticas separadas por vírgula entre {', '.join(POLICIES)} (vazio = nenhuma)")
+    parser.add_argument("--min-len", type=int, default=10, help="tamanho mínimo (MinLengthPolicy)")
+    parser.add_argument("--run-len", type=int, default=3, help="maior sequência proibida (NoSequentialPolicy)")
+    parser.add_argument("--blocklist", default=None, help="filtro de Bloom gerado por passwords.blocklist")
+    parser.add_argument("--repeat", action="store_true", help="permite caracteres repetidos (unique_chars=False)")
+    parser.add_argument("--constructive", action="store_true", help="sorteio já válido para BasicPolicy")
+    parser.add_argument("--format", choices=FORMATS, default="text")
+    parser.add_argument("--entropy", action="store_true", help="inclui a entropia exata (bits) da configuração")
+    return parser
+
+
+def _bulk_parser(command: str):
+    import argparse
+
+    descriptions = {
+        "csv": "Provisiona senhas para .csv de usuários gravando um .csv de saída.",
+        "db": "Provisiona senhas para .csv de usuários num banco SQLite incremental.",
+        "rotate": "Rotaciona no banco SQLite as senhas vencidas e as de linhas novas ou alteradas nas entradas.",
+        "audit": "Audita as senhas de uma tabela existente (.csv, .db, .parquet, .arrow) contra as políticas.",
+    }
+    parser = argparse.ArgumentParser(prog=f"pgen {command}", description=descriptions[command])
+    if command == "audit":
+        parser.add_argument("tabela", help="Cadastros/.csv, banco .db ou saída .parquet/.arrow")
+        parser.add_argument("--por-linha", default=None, help=".csv com o resultado por linha (só as reprovadas)")
+        parser.add_argument("--todas", action="store_true", help="com --por-linha, grava também as aprovadas")
+        parser.add_argument("--backend", choices=("numpy", "python"), default="numpy")
+        parser.add_argument("--specials", default="!@#$%&*/?", help="caracteres especiais exigidos (BasicPolicy)")
+        parser.add_argument("--policies", default=",".join(POLICIES), help="políticas separadas por vírgula")
+        parser.add_argument("--min-len", type=int, default=10, help="tamanho mínimo (MinLengthPolicy)")
+        parser.add_argument("--run-len", type=int, default=3, help="maior sequência proibida (NoSequentialPolicy)")
+        parser.add_argument("--blocklist", default=None, help="filtro de Bloom gerado por passwords.blocklist")
+    else:
+        parser.add_argument("entradas", nargs="*" if command == "rotate" else "+", help="arquivos .csv com Serviço e Usuário")
+    if command == "csv":
+        parser.add_argument("-o", "--saida", default="Cadastros")
+        parser.add_argument("--formato", choices=("csv", "parquet", "arrow"), default="csv",
+                            help="formato da saída (parquet/arrow exigem pyarrow)")
+        parser.add_argument("--dedup", choices=("primeira", "ultima", "existente"), default=None,
+                            help="uma linha por (Serviço, Usuário) entre todas as entradas, com esta regra")
+        parser.add_argument("--particoes", type=int, default=1, help="com --dedup: partições por hash da chave")
+    elif command != "audit":
+        parser.add_argument("--banco", default="Cadastros.db")
+    if command != "audit":
+        parser.add_argument("--hash", action="store_true", help="grava Hash/Salt/Parametros no lugar da senha")
+    if command == "rotate":
+        parser.add_argument("--max-age-days", type=float, default=90, help="idade máxima de uma senha (padrão 90)")
+    parser.add_argument("--chunksize", type=int, default=100_000)
+    parser.add_argument("--workers", type=int, default=1)
+    if command != "audit":
+        parser.add_argument("--unicidade", default=None, help="arquivo de digests para unicidade entre execuções")
+    parser.add_argument("--quiet", action="store_true", help="sem progresso em stderr")
+    return parser
+
+
+def _policies(args) -> list:
+    from .policies import BasicPolicy, BlocklistPolicy, MinLengthPolicy, NoSequentialPolicy
+
+    names = [name.strip() for name in args.policies.split(",") if name.strip()]
+    unknown = sorted(set(names) - set(POLICIES))
+    if unknown:
+        raise ValueError(f"Unknown policies: {', '.join(unknown)}.")
+    make = {
+        "basic": lambda: BasicPolicy(specials=args.specials),
+        "minlen": lambda: MinLengthPolicy(args.min_len),
+        "noseq": lambda: NoSequentialPolicy(args.run_len),
+    }
+    policies = [make[name]() for name in dict.fromkeys(names)]
+    if args.blocklist:
+        policies.append(BlocklistPolicy(args.blocklist))
+    return policies
+
+
+def _generate(argv: list[str]) -> int:
+    args = _gen_parser().parse_args(argv)
+    from .generator import PasswordGenerator
+
+    gen = PasswordGenerator(
+        length_min=args.min_len if "minlen" in args.policies else 1,
+        _specials=args.specials,
+        policies=_policies(args),
+        constructive=args.constructive,
+    )
+    unique = not args.repeat
+    if args.count == 1:
+        passwords = [gen.generate(args.length, unique_chars=unique)]
+    else:
+        passwords = gen.generate_many(args.count, args.length, unique_chars=unique)
+    bits = gen.exact_entropy_bits(args.length, unique) if args.entropy else None
+
+    out = sys.stdout
+    if args.format == "json":
+        import json
+        doc = {"length": args.length, "passwords": passwords}
+        if bits is not None:
+            doc["entropy_bits"] = round(bits, 2)
+        out.write(json.dumps(doc) + "\n")
+    elif args.format == "csv":
+        import csv
+        writer = csv.writer(out, lineterminator="\n") # aspas e separadores dentro da senha são escapados
+        writer.writerow(["password"])
+        writer.writerows([pw] for pw in passwords)
+    else:
+        out.write("\n".join(passwords) + "\n")
+    if bits is not None and args.format != "json":
+        print(f"entropy: {bits:.2f} bits", file=sys.stderr)
+    return 0
+
+
+def _provision(command: str, argv: list[str]) -> int:
+    args = _bulk_parser(command).parse_args(argv)
+    try:
+        import database  # pandas só é carregado aqui
+    except ImportError as exc:
+        raise ValueError(
+            f"pgen {command} requires pandas and must run from the repository root (database.py on the path): {exc}"
+        ) from exc
+
+    progresso = None if args.quiet else database.imprimir_progresso
+    if command == "audit":
+        import json
+        relatorio = database.auditar_tabela(
+            args.tabela, _policies(args), args.chunksize, args.workers, args.backend, args.por_linha, args.todas,
+            progresso,
+        )
+        sys.stdout.write(json.dumps(relatorio.resumo(), ensure_ascii=False, indent=2) + "\n")
+        return 1 if relatorio.reprovadas else 0
+    hash_params = None
+    if args.hash:
+        from .hashing import HashParams
+        hash_params = HashParams()
+    if command == "csv":
+        stats = database.processar_csvs(
+            args.entradas, args.saida, args.chunksize, args.workers, progresso, hash_params, args.unicidade,
+            args.formato, args.dedup, args.particoes,
+        )
+        destino = args.saida
+    elif command == "db":
+        stats = database.provisionar_banco(
+            args.entradas, args.banco, args.chunksize, args.workers, progresso, args.unicidade,
+            hash_params,
+        )
+        destino = args.banco
+    else:
+        stats = database.rotacionar_banco(
+            args.entradas, args.banco, args.max_age_days * database.DIA, args.chunksize, args.workers, progresso,
+            args.unicidade, hash_params,
+        )
+        destino = f"{args.banco} (novas={stats.novas:,} alteradas={stats.alteradas:,} vencidas={stats.vencidas:,})"
+    print(f"{stats.linhas_gravadas:,} linhas -> {destino} ({stats.segundos:.2f}s)", file=sys.stderr)
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    try:
+        if argv and argv[0] in BULK:
+            return _provision(argv[0], argv[1:])
+        return _generate(argv)
+    except ValueError as exc:
+        print(f"pgen: {exc}", file=sys.stderr)
+        return 2
@@ -0,0 +1,191 @@
+from dataclasses import dataclass, field
+from functools import lru_cache
+from math import comb, factorial
+from typing import Iterable
+from .contracts import PasswordPolicy, RandomSource
+from .policies import BasicPolicy
+
+# ------------------ Geração construtiva ------------------
+
+"""
+Geração que já nasce válida para as exigências de classe de BasicPolicy (minúscula, maiúscula, dígito, especial).
+1) O alfabeto é particionado em grupos de caracteres que satisfazem o mesmo conjunto de exigências (máscara de bits).
+2) f(r, mask) conta quantas completações de r caracteres levam `mask` a cobrir todas as exigências.
+3) Cada posição é sorteada com peso proporcional ao número de senhas válidas que ela ainda permite, então o resultado
+   é uniforme sobre o conjunto válido (o mesmo conjunto que o laço de rejeição aceita), em uma única passada.
+Políticas sem exigência de classe (ex.: NoSequentialPolicy) continuam sendo verificadas depois, por rejeição.
+
+Caracteres únicos (unique_chars=True) seguem a mesma ideia sem reposição:
+1) s(i, mask, k) conta quantos subconjuntos de k caracteres dos grupos i.. completam as exigências.
+2) Quantos caracteres vêm de cada grupo é sorteado com peso C(|grupo|, n) * s(i+1, ...), e os caracteres de cada
+   grupo saem de um Fisher–Yates parcial; um Fisher–Yates final embaralha as posições.
+O resultado é uniforme sobre as senhas sem repetição que cumprem as exigências, sem passada de deduplicação.
+"""
+
+# Predicados de classe: (tipo, especiais). Os especiais só importam para o tipo "special".
+Requirement = tuple[str, str]
+
+
+def requirements_of(policies: Iterable[PasswordPolicy]) -> tuple[Requirement, ...]:
+    """Extrai as exigências de classe das BasicPolicy configuradas (sem repetição, ordem estável)."""
+    reqs: dict[Requirement, None] = {}
+    for policy in policies:
+        if not isinstance(policy, BasicPolicy):
+            continue
+        if policy.require_lower:
+            reqs[("lower", "")] = None
+        if policy.require_upper:
+            reqs[("upper", "")] = None
+        if policy.require_digit:
+            reqs[("digit", "")] = None
+        if policy.require_special:
+            reqs[("special", policy.specials)] = None
+    return tuple(reqs)
+
+
+def _satisfies(ch: str, req: Requirement) -> bool:
+    kind, specials = req
+    if kind == "lower":
+        return ch.islower()
+    if kind == "upper":
+        return ch.isupper()
+    if kind == "digit":
+        return ch.isdigit()
+    return ch in specials
+
+
+_BYTE = ''.join(map(chr, range(256))) # "dígitos" de 8 bits sorteados com choice() pelas fontes sem randbelow
+
+
+def _randbelow(rng: RandomSource, n: int) -> int:
+    """
+    Inteiro uniforme em [0, n). Fontes só com o contrato RandomSource (choice/shuffle) montam o número dígito a
+    dígito (um choice sobre 256 caracteres por byte) com rejeição sem viés: n pode passar de sys.maxsize (as
+    contagens de f(r, mask) e s(i, mask, k) crescem exponencialmente com o tamanho), o que choice(range(n)) não aceita.
+    """
+    randbelow = getattr(rng, "randbelow", None)
+    if randbelow is not None:
+        return randbelow(n)
+    nbytes = max(1, ((n - 1).bit_length() + 7) // 8)
+    span = 1 << (8 * nbytes)
+    limit = span - span % n  # valores >= limit introduziriam viés no módulo
+    while True:
+        v = 0
+        for _ in range(nbytes):
+            v = (v << 8) | ord(rng.choice(_BYTE))
+        if v < limit:
+            return v % n
+
+
+def _partial_shuffle(rng: RandomSource, pool: list[str], k: int) -> list[str]:
+    """Fisher–Yates parcial: as k primeiras posições viram uma amostra uniforme sem reposição."""
+    n = len(pool)
+    for i in range(k):
+        j = i + _randbelow(rng, n - i)
+        pool[i], pool[j] = pool[j], pool[i]
+    return pool[:k]
+
+
+@dataclass(frozen=True)
+class ClassPlan:
+    """Plano compilado para um alfabeto + exigências de classe; reutilizável entre chamadas."""
+    groups: tuple[str, ...]  # caracteres agrupados por máscara
+    masks: tuple[int, ...]   # máscara de exigências satisfeitas por cada grupo
+    full: int                # máscara com todas as exigências
+    _table: dict[int, tuple[int, ...]] = field(default_factory=dict, repr=False, compare=False)
+    _subsets: dict[tuple[int, int, int], int] = field(default_factory=dict, repr=False, compare=False)
+
+    def _counts(self, r: int) -> tuple[int, ...]:
+        """f(r, mask) para todas as máscaras, memoizado por r."""
+        if r in self._table:
+            return self._table[r]
+        if not self._table:
+            self._table[0] = tuple(int(mask == self.full) for mask in range(self.full + 1))
+        for k in range(max(self._table) + 1, r + 1):
+            prev = self._table[k - 1]
+            self._table[k] = tuple(
+                sum(len(g) * prev[mask | m] for g, m in zip(self.groups, self.masks))
+                for mask in range(self.full + 1)
+            )
+        return self._table[r]
+
+    def count(self, length: int) -> int:
+        """Número exato de senhas de tamanho length que cumprem as exigências."""
+        return self._counts(length)[0]
+
+    def acceptance(self, length: int) -> float:
+        """Probabilidade de um token uniforme passar nas exigências (o que o laço de rejeição enfrenta)."""
+        size = sum(len(g) for g in self.groups)
+        return self.count(length) / size ** length
+
+    def draw(self, rng: RandomSource, length: int) -> str:
+        if self.count(length) == 0:
+            raise ValueError("Policies cannot be satisfied with this alphabet and length.")
+        out = []
+        mask = 0
+        for r in range(length, 0, -1):
+            sub = self._counts(r - 1)
+            v = _randbelow(rng, self._counts(r)[mask])
+            for g, m in zip(self.groups, self.masks):
+                weight = sub[mask | m]
+                span = len(g) * weight
+                if v < span:
+                    out.append(g[v // weight])
+                    mask |= m
+                    break
+                v -= span
+        return ''.join(out)
+
+    # ---------- Sem repetição de caracteres ----------
+    def _subset_count(self, i: int, mask: int, k: int) -> int:
+        """s(i, mask, k): subconjuntos de k caracteres dos grupos i.. que completam as exigências a partir de mask."""
+        if i == len(self.groups):
+            return int(k == 0 and mask == self.full)
+        key = (i, mask, k)
+        cached = self._subsets.get(key)
+        if cached is not None:
+            return cached
+        size, m = len(self.groups[i]), self.masks[i]
+        total = sum(
+            comb(size, n) * self._subset_count(i + 1, mask | m if n else mask, k - n)
+            for n in range(min(size, k) + 1)
+        )
+        self._subsets[key] = total
+        return total
+
+    def unique_count(self, length: int) -> int:
+        """Número exato de senhas sem caracteres repetidos (conjuntos x permutações) que cumprem as exigências."""
+        return self._subset_count(0, 0, length) * factorial(length)
+
+    def draw_unique(self, rng: RandomSource, length: int, shuffle: bool = True) -> str:
+        """shuffle=False: sem o Fisher–Yates final, os caracteres saem agrupados por classe (ordem dos grupos)."""
+        if length > sum(len(g) for g in self.groups):
+            raise ValueError("unique_chars requires length <= alphabet size.")
+        if self._subset_count(0, 0, length) == 0:
+            raise ValueError("Policies cannot be satisfied with this alphabet and length.")
+        chosen: list[str] = []
+        mask, k = 0, length
+        for i, (g, m) in enumerate(zip(self.groups, self.masks)):
+            v = _randbelow(rng, self._subset_count(i, mask, k))
+            for n in range(min(len(g), k) + 1):
+                nxt = mask | m if n else mask
+                weight = comb(len(g), n) * self._subset_count(i + 1, nxt, k - n)
+                if v < weight:
+                    chosen += _partial_shuffle(rng, list(g), n)
+                    mask, k = nxt, k - n
+                    break
+                v -= weight
+        return ''.join(_partial_shuffle(rng, chosen, len(chosen)) if shuffle else chosen)
+
+
+@lru_cache(maxsize=64)
+def compile_plan(alphabet: str, requirements: tuple[Requirement, ...]) -> ClassPlan:
+    grouped: dict[int, list[str]] = {}
+    for ch in dict.fromkeys(alphabet):  # remove repetidos preservando a ordem
+        mask = sum(1 << i for i, req in enumerate(requirements) if _satisfies(ch, req))
+        grouped.setdefault(mask, []).append(ch)
+    return ClassPlan(
+        groups=tuple(''.join(chars) for chars in grouped.values()),
+        masks=tuple(grouped),
+        full=(1 << len(requirements)) - 1,
+    )
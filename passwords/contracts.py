@@ -7,6 +7,8 @@ Protocolos para garantir que as classes implementem os métodos necessários.
 - PasswordPolicy: define a interface de validação de senhas -> utilizada em BasicPolicy e _passes_policies.
 - RandomSource: define a interface de geração aleatória -> utilizada em SecretsRandom, _random_token e _shuffle
  e injetada no PasswordGenerator.
+- BulkRandomSource: extensão opcional de RandomSource com sorteios inteiros e em lote -> utilizada na geração em lote
+ (generate_many) quando a fonte injetada a implementa; caso contrário, o gerador cai em choice/shuffle.
 """
 
 class PasswordPolicy(Protocol):
@@ -16,3 +18,9 @@ class RandomSource(Protocol):
     def choice(self, seq: Sequence[str]) -> str: ...
     def shuffle(self, x: list[str]) -> None: ...
 
+class BulkRandomSource(RandomSource, Protocol):
+    def randbelow(self, n: int) -> int: ...
+    def sample(self, seq: Sequence[str], k: int) -> list[str]: ...
+    def indices(self, k: int, count: int) -> list[int]: ...
+    def index_bytes(self, k: int, count: int) -> bytes: ...
+    def randbytes(self, n: int) -> bytes: ...
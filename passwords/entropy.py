@@ -0,0 +1,149 @@
+from collections import defaultdict
+from functools import lru_cache
+from math import comb, factorial, log2
+from .constructive import Requirement, compile_plan
+from .policies import _SUCCESSOR
+
+# ------------------ Entropia exata ------------------
+
+"""
+Contagem exata de senhas válidas para uma configuração (alfabeto, tamanho, exigências de classe, run_len, unique),
+para que a entropia reportada seja log2(|conjunto válido|) e não length * log2(|alfabeto|).
+- Só exigências de classe: f(r, mask) de ClassPlan (a mesma tabela do modo construtivo), que equivale à
+  inclusão–exclusão sobre as classes.
+- Com NoSequentialPolicy: programação dinâmica sobre um autômato (máscara de classes, próximo caractere da
+  sequência, tamanho da corrida). Um passo custa O(máscaras * alfabeto + estados): as transições "quebram a corrida"
+  saem do total por máscara, e só a transição que continua a corrida é feita estado a estado.
+- unique_chars: sem corridas, subconjuntos válidos * permutações (ClassPlan.unique_count). Com corridas, método de
+  clusters (Goulden–Jackson): a senha é uma sequência de k blocos disjuntos (caractere livre ou trecho da sequência
+  com peso de inclusão–exclusão), contada como conjuntos de blocos * k!.
+Os resultados ficam num lru_cache: depois da primeira chamada, cada consulta custa uma busca no cache.
+Políticas sem modelo de contagem (ex.: BlocklistPolicy) não entram: o valor é um limite superior para elas.
+"""
+
+
+def _mask_of(plan) -> dict[str, int]:
+    return {ch: m for group, m in zip(plan.groups, plan.masks) for ch in group}
+
+
+def _runs_count(masks: dict[str, int], full: int, length: int, run_len: int) -> int:
+    """Tokens com repetição que cobrem full e não têm corrida de run_len passos (mesma regra de _no_runs)."""
+    # estado: (máscara, próximo caractere da corrida ou None, tamanho da corrida)
+    entry = {}
+    for ch, m in masks.items():
+        run = 1 if ch in _SUCCESSOR else 0
+        if run >= run_len:
+            continue  # run_len == 1: qualquer caractere de sequência já é proibido
+        nxt = _SUCCESSOR.get(ch)
+        entry[ch] = (m, (nxt, run) if nxt in masks else (None, 0))
+
+    states: dict[tuple[int, str | None, int], int] = {(0, None, 0): 1}
+    for _ in range(length):
+        total: dict[int, int] = defaultdict(int)
+        expecting: dict[tuple[int, str], int] = defaultdict(int)
+        for (mask, nxt, _run), n in states.items():
+            total[mask] += n
+            if nxt is not None:
+                expecting[mask, nxt] += n
+        new: dict[tuple[int, str | None, int], int] = defaultdict(int)
+        for mask, n in total.items():
+            for ch, (m, tail) in entry.items():
+                base = n - expecting.get((mask, ch), 0)  # quem esperava ch continua a corrida (abaixo)
+                if base:
+                    new[(mask | m, *tail)] += base
+        for (mask, nxt, run), n in states.items():
+            if nxt is None or run + 1 >= run_len:
+                continue
+            after = _SUCCESSOR.get(nxt)
+            tail = (after, run + 1) if after in masks else (None, 0)
+            new[(mask | masks[nxt], *tail)] += n
+        states = new
+    return sum(n for (mask, _, _), n in states.items() if mask == full)
+
+
+def _block_weights(run_len: int, limit: int) -> list[int]:
+    """
+    Peso de um trecho de ℓ caracteres consecutivos da sequência: 1 (caractere livre, ℓ = 1) mais a soma de (-1)^j
+    sobre as coberturas do trecho por j janelas proibidas de run_len caracteres que se sobrepõem em cadeia.
+    """
+    weights = [0] * (limit + 1)
+    if limit >= 1:
+        weights[1] = 1
+    if run_len > limit:
+        return weights
+    # ends[p]: soma assinada das cadeias de janelas que começam em 0 e cuja última janela começa em p
+    ends = [0] * (limit - run_len + 1)
+    ends[0] = -1
+    for p in range(1, len(ends)):
+        ends[p] = -sum(ends[max(0, p - run_len + 1):p])
+    for p, w in enumerate(ends):
+        weights[p + run_len] += w
+    return weights
+
+
+def _unique_runs_count(masks: dict[str, int], full: int, length: int, run_len: int) -> int:
+    """Senhas sem repetição que cobrem full e não têm corrida de run_len passos (método de clusters)."""
+    weights = _block_weights(run_len, length)
+    # trechos maximais da sequência presentes no alfabeto; os demais caracteres só formam blocos de tamanho 1
+    segments: list[list[str]] = []
+    singles: dict[int, int] = defaultdict(int)
+    for ch in masks:
+        if ch in _SUCCESSOR:
+            if any(_SUCCESSOR.get(prev) == ch for prev in masks):
+                continue  # não inicia trecho
+            seg = [ch]
+            while _SUCCESSOR.get(seg[-1]) in masks:
+                seg.append(_SUCCESSOR[seg[-1]])
+            segments.append(seg)
+        else:
+            singles[masks[ch]] += 1
+
+    # estado: (máscara, k blocos, caracteres usados) -> soma dos pesos dos conjuntos de blocos
+    states: dict[tuple[int, int, int], int] = {(0, 0, 0): 1}
+    for m, count in singles.items():
+        new: dict[tuple[int, int, int], int] = defaultdict(int)
+        for (mask, k, used), w in states.items():
+            for j in range(min(count, length - used) + 1):
+                new[(mask | m if j else mask, k + j, used + j)] += w * comb(count, j)
+        states = new
+    for seg in segments:
+        prefix = [states]  # prefix[i]: conjuntos de blocos dentro de seg[:i]
+        for i in range(1, len(seg) + 1):
+            new = defaultdict(int, prefix[i - 1])  # seg[i-1] fora de qualquer bloco
+            block_mask = 0
+            for size in range(1, min(i, length) + 1):
+                block_mask |= masks[seg[i - size]]
+                weight = weights[size]
+                if not weight:
+                    continue
+                for (mask, k, used), w in prefix[i - size].items():
+                    if used + size <= length:
+                        new[(mask | block_mask, k + 1, used + size)] += w * weight
+            prefix.append(new)
+        states = prefix[-1]
+    return sum(w * factorial(k) for (mask, k, used), w in states.items() if mask == full and used == length)
+
+
+@lru_cache(maxsize=1024)
+def count_valid(
+    alphabet: str,
+    length: int,
+    requirements: tuple[Requirement, ...],
+    run_len: int | None = None,
+    unique: bool = False,
+) -> int:
+    """Número exato de senhas de tamanho length sobre alphabet que cumprem as exigências e o limite de corrida."""
+    plan = compile_plan(alphabet, requirements)
+    size = sum(len(g) for g in plan.groups)
+    if length < 0 or (unique and length > size) or (run_len is not None and run_len <= 0):
+        return 0
+    if run_len is None or run_len > length:
+        return plan.unique_count(length) if unique else plan.count(length)
+    if unique:
+        return _unique_runs_count(_mask_of(plan), plan.full, length, run_len)
+    return _runs_count(_mask_of(plan), plan.full, length, run_len)
+
+
+def bits(count: int) -> float:
+    """log2 do número de senhas válidas; 0.0 quando não há nenhuma."""
+    return log2(count) if count > 0 else 0.0
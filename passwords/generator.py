@@ -1,24 +1,38 @@
-import os, string
+import math, os, string, time
 from dataclasses import dataclass, field
-from typing import Iterable
+from typing import TYPE_CHECKING, Iterable, Iterator
 from .contracts import PasswordPolicy, RandomSource
 from .rng import SecretsRandom
-from .policies import BasicPolicy
+from .policies import BasicPolicy, CompiledPoliciesCache
+from .constructive import ClassPlan, compile_plan, requirements_of
+
+if TYPE_CHECKING:  # só para anotações: os módulos são importados quando o recurso é usado (partida rápida do CLI)
+    from .metrics import GenerationMetrics
+    from .template import Template
+    from .uniqueness import DigestSet
 
 # ------------------ Gerador ------------------
 
 @dataclass
-class PasswordGenerator:
+class PasswordGenerator(CompiledPoliciesCache):
     """
     Gerador configurável, com:
     - specials controlado por property (validação + recomposição de alfabeto)
     - políticas plugáveis (Strategy)
     - fonte de aleatoriedade injetável (testabilidade)
+    - modo construtivo opcional (constructive=True): exigências de BasicPolicy satisfeitas sem rejeição
+      (com unique_chars=True, o padrão, o sorteio é sempre construtivo, ver _unique_token e generate)
+    - backend do lote ("python" = referência, "numpy" = vetorizado, ver passwords/vectorized.py)
+    - métricas opcionais por etapa e por política (metrics=GenerationMetrics(), ver passwords/metrics.py)
+    - formatos fixos por posição (generate_from_template, ver passwords/template.py)
     """
     length_min: int = 10
     _specials: str = field(default="!@#$%&*/?", repr=False)  # encapsulado via property
     policies: Iterable[PasswordPolicy] = field(default_factory=lambda: [BasicPolicy()]) # coleção que passa por contrato PasswordPolicy
     rng: RandomSource = field(default_factory=SecretsRandom)
+    constructive: bool = False # sorteio já válido para BasicPolicy (ver passwords/constructive.py)
+    backend: str = "python" # motor de generate_many/iter_generate: "python" ou "numpy" (dependência opcional)
+    metrics: "GenerationMetrics | None" = field(default=None, repr=False) # None = instrumentação desligada
 
     # alfabetos salvos para uso interno (reconstruídos em __post_init__ e setter de specials)
     alphabet_letters: str = field(init=False, repr=False)
@@ -29,6 +43,8 @@ class PasswordGenerator:
         self.alphabet_letters = string.ascii_letters
         self.alphabet_digits  = string.digits
         self._rebuild_alphabet()
+        if self.backend not in ("python", "numpy"):
+            raise ValueError("backend deve ser 'python' ou 'numpy'.")
 
     # ---------- Encapsulamento via property ----------
     @property # O encapsulamento permite validação e reconstrução do alfabeto
@@ -76,21 +92,56 @@ class PasswordGenerator:
         """Entropia aproximada em bits = length * log2(|alfabeto|).
         -> número de bits de entropia, que mede o espaço de busca para ataques de força bruta.
         """
-        import math
         return length * math.log2(alphabet_size)
 
+    # ---------- Entropia exata ----------
+    def valid_count(self, length: int, unique_chars: bool = True) -> int:
+        """
+        Número exato de senhas válidas para as políticas ativas (classes, tamanho mínimo e corridas),
+        memoizado em passwords.entropy.count_valid. Políticas sem modelo de contagem não são consideradas.
+        """
+        from .entropy import count_valid
+        engine = self._policy_engine()
+        if length < engine.min_len:
+            return 0
+        return count_valid(self.alphabet_all, length, requirements_of(self.policies), engine.run_len, unique_chars)
+
+    def exact_entropy_bits(self, length: int, unique_chars: bool = True) -> float:
+        """log2(valid_count): entropia de um sorteio uniforme sobre as senhas que as políticas aceitam."""
+        from .entropy import bits
+        return bits(self.valid_count(length, unique_chars))
+
     # ---------- Núcleo de geração ----------
     # Cria a senha bruta inicial, sorteando aleatoriamente (rng) length caracteres do alfabeto completo.
     def _random_token(self, length: int) -> str:
         return ''.join(self.rng.choice(self.alphabet_all) for _ in range(length))
     
-    # Valida as políticas de segurança. Garante extensibilidade para novas políticas.
-    def _passes_policies(self, pw: str) -> bool:
-        return all(policy.validate(pw) for policy in self.policies)
+    # Modo construtivo: sorteio uniforme sobre as senhas que já cumprem as exigências de classe de BasicPolicy.
+    def _class_plan(self) -> ClassPlan:
+        return compile_plan(self.alphabet_all, requirements_of(self.policies))
+
+    def _constructive_token(self, length: int) -> str:
+        return self._class_plan().draw(self.rng, length)
+
+    # Caracteres únicos: Fisher–Yates parcial por grupo de classe (ver ClassPlan.draw_unique).
+    def _unique_token(self, length: int, shuffle: bool = True) -> str:
+        return self._class_plan().draw_unique(self.rng, length, shuffle)
+
+    def retries_avoided(self, length: int) -> float:
+        """
+        Tentativas extras esperadas por senha que o laço de rejeição gastaria com as exigências de BasicPolicy
+        (1/p - 1, onde p é a fração de tokens uniformes válidos) e que o modo construtivo evita.
+        """
+        p = self._class_plan().acceptance(length)
+        return float("inf") if p == 0 else 1 / p - 1
+
+    # _passes_policies / _policy_engine: motor compilado e memoizado, herdado de CompiledPoliciesCache.
 
     def _deduplicate(self, pw: str) -> str:
         """
         Substitui duplicatas por caracteres ainda não usados.
+        Caminho anterior de unique_chars, mantido como referência (benchmarks/unique_chars.py);
+        generate() usa _unique_token, que já sorteia sem repetição.
         """
         alpha_set = set(self.alphabet_all)
         pw_list   = list(pw)
@@ -127,19 +178,31 @@ class PasswordGenerator:
         max_tries: int = 10000,
         shuffle_final: bool = True,
     ) -> str:
+        """
+        Uma senha de length caracteres.
+        - unique_chars=True (padrão): sem repetição, sorteio sempre construtivo (uniforme sobre as senhas sem
+          repetição que cumprem as classes, a mesma distribuição do laço de rejeição, então constructive não muda o
+          resultado); shuffle_final=False pula o embaralhamento final e a senha sai agrupada por classe.
+        - unique_chars=False: constructive escolhe entre sorteio construtivo e token uniforme + rejeição;
+          shuffle_final embaralha a senha aceita.
+        """
         if length < self.length_min:
             raise ValueError(f"Password length should be at least {self.length_min} characters.")
+        if self.metrics is not None:
+            return self._generate_instrumented(length, unique_chars, max_tries, shuffle_final)
 
         for _ in range(max_tries):
-            pw = self._random_token(length)
-            if not self._passes_policies(pw): # Valida as políticas de segurança
+            if unique_chars:
+                # Sorteio sem reposição já com as classes exigidas e posições embaralhadas:
+                # não há deduplicação nem revalidação pós-deduplicação.
+                pw = self._unique_token(length, shuffle_final)
+                if self._passes_policies(pw):
+                    return pw
                 continue
 
-            if unique_chars:
-                pw = self._deduplicate(pw)
-                # garantia de que a deduplicação não quebrou política
-                if not self._passes_policies(pw):
-                    continue
+            pw = self._constructive_token(length) if self.constructive else self._random_token(length)
+            if not self._passes_policies(pw): # Valida as políticas de segurança
+                continue
 
             if shuffle_final:
                 pw = self._shuffle(pw)
@@ -147,3 +210,216 @@ class PasswordGenerator:
             return pw
 
         raise ValueError("Failed to generate a valid password after maximum attempts.")
+
+    def _generate_instrumented(self, length: int, unique_chars: bool, max_tries: int, shuffle_final: bool) -> str:
+        """Mesmo fluxo de generate(), cronometrando cada etapa e atribuindo as recusas às políticas."""
+        m = self.metrics
+        clock = time.perf_counter
+        if unique_chars:
+            draw, stage = lambda n: self._unique_token(n, shuffle_final), "unique_token"
+        elif self.constructive:
+            draw, stage = self._constructive_token, "constructive_token"
+        else:
+            draw, stage = self._random_token, "random_token"
+
+        for attempt in range(1, max_tries + 1):
+            t0 = clock()
+            pw = draw(length)
+            t1 = clock()
+            ok = self._passes_policies(pw)
+            m.stage(stage, t1 - t0)
+            m.stage("passes_policies", clock() - t1)
+            if not ok:
+                m.reject(self.policies, pw, unique=unique_chars)
+                continue
+
+            if shuffle_final and not unique_chars:
+                t0 = clock()
+                pw = self._shuffle(pw)
+                m.stage("shuffle", clock() - t0)
+
+            m.delivered(attempt)
+            return pw
+
+        m.failures += 1
+        m.attempts += max_tries
+        raise ValueError("Failed to generate a valid password after maximum attempts.")
+
+    # ---------- Geração em lote ----------
+    # Sorteia count tokens de uma vez: com uma fonte que expõe indices(), são poucas leituras grandes de entropia
+    # em vez de uma chamada ao sistema por caractere. Fontes sem indices() caem no _random_token tradicional.
+    def _random_tokens(self, count: int, length: int) -> list[str]:
+        if self.constructive:
+            plan = self._class_plan()
+            return [plan.draw(self.rng, length) for _ in range(count)]
+        bulk = getattr(self.rng, "indices", None)
+        if bulk is None:
+            return [self._random_token(length) for _ in range(count)]
+        alphabet = self.alphabet_all
+        chars = ''.join(map(alphabet.__getitem__, bulk(len(alphabet), count * length)))
+        return [chars[i:i + length] for i in range(0, len(chars), length)]
+
+    # Lote sem repetição: quando um token uniforme costuma já sair sem caracteres repetidos (probabilidade exata
+    # perm(n, length) / n**length, n = alfabeto sem repetidos), os tokens são sorteados em bloco por indices() e os
+    # com repetição descartados. Condicionado a não repetir, o token é uniforme sobre as mesmas senhas de
+    # _unique_token (as classes são conferidas depois, pelas políticas). Senão, _unique_token por senha.
+    _BULK_UNIQUE_MIN = 0.02 # abaixo disso o descarte custa mais que o sorteio por grupos
+
+    def _unique_tokens(self, count: int, length: int, shuffle: bool = True) -> list[str]:
+        if not shuffle: # ordem agrupada por classe: só o sorteio por grupos a produz
+            return [self._unique_token(length, False) for _ in range(count)]
+        bulk = getattr(self.rng, "indices", None)
+        alphabet = ''.join(dict.fromkeys(self.alphabet_all))
+        n = len(alphabet)
+        accept = math.perm(n, length) / n ** length if length <= n else 0.0
+        if bulk is None or accept < self._BULK_UNIQUE_MIN:
+            return [self._unique_token(length) for _ in range(count)]
+        out: list[str] = []
+        while len(out) < count:
+            draws = int((count - len(out)) / accept * 1.1) + 16
+            chars = ''.join(map(alphabet.__getitem__, bulk(n, draws * length)))
+            tokens = (chars[i:i + length] for i in range(0, len(chars), length))
+            out += [pw for pw in tokens if len(set(pw)) == length]
+        return out[:count]
+
+    # Fisher–Yates alimentado por randbelow() do buffer de entropia; mesmo resultado uniforme de _shuffle.
+    def _shuffle_bulk(self, pw: str) -> str:
+        randbelow = getattr(self.rng, "randbelow", None)
+        if randbelow is None:
+            return self._shuffle(pw)
+        buf = list(pw)
+        for i in range(len(buf) - 1, 0, -1):
+            j = randbelow(i + 1)
+            buf[i], buf[j] = buf[j], buf[i]
+        return ''.join(buf)
+
+    def _generate_batch(
+        self,
+        count: int,
+        length: int,
+        unique_chars: bool,
+        max_tries: int,
+        shuffle_final: bool,
+    ) -> list[str]:
+        """
+        Mesmo fluxo de generate() (sorteio -> políticas -> embaralhamento),
+        mas cada rodada sorteia de uma vez apenas os candidatos que ainda faltam.
+        """
+        if self.backend == "numpy" and (shuffle_final or not unique_chars): # ver passwords/vectorized.py
+            from .vectorized import generate_batch  # import tardio: numpy só é exigido por este backend
+            return generate_batch(self, count, length, unique_chars, max_tries, shuffle_final)
+
+        m = self.metrics
+        clock = time.perf_counter
+        accepted: list[str] = []
+        for _ in range(max_tries):
+            missing = count - len(accepted)
+            if not missing:
+                break
+            t0 = clock()
+            if unique_chars:
+                tokens = self._unique_tokens(missing, length, shuffle_final)
+            else:
+                tokens = self._random_tokens(missing, length)
+            t1 = clock()
+            passed = [pw for pw in tokens if self._passes_policies(pw)]
+            t2 = clock()
+            if shuffle_final and not unique_chars:  # o sorteio sem repetição já sai embaralhado
+                passed = [self._shuffle_bulk(pw) for pw in passed]
+            accepted += passed
+
+            if m is not None:  # instrumentação por rodada: custo fora do laço por candidato
+                stage = "unique_token" if unique_chars else "constructive_token" if self.constructive else "random_token"
+                m.stage(stage, t1 - t0, len(tokens))
+                m.stage("passes_policies", t2 - t1, len(tokens))
+                if shuffle_final and not unique_chars:
+                    m.stage("shuffle", clock() - t2, len(passed))
+                m.attempts += len(tokens)
+                m.passwords += len(passed)
+                if len(passed) < len(tokens):
+                    for pw in tokens:
+                        if not self._passes_policies(pw):
+                            m.reject(self.policies, pw, unique=unique_chars)
+
+        if len(accepted) < count:
+            if m is not None:
+                m.failures += 1
+            raise ValueError("Failed to generate a valid password after maximum attempts.")
+        return accepted
+
+    def iter_generate(
+        self,
+        count: int,
+        length: int,
+        unique_chars: bool = True,
+        max_tries: int = 10000,
+        shuffle_final: bool = True,
+        batch_size: int = 4096,
+        guard: "DigestSet | None" = None,
+    ) -> Iterator[str]:
+        """
+        Gera count senhas sob demanda, em lotes de batch_size (memória limitada ao lote).
+        Mesmas políticas, modos (unique_chars, constructive, shuffle_final) e embaralhamento de generate();
+        max_tries vale por lote. Com unique_chars=True (padrão), o ganho sobre generate() em laço vem de
+        _unique_tokens e só existe em tamanhos curtos o bastante para um token uniforme sair sem repetição
+        (até ~20 caracteres no alfabeto padrão); acima disso, cada senha é sorteada como em generate().
+        guard -> senhas já emitidas (nesta ou em execuções anteriores) são regeradas (ver passwords/uniqueness.py).
+        """
+        if length < self.length_min:
+            raise ValueError(f"Password length should be at least {self.length_min} characters.")
+        if count < 0:
+            raise ValueError("count must be non-negative.")
+
+        remaining = count
+        while remaining > 0:
+            size = min(batch_size, remaining)
+            batch = self._generate_batch(size, length, unique_chars, max_tries, shuffle_final)
+            if guard is not None:
+                batch = guard.admit(batch, lambda n: self._generate_batch(n, length, unique_chars, max_tries, shuffle_final))
+            yield from batch
+            remaining -= size
+
+    def generate_many(
+        self,
+        count: int,
+        length: int,
+        unique_chars: bool = True,
+        max_tries: int = 10000,
+        shuffle_final: bool = True,
+        batch_size: int = 4096,
+        guard: "DigestSet | None" = None,
+    ) -> list[str]:
+        """Versão em lista de iter_generate(): count senhas prontas."""
+        return list(self.iter_generate(count, length, unique_chars, max_tries, shuffle_final, batch_size, guard))
+
+    # ---------- Modelos por posição ----------
+    def compile_template(self, template: str) -> "Template":
+        """Modelo compilado sobre os alfabetos atuais (memoizado por modelo e alfabetos em compile_template)."""
+        from .template import compile_template
+        return compile_template(template, self.alphabet_letters, self.alphabet_digits, self._specials)
+
+    def template_entropy_bits(self, template: str) -> float:
+        return self.compile_template(template).exact_entropy_bits()
+
+    def generate_from_template(self, template: str) -> str:
+        """Uma senha no formato do modelo: um sorteio por posição, sem rejeição e sem aplicar as políticas."""
+        return self.compile_template(template).draw(self.rng)
+
+    def generate_many_from_template(
+        self,
+        template: str,
+        count: int,
+        batch_size: int = 4096,
+        guard: "DigestSet | None" = None,
+    ) -> list[str]:
+        """count senhas no formato do modelo, em lotes de batch_size (ver Template.draw_many); guard como em iter_generate."""
+        if count < 0:
+            raise ValueError("count must be non-negative.")
+        compiled = self.compile_template(template)
+        out: list[str] = []
+        while len(out) < count:
+            batch = compiled.draw_many(self.rng, min(batch_size, count - len(out)))
+            if guard is not None:
+                batch = guard.admit(batch, lambda n: compiled.draw_many(self.rng, n))
+            out += batch
+        return out
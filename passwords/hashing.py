@@ -0,0 +1,82 @@
+import hashlib
+import hmac
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Iterable
+
+# ------------------ Hash lento das senhas ------------------
+
+"""
+Etapa de hash para armazenar apenas derivados lentos e salgados das senhas geradas (PBKDF2-HMAC-SHA256 ou scrypt,
+ambos do hashlib).
+- hashlib libera o GIL durante pbkdf2_hmac/scrypt, então um ThreadPoolExecutor escala com os núcleos sem processos.
+- Cada registro guarda hash, salt e a string de parâmetros, permitindo mudar o custo sem invalidar hashes antigos:
+  verify() sempre usa os parâmetros gravados junto do hash.
+"""
+
+@dataclass(frozen=True)
+class HashParams:
+    """Parâmetros de custo. iterations vale para pbkdf2_sha256; n, r e p para scrypt."""
+    algorithm: str = "pbkdf2_sha256" # "pbkdf2_sha256" ou "scrypt"
+    iterations: int = 600_000
+    n: int = 2 ** 14
+    r: int = 8
+    p: int = 1
+    salt_len: int = 16
+    dklen: int = 32
+
+    def __post_init__(self) -> None:
+        if self.algorithm not in ("pbkdf2_sha256", "scrypt"):
+            raise ValueError("algorithm deve ser 'pbkdf2_sha256' ou 'scrypt'.")
+
+    def encode(self) -> str:
+        """Forma textual gravada ao lado do hash, ex.: 'pbkdf2_sha256$i=600000,l=32'."""
+        if self.algorithm == "scrypt":
+            return f"scrypt$n={self.n},r={self.r},p={self.p},l={self.dklen}"
+        return f"pbkdf2_sha256$i={self.iterations},l={self.dklen}"
+
+    @classmethod
+    def decode(cls, text: str) -> "HashParams":
+        algorithm, _, rest = text.partition("$")
+        fields = dict(item.split("=", 1) for item in rest.split(",") if item)
+        if algorithm == "scrypt":
+            return cls(algorithm, n=int(fields["n"]), r=int(fields["r"]), p=int(fields["p"]), dklen=int(fields["l"]))
+        return cls(algorithm, iterations=int(fields["i"]), dklen=int(fields["l"]))
+
+
+@dataclass(frozen=True)
+class HashRecord:
+    hash: bytes
+    salt: bytes
+    params: str # HashParams.encode()
+
+
+def _derive(pw: str, salt: bytes, params: HashParams) -> bytes:
+    data = pw.encode("utf-8")
+    if params.algorithm == "scrypt":
+        # maxmem com folga: o padrão do OpenSSL (32 MiB) recusa n/r maiores
+        maxmem = 128 * params.r * params.n * (params.p + 2)
+        return hashlib.scrypt(data, salt=salt, n=params.n, r=params.r, p=params.p, maxmem=maxmem, dklen=params.dklen)
+    return hashlib.pbkdf2_hmac("sha256", data, salt, params.iterations, params.dklen)
+
+
+def hash_password(pw: str, params: HashParams = HashParams()) -> HashRecord:
+    salt = os.urandom(params.salt_len)
+    return HashRecord(_derive(pw, salt, params), salt, params.encode())
+
+
+def verify(pw: str, record: HashRecord) -> bool:
+    """Recalcula com o salt e os parâmetros gravados; comparação em tempo constante."""
+    candidate = _derive(pw, record.salt, HashParams.decode(record.params))
+    return hmac.compare_digest(candidate, record.hash)
+
+
+def hash_many(passwords: Iterable[str], params: HashParams = HashParams(), workers: int | None = None) -> list[HashRecord]:
+    """Hash de cada senha, na ordem de entrada, distribuído em workers threads (padrão: os.cpu_count())."""
+    passwords = list(passwords)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(passwords) < 2:
+        return [hash_password(pw, params) for pw in passwords]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(hash_password, passwords, [params] * len(passwords)))
@@ -0,0 +1,104 @@
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Iterable
+from .contracts import PasswordPolicy
+
+# ------------------ Instrumentação da geração ------------------
+
+"""
+Métricas opcionais do PasswordGenerator (PasswordGenerator(metrics=GenerationMetrics())).
+- Desligadas (metrics=None), generate() faz uma única checagem de atributo e segue o caminho normal.
+- Ligadas, registram:
+  - tentativas por senha (histograma) e totais;
+  - recusas por classe de política: o motor compilado só diz "passou/não passou", então cada candidato
+    recusado é revalidado política a política para atribuir a recusa (custo só no caminho instrumentado);
+  - tempo e chamadas por etapa: random_token / constructive_token / unique_token, passes_policies, shuffle.
+- snapshot() devolve um dict; to_prometheus() o formato texto de exposição do Prometheus.
+No lote (generate_many) as etapas são cronometradas por rodada e as tentativas entram só nos totais;
+o backend "numpy" não é instrumentado.
+"""
+
+ATTEMPT_BUCKETS = (1, 2, 3, 5, 10, 20, 50, 100, 1000)
+
+
+@dataclass
+class GenerationMetrics:
+    passwords: int = 0 # senhas entregues
+    attempts: int = 0 # candidatos sorteados
+    failures: int = 0 # chamadas que esgotaram max_tries
+    unique_rejections: int = 0 # sorteios sem repetição recusados (substitui a revalidação pós-deduplicação)
+    attempts_hist: Counter = field(default_factory=Counter) # tentativas por senha -> quantidade (só generate())
+    rejections: Counter = field(default_factory=Counter) # classe da política -> recusas
+    stage_seconds: Counter = field(default_factory=Counter)
+    stage_calls: Counter = field(default_factory=Counter)
+
+    # ---------- Registro ----------
+    def stage(self, name: str, seconds: float, calls: int = 1) -> None:
+        self.stage_seconds[name] += seconds
+        self.stage_calls[name] += calls
+
+    def reject(self, policies: Iterable[PasswordPolicy], pw: str, unique: bool = False) -> None:
+        for policy in policies:
+            if not policy.validate(pw):
+                self.rejections[type(policy).__name__] += 1
+        if unique:
+            self.unique_rejections += 1
+
+    def delivered(self, attempts: int) -> None:
+        self.passwords += 1
+        self.attempts += attempts
+        self.attempts_hist[attempts] += 1
+
+    def reset(self) -> None:
+        self.__init__()
+
+    # ---------- Leitura ----------
+    def snapshot(self) -> dict:
+        return {
+            "passwords": self.passwords,
+            "attempts": self.attempts,
+            "attempts_per_password": self.attempts / self.passwords if self.passwords else 0.0,
+            "failures": self.failures,
+            "unique_rejections": self.unique_rejections,
+            "rejections": dict(self.rejections),
+            "attempts_hist": dict(sorted(self.attempts_hist.items())),
+            "stages": {
+                name: {
+                    "calls": self.stage_calls[name],
+                    "seconds": secs,
+                    "us_per_call": secs / self.stage_calls[name] * 1e6 if self.stage_calls[name] else 0.0,
+                }
+                for name, secs in self.stage_seconds.items()
+            },
+        }
+
+    def to_prometheus(self, prefix: str = "pgen") -> str:
+        lines = []
+
+        def metric(name: str, kind: str, help_: str, samples: list[tuple[str, float]]) -> None:
+            lines.append(f"# HELP {prefix}_{name} {help_}")
+            lines.append(f"# TYPE {prefix}_{name} {kind}")
+            lines.extend(f"{prefix}_{name}{labels} {value}" for labels, value in samples)
+
+        metric("passwords_total", "counter", "Passwords delivered.", [("", self.passwords)])
+        metric("attempts_total", "counter", "Candidates drawn.", [("", self.attempts)])
+        metric("failures_total", "counter", "Calls that exhausted max_tries.", [("", self.failures)])
+        metric("unique_rejections_total", "counter", "Unique-character draws rejected by policies.",
+               [("", self.unique_rejections)])
+        metric("policy_rejections_total", "counter", "Candidates rejected, by policy class.",
+               [(f'{{policy="{name}"}}', n) for name, n in sorted(self.rejections.items())])
+        metric("stage_seconds_total", "counter", "Time spent per generation stage.",
+               [(f'{{stage="{name}"}}', s) for name, s in sorted(self.stage_seconds.items())])
+        metric("stage_calls_total", "counter", "Calls per generation stage.",
+               [(f'{{stage="{name}"}}', n) for name, n in sorted(self.stage_calls.items())])
+
+        per_password = sum(self.attempts_hist.values())
+        buckets, cumulative = [], 0
+        for le in ATTEMPT_BUCKETS:
+            cumulative = sum(n for a, n in self.attempts_hist.items() if a <= le)
+            buckets.append((f'_bucket{{le="{le}"}}', cumulative))
+        buckets.append(('_bucket{le="+Inf"}', per_password))
+        buckets.append(("_sum", sum(a * n for a, n in self.attempts_hist.items())))
+        buckets.append(("_count", per_password))
+        metric("attempts_per_password", "histogram", "Attempts needed per generate() call.", buckets)
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,134 @@
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Iterator
+from .generator import PasswordGenerator
+from .rng import BufferedRandom, DeterministicRandom, SecretsRandom
+from .uniqueness import DigestSet
+
+# ------------------ Provisionamento multi-core ------------------
+
+"""
+Divide um pedido de N senhas em fatias [start, stop) processadas por um ProcessPoolExecutor.
+- Cada worker recebe uma cópia (pickle) da configuração do gerador (length_min, specials, policies, constructive,
+  backend), nunca o objeto rng, que não é serializável.
+- Fluxo aleatório independente por fatia: SecretsRandom/BufferedRandom são recriados no worker (os.urandom é
+  independente por processo); DeterministicRandom deriva uma semente filha por fatia, então a execução inteira
+  continua reprodutível para a mesma semente e o mesmo chunk_size.
+- Resultados voltam na ordem de entrada; uma falha vira ProvisioningError com o intervalo de linhas afetado.
+- guard (DigestSet) fica no processo pai: cada fatia é conferida ao chegar e as repetidas são regeradas ali mesmo.
+"""
+
+class ProvisioningError(RuntimeError):
+    """Falha de um worker, com o intervalo de linhas [start, stop) que ele deveria gerar."""
+    def __init__(self, start: int, stop: int, cause: BaseException) -> None:
+        super().__init__(f"Password provisioning failed for rows {start}..{stop - 1}: {cause!r}")
+        self.start = start
+        self.stop = stop
+
+
+@dataclass(frozen=True)
+class _ShardJob:
+    config: dict
+    rng_spec: tuple
+    start: int
+    stop: int
+    length: int
+    unique_chars: bool
+
+
+def _config_of(gen: PasswordGenerator) -> dict:
+    return {
+        "length_min": gen.length_min,
+        "_specials": gen.specials,
+        "policies": list(gen.policies),
+        "constructive": gen.constructive,
+        "backend": gen.backend,
+    }
+
+
+def _rng_spec(gen: PasswordGenerator) -> tuple:
+    rng = gen.rng
+    if isinstance(rng, DeterministicRandom):
+        return ("deterministic", rng.randbytes(32))  # semente filha tirada do fluxo do pai
+    if type(rng) in (SecretsRandom, BufferedRandom):
+        return ("system", type(rng).__name__)
+    raise ValueError("Parallel provisioning supports SecretsRandom, BufferedRandom and DeterministicRandom sources.")
+
+
+def _make_rng(spec: tuple):
+    kind, value = spec
+    if kind == "deterministic":
+        return DeterministicRandom(value)
+    return BufferedRandom(background=False) if value == "BufferedRandom" else SecretsRandom()
+
+
+def _run_shard(job: _ShardJob) -> list[str]:
+    gen = PasswordGenerator(**job.config, rng=_make_rng(job.rng_spec))
+    return gen.generate_many(job.stop - job.start, job.length, job.unique_chars)
+
+
+def iter_provision(
+    gen: PasswordGenerator,
+    count: int,
+    length: int,
+    unique_chars: bool = True,
+    workers: int | None = None,
+    chunk_size: int = 100_000,
+    guard: DigestSet | None = None,
+) -> Iterator[list[str]]:
+    """
+    Gera count senhas em paralelo e devolve, em ordem, uma lista por fatia de chunk_size.
+    No máximo 2 * workers fatias ficam em voo, então a memória não cresce com count.
+    """
+    if length < gen.length_min:
+        raise ValueError(f"Password length should be at least {gen.length_min} characters.")
+    if count < 0 or chunk_size <= 0:
+        raise ValueError("count must be non-negative and chunk_size positive.")
+
+    workers = workers or os.cpu_count() or 1
+    config = _config_of(gen)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        window = 2 * workers
+        pending: deque[tuple[_ShardJob, Future]] = deque()
+        starts = iter(range(0, count, chunk_size))
+
+        def submit() -> bool:
+            start = next(starts, None)
+            if start is None:
+                return False
+            job = _ShardJob(config, _rng_spec(gen), start, min(start + chunk_size, count), length, unique_chars)
+            pending.append((job, pool.submit(_run_shard, job)))
+            return True
+
+        while len(pending) < window and submit():
+            pass
+        while pending:
+            job, future = pending.popleft()
+            try:
+                result = future.result()
+            except Exception as exc:
+                for _, other in pending:
+                    other.cancel()
+                raise ProvisioningError(job.start, job.stop, exc) from exc
+            submit()
+            if guard is not None:
+                result = guard.admit(result, lambda n: gen.generate_many(n, length, unique_chars))
+            yield result
+
+
+def provision(
+    gen: PasswordGenerator,
+    count: int,
+    length: int,
+    unique_chars: bool = True,
+    workers: int | None = None,
+    chunk_size: int = 100_000,
+    guard: DigestSet | None = None,
+) -> list[str]:
+    """Versão em lista de iter_provision(): count senhas, na ordem de entrada."""
+    out: list[str] = []
+    for chunk in iter_provision(gen, count, length, unique_chars, workers, chunk_size, guard):
+        out += chunk
+    return out
@@ -0,0 +1,197 @@
+import math
+import mmap
+import os
+import string
+import struct
+import sys
+from array import array
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable
+from .contracts import PasswordPolicy, RandomSource
+from .rng import SecretsRandom
+from .policies import BasicPolicy, CompiledPoliciesCache
+
+# ------------------ Lista de palavras em arquivo ------------------
+
+"""
+Lista de palavras para frases-senha (estilo diceware), num arquivo indexado por deslocamentos e aberto via mmap.
+- Formato: cabeçalho fixo (_HEADER), n + 1 deslocamentos uint64 (fim da palavra i = início da i + 1) e os bytes
+  UTF-8 das palavras, sem separadores. A palavra i é lida com dois deslocamentos e um recorte: O(1), sem
+  carregar a lista em strings Python; processos diferentes compartilham as páginas pelo cache do sistema,
+  como o filtro de passwords/blocklist.py.
+- As palavras são distintas (o construtor remove repetidas): cada palavra sorteada vale log2(n) bits, desde que
+  nenhuma difira de outra só na caixa nem contenha o separador (ver passphrase_entropy_bits).
+- Gerado offline: python -m passwords.passphrase lista.txt lista.words (aceita o formato "11111<TAB>palavra"
+  das listas diceware: vale o último campo de cada linha).
+"""
+
+_MAGIC = b"PGWORDS1"
+_HEADER = struct.Struct("<8sQ") # magic, n (palavras)
+_OFFSET = struct.Struct("<QQ") # início e fim de uma palavra
+
+
+class WordList:
+    """Sequência somente leitura sobre um arquivo gerado por build_wordlist(): len() e [i] em O(1)."""
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        with open(self.path, "rb") as fh:
+            self._mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self._n = _HEADER.unpack_from(self._mm, 0)
+        if magic != _MAGIC:
+            raise ValueError(f"{self.path} is not a word list file.")
+        self._data = _HEADER.size + 8 * (self._n + 1) # início dos bytes das palavras
+
+    def __len__(self) -> int:
+        return self._n
+
+    def __getitem__(self, i: int) -> str:
+        if i < 0:
+            i += self._n
+        if not 0 <= i < self._n:
+            raise IndexError("word index out of range.")
+        start, end = _OFFSET.unpack_from(self._mm, _HEADER.size + 8 * i)
+        return self._mm[self._data + start:self._data + end].decode("utf-8")
+
+    def close(self) -> None:
+        self._mm.close()
+
+
+@lru_cache(maxsize=None)
+def open_wordlist(path: str) -> WordList:
+    """Um mmap por arquivo e por processo, reaproveitado por todos os geradores que apontam para ele."""
+    return WordList(path)
+
+
+def build_wordlist(words: Iterable[str], path: str | Path) -> int:
+    """
+    Construtor offline: grava em path as palavras distintas (na ordem da primeira ocorrência), de forma atômica
+    (arquivo temporário + os.replace). Palavras vazias ou com espaços são recusadas. Retorna quantas foram gravadas.
+    """
+    offsets = array("Q", [0])
+    data = bytearray()
+    for word in dict.fromkeys(words):
+        if not word or any(ch.isspace() for ch in word):
+            raise ValueError(f"Invalid word {word!r}: words must be non-empty and without whitespace.")
+        data += word.encode("utf-8")
+        offsets.append(len(data))
+    if len(offsets) == 1:
+        raise ValueError("Word list is empty.")
+    if sys.byteorder == "big": # o arquivo é sempre little-endian (_OFFSET)
+        offsets.byteswap()
+    tmp = f"{path}.tmp" # atômico, como build_bloom: quem mantém o arquivo antigo em mmap não vê o truncamento
+    with open(tmp, "wb") as fh:
+        fh.write(_HEADER.pack(_MAGIC, len(offsets) - 1))
+        fh.write(offsets.tobytes())
+        fh.write(data)
+    os.replace(tmp, path)
+    open_wordlist.cache_clear() # uma lista reconstruída no mesmo caminho não deve usar o mmap antigo
+    return len(offsets) - 1
+
+
+def build_wordlist_from_file(wordlist: str | Path, path: str | Path) -> int:
+    """Texto, uma palavra por linha; no formato diceware ("11111<TAB>palavra") vale o último campo."""
+    def words() -> Iterable[str]:
+        with open(wordlist, encoding="utf-8") as fh:
+            for line in fh:
+                fields = line.split()
+                if fields:
+                    yield fields[-1]
+
+    return build_wordlist(words(), path)
+
+# ------------------ Gerador de frases-senha ------------------
+
+@dataclass
+class PassphraseGenerator(CompiledPoliciesCache):
+    """
+    Frases-senha para contas usadas por pessoas, com os mesmos contratos do PasswordGenerator:
+    - words palavras sorteadas uniformemente (com reposição) da WordList, unidas por separator;
+    - capitalize: uma palavra sorteada ganha inicial maiúscula; digits: dígitos sorteados anexados a uma palavra
+      sorteada; specials: um especial sorteado anexado a uma palavra sorteada ("" desliga);
+      maiúscula, dígito e especial de BasicPolicy() vêm dessas inserções, mas a minúscula vem das palavras: com os
+      padrões e uma lista de palavras minúsculas iniciadas por letra (como as listas diceware), a frase cumpre
+      BasicPolicy() já no primeiro sorteio; com outras listas, as recusas ficam a cargo das políticas;
+    - políticas plugáveis (PasswordPolicy) aplicadas por rejeição, como em PasswordGenerator.generate (mesmo motor
+      compilado e memoizado, via CompiledPoliciesCache);
+    - fonte de aleatoriedade injetável (RandomSource): choice() sobre a WordList lê só a palavra sorteada.
+    """
+    wordlist: str | Path # arquivo gerado por build_wordlist
+    words: int = 6
+    separator: str = "-"
+    capitalize: bool = True
+    digits: int = 1
+    specials: str = "!@#$%&*/?"
+    policies: Iterable[PasswordPolicy] = field(default_factory=lambda: [BasicPolicy()])
+    rng: RandomSource = field(default_factory=SecretsRandom)
+
+    def __post_init__(self) -> None:
+        if self.words < 1:
+            raise ValueError("words must be at least 1.")
+        if self.digits < 0:
+            raise ValueError("digits must be non-negative.")
+
+    @property
+    def word_list(self) -> WordList:
+        return open_wordlist(str(self.wordlist))
+
+    # ---------- Entropia ----------
+    @staticmethod
+    def entropy_bits(alphabet_size: int, length: int) -> float:
+        """Mesma fórmula de PasswordGenerator.entropy_bits, com a lista de palavras como alfabeto."""
+        return length * math.log2(alphabet_size)
+
+    def passphrase_entropy_bits(self, words: int | None = None) -> float:
+        """
+        Estimativa da entropia da configuração: palavras (words * log2(len(lista))), dígitos e especial sorteados.
+        As posições escolhidas para maiúscula, dígitos e especial não contam (podem coincidir: palavra repetida,
+        inicial que já é maiúscula). Não é um limite inferior garantido: palavras que diferem só na caixa (a
+        maiúscula as confunde) ou que contêm o separador (frases diferentes viram o mesmo texto) valem menos que
+        log2(len(lista)), e recusas de políticas não são descontadas.
+        """
+        bits = self.entropy_bits(len(self.word_list), self.words if words is None else words)
+        bits += self.entropy_bits(10, self.digits)
+        if self.specials:
+            bits += math.log2(len(set(self.specials)))
+        return bits
+
+    # ---------- Geração ----------
+    def _draw(self, words: int) -> str:
+        choice, word_list = self.rng.choice, self.word_list
+        parts = [choice(word_list) for _ in range(words)]
+        positions = range(words)
+        if self.capitalize:
+            i = choice(positions)
+            parts[i] = parts[i][:1].upper() + parts[i][1:]
+        if self.digits:
+            parts[choice(positions)] += "".join(choice(string.digits) for _ in range(self.digits))
+        if self.specials:
+            parts[choice(positions)] += choice(self.specials)
+        return self.separator.join(parts)
+
+    def generate(self, words: int | None = None, max_tries: int = 10000) -> str:
+        words = self.words if words is None else words
+        if words < 1:
+            raise ValueError("words must be at least 1.")
+        for _ in range(max_tries):
+            pw = self._draw(words)
+            if self._passes_policies(pw):
+                return pw
+        raise ValueError("Failed to generate a valid passphrase after maximum attempts.")
+
+    def generate_many(self, count: int, words: int | None = None, max_tries: int = 10000) -> list[str]:
+        if count < 0:
+            raise ValueError("count must be non-negative.")
+        return [self.generate(words, max_tries) for _ in range(count)]
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Gera o arquivo de palavras indexado usado por PassphraseGenerator.")
+    parser.add_argument("wordlist", help="arquivo texto, uma palavra por linha (ou formato diceware)")
+    parser.add_argument("output", help="arquivo de palavras a gerar")
+    args = parser.parse_args()
+    count = build_wordlist_from_file(args.wordlist, args.output)
+    print(f"{count:,} palavras -> {args.output}")
@@ -1,7 +1,47 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Iterable
 from .contracts import PasswordPolicy
 import string
 
+# ------------------ Estruturas pré-compiladas ------------------
+
+"""
+Tudo que antes era recalculado a cada validate() é montado uma única vez:
+- _ClassTable: caractere -> bits de classe (minúscula, maiúscula, dígito, um bit por conjunto de especiais),
+  preenchida sob demanda, então cada caractere é classificado uma só vez.
+- _SUCCESSOR: caractere -> próximo caractere nas sequências proibidas (string.digits e string.ascii_letters).
+  Uma sequência de run_len caracteres é exatamente uma corrida de run_len passos seguindo essa tabela
+  (inclui as junções "yzA"/"zAB" de ascii_letters, como no conjunto de trincas original).
+"""
+
+_LOWER, _UPPER, _DIGIT = 1, 2, 4
+_SPECIAL = 8  # primeiro bit de especiais; cada conjunto distinto de especiais ocupa um bit a partir daqui
+
+_SUCCESSOR: dict[str, str] = {}
+for _seq in (string.digits, string.ascii_letters):
+    _SUCCESSOR.update(zip(_seq, _seq[1:]))
+    _SUCCESSOR[_seq[-1]] = ""  # último da sequência: inicia corrida, mas não tem sucessor
+
+
+class _ClassTable(dict):
+    def __init__(self, specials: tuple[str, ...]) -> None:
+        super().__init__()
+        self.specials = specials
+
+    def __missing__(self, ch: str) -> int:
+        bits = (_LOWER if ch.islower() else 0) | (_UPPER if ch.isupper() else 0) | (_DIGIT if ch.isdigit() else 0)
+        for i, specials in enumerate(self.specials):
+            if ch in specials:
+                bits |= _SPECIAL << i
+        self[ch] = bits
+        return bits
+
+
+@lru_cache(maxsize=None)
+def _class_table(specials: tuple[str, ...]) -> _ClassTable:
+    return _ClassTable(specials)
+
 # ------------------ Políticas de Segurança ------------------
 
 @dataclass(frozen=True) # Torna a classe imutável
@@ -13,17 +53,27 @@ class BasicPolicy:
     require_special: bool = True # caractere especial
     specials: str = "!@#$%&*/?" # caracteres especiais permitidos
 
+    def required_bits(self, special_bit: int = _SPECIAL) -> int:
+        """Máscara das classes exigidas; special_bit permite combinar várias BasicPolicy numa só tabela."""
+        return (
+            (_LOWER if self.require_lower else 0) |
+            (_UPPER if self.require_upper else 0) |
+            (_DIGIT if self.require_digit else 0) |
+            (special_bit if self.require_special else 0)
+        )
+
     # Método que valida a senha de acordo com as políticas definidas -> conecta ao contrato PasswordPolicy
     def validate(self, pw: str) -> bool: # pw é a senha a ser validada
         """
         É utilizada em PasswordGenerator utilizando policies como BasicPolicy e valida em _passes_policies.
+        Uma única passada pela senha, consultando a tabela de classes pré-compilada.
         """
-        return (
-            (not self.require_lower or any(c.islower() for c in pw)) and
-            (not self.require_upper or any(c.isupper() for c in pw)) and
-            (not self.require_digit or any(c.isdigit() for c in pw)) and
-            (not self.require_special or any(c in self.specials for c in pw))
-        )
+        table = _class_table((self.specials,))
+        seen = 0
+        for ch in pw:
+            seen |= table[ch]
+        need = self.required_bits()
+        return seen & need == need
     
 @dataclass(frozen=True)
 class MinLengthPolicy:
@@ -37,19 +87,129 @@ class NoSequentialPolicy:
     """ Política de não sequenciamento de 3 digitos ou letras."""
     run_len: int = 3
     def validate(self, pw: str) -> bool:
-        numb = string.digits
-        alph = string.ascii_letters
-        
-        forbidden = []
-
-        for i in range(len(numb) - self.run_len + 1):
-            forbidden.append(numb[i:i+self.run_len]) # Percorre trincas da string
-
-        for i in range(len(alph) - self.run_len + 1): 
-            forbidden.append(alph[i:i+self.run_len]) # Percorre trincas da string
-
-        for seq in forbidden:
-            if seq in pw:
-                return False
-        
-        return True
\ No newline at end of file
+        return _no_runs(pw, self.run_len)
+
+
+@dataclass(frozen=True)
+class BlocklistPolicy:
+    """
+    Recusa senhas presentes numa lista de vazadas/comuns, consultando um filtro de Bloom em arquivo (mmap).
+    O filtro é gerado offline: python -m passwords.blocklist lista.txt lista.bloom --fp-rate 0.001
+    """
+    path: str # arquivo gerado por passwords.blocklist.build_bloom
+    def validate(self, pw: str) -> bool:
+        from .blocklist import open_bloom # import tardio: permite rodar python -m passwords.blocklist sem aviso do runpy
+        return pw not in open_bloom(self.path)
+
+
+def _no_runs(pw: str, run_len: int) -> bool:
+    """Detector de corridas em O(len(pw)): conta passos consecutivos pela tabela _SUCCESSOR."""
+    if run_len <= 0:
+        return False  # a substring vazia está em qualquer senha (mesmo resultado da busca por substrings)
+    run, expected = 0, None
+    for ch in pw:
+        if ch == expected:
+            run += 1
+        elif ch in _SUCCESSOR:
+            run = 1
+        else:
+            run = 0
+        if run >= run_len:
+            return False
+        expected = _SUCCESSOR.get(ch)
+    return True
+
+# ------------------ Motor compilado ------------------
+
+@dataclass(frozen=True)
+class CompiledPolicies:
+    """
+    Conjunto de políticas fundido numa única passada pela senha (O(len), independente do número de políticas):
+    - MinLengthPolicy -> maior min_len
+    - BasicPolicy -> união das máscaras de classe exigidas
+    - NoSequentialPolicy -> menor run_len (a mais restritiva implica as demais)
+    Políticas desconhecidas (ou subclasses) continuam sendo chamadas via validate().
+    """
+    min_len: int
+    required: int
+    run_len: int | None
+    table: _ClassTable
+    others: tuple[PasswordPolicy, ...]
+    sources: tuple[PasswordPolicy, ...]  # mantém as políticas originais vivas (chave por id no gerador)
+
+    def validate(self, pw: str) -> bool:
+        if len(pw) < self.min_len:
+            return False
+        table, run_len = self.table, self.run_len
+        seen = 0
+        if run_len is None:
+            for ch in pw:
+                seen |= table[ch]
+        elif run_len <= 0:
+            return False
+        else:
+            run, expected = 0, None
+            for ch in pw:
+                seen |= table[ch]
+                if ch == expected:
+                    run += 1
+                elif ch in _SUCCESSOR:
+                    run = 1
+                else:
+                    run = 0
+                if run >= run_len:
+                    return False
+                expected = _SUCCESSOR.get(ch)
+        if seen & self.required != self.required:
+            return False
+        return all(policy.validate(pw) for policy in self.others)
+
+
+def compile_policies(policies: Iterable[PasswordPolicy]) -> CompiledPolicies:
+    sources = tuple(policies)
+    min_len, run_len = 0, None
+    specials: list[str] = []
+    required = 0
+    others = []
+    for policy in sources:
+        kind = type(policy)
+        if kind is MinLengthPolicy:
+            min_len = max(min_len, policy.min_len)
+        elif kind is NoSequentialPolicy:
+            run_len = policy.run_len if run_len is None else min(run_len, policy.run_len)
+        elif kind is BasicPolicy:
+            if policy.specials not in specials:
+                specials.append(policy.specials)
+            required |= policy.required_bits(_SPECIAL << specials.index(policy.specials))
+        else:
+            others.append(policy)
+    return CompiledPolicies(
+        min_len=min_len,
+        required=required,
+        run_len=run_len,
+        table=_class_table(tuple(specials)),
+        others=tuple(others),
+        sources=sources,
+    )
+
+
+@dataclass
+class CompiledPoliciesCache:
+    """
+    Base dos geradores com coleção policies (PasswordGenerator, PassphraseGenerator): compila as políticas uma vez
+    e recompila só quando a coleção muda (chave pela identidade dos objetos, mantidos vivos em sources).
+    """
+    _engine: CompiledPolicies | None = field(default=None, init=False, repr=False, compare=False)
+    _engine_key: tuple[int, ...] = field(default=(), init=False, repr=False, compare=False)
+
+    def _policy_engine(self) -> CompiledPolicies:
+        key = tuple(map(id, self.policies))
+        if self._engine is None or key != self._engine_key:
+            self._engine = compile_policies(self.policies)
+            self._engine_key = key
+        return self._engine
+
+    # Valida as políticas de segurança. Garante extensibilidade para novas políticas.
+    # Todas as políticas são fundidas num motor compilado que percorre a senha uma única vez.
+    def _passes_policies(self, pw: str) -> bool:
+        return self._policy_engine().validate(pw)
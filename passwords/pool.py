@@ -0,0 +1,262 @@
+import asyncio
+import json
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Iterable
+from .contracts import PasswordPolicy
+from .generator import PasswordGenerator
+from .policies import BasicPolicy, MinLengthPolicy, NoSequentialPolicy
+
+# ------------------ Pool assíncrono de senhas prontas ------------------
+
+"""
+Senhas geradas antes de serem pedidas, para que a latência de um pedido seja apenas retirar um item da fila.
+- PasswordPool: fila limitada (high_water) reabastecida em segundo plano quando cai abaixo de low_water.
+  O lote é gerado por generate_many numa thread (run_in_executor), fora do event loop. Se o lote falhar, a tarefa de
+  reabastecimento termina com a exceção, quem espera recebe ValueError e o próximo get() reinicia a tarefa.
+- PoolManager: um pool por configuração (length, specials, policies, unique_chars), criado sob demanda depois de
+  validar a configuração; no máximo max_pools, descartando o usado há mais tempo.
+- serve(): servidor asyncio local (TCP ou socket Unix) com protocolo de linhas:
+    "<length> [specials]\\n" -> "<senha>\\n"
+    "STATS\\n"               -> JSON com acertos/faltas e latência de reabastecimento por pool
+"""
+
+@dataclass
+class PoolStats:
+    hits: int = 0 # pedidos atendidos direto da fila
+    misses: int = 0 # pedidos que precisaram esperar um reabastecimento
+    refills: int = 0
+    generated: int = 0
+    refill_seconds: deque = field(default_factory=lambda: deque(maxlen=1024)) # últimas durações de lote
+
+    def snapshot(self) -> dict:
+        times = sorted(self.refill_seconds)
+        def pct(q: float) -> float:
+            return times[min(len(times) - 1, int(q * len(times)))] * 1000 if times else 0.0
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / (self.hits + self.misses) if self.hits + self.misses else 0.0,
+            "refills": self.refills,
+            "generated": self.generated,
+            "refill_ms_p50": pct(0.50),
+            "refill_ms_p99": pct(0.99),
+            "refill_ms_max": times[-1] * 1000 if times else 0.0,
+        }
+
+
+class PasswordPool:
+    def __init__(
+        self,
+        gen: PasswordGenerator,
+        length: int,
+        unique_chars: bool = True,
+        high_water: int = 1024,
+        low_water: int | None = None,
+        batch_size: int = 256,
+    ) -> None:
+        if length < gen.length_min:
+            raise ValueError(f"Password length should be at least {gen.length_min} characters.")
+        self.gen = gen
+        self.length = length
+        self.unique_chars = unique_chars
+        self.high_water = high_water
+        self.low_water = high_water // 4 if low_water is None else low_water
+        self.batch_size = batch_size
+        self.stats = PoolStats()
+        self._queue: asyncio.Queue[str] = asyncio.Queue(maxsize=high_water)
+        self._wake = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    # ---------- Ciclo de vida ----------
+    def start(self) -> None:
+        """Inicia o reabastecimento (precisa de um event loop em execução)."""
+        if self._task is None:
+            self._wake.set()
+            self._task = asyncio.get_running_loop().create_task(self._refill_loop())
+
+    def stop(self) -> None:
+        """Cancela o reabastecimento sem esperar por ele (close() é a versão que espera)."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def close(self) -> None:
+        task = self._task
+        self.stop()
+        if task is not None:
+            try:
+                await task
+            except (asyncio.CancelledError, Exception): # Exception: falha de reabastecimento que ninguém esperou
+                pass
+
+    async def _refill_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            await self._wake.wait()
+            self._wake.clear()
+            while self._queue.qsize() < self.high_water:
+                size = min(self.batch_size, self.high_water - self._queue.qsize())
+                start = time.perf_counter()
+                batch = await loop.run_in_executor(
+                    None, self.gen.generate_many, size, self.length, self.unique_chars
+                )
+                self.stats.refill_seconds.append(time.perf_counter() - start)
+                self.stats.refills += 1
+                self.stats.generated += len(batch)
+                for pw in batch:
+                    self._queue.put_nowait(pw) # cabe: size nunca passa do espaço livre (só este laço insere)
+
+    def _refill_error(self, task: asyncio.Task) -> ValueError:
+        """Erro entregue a quem esperava pela tarefa encerrada; a tarefa é descartada para que get() a reinicie."""
+        if self._task is task:
+            self._task = None
+        if task.cancelled():
+            return ValueError("Password pool was closed.")
+        exc = task.exception()
+        if isinstance(exc, ValueError):
+            return exc
+        error = ValueError(f"Password pool refill failed: {exc!r}")
+        error.__cause__ = exc
+        return error
+
+    async def _next(self) -> str:
+        """Próxima senha da fila, ou o erro da tarefa de reabastecimento se ela terminar antes."""
+        task = self._task
+        getter = asyncio.ensure_future(self._queue.get())
+        await asyncio.wait((getter, task), return_when=asyncio.FIRST_COMPLETED)
+        if getter.done():
+            return getter.result()
+        getter.cancel()
+        raise self._refill_error(task)
+
+    # ---------- API ----------
+    async def get(self) -> str:
+        self.start()
+        if self._queue.empty():
+            self.stats.misses += 1
+            self._wake.set()
+            pw = await self._next()
+        else:
+            self.stats.hits += 1
+            pw = self._queue.get_nowait()
+        if self._queue.qsize() < self.low_water:
+            self._wake.set()
+        return pw
+
+    def __len__(self) -> int:
+        return self._queue.qsize()
+
+
+PoolKey = tuple[int, str, tuple[PasswordPolicy, ...], bool]
+
+class PoolManager:
+    """
+    Um PasswordPool por configuração de gerador; pools são criados no primeiro pedido, depois de validar specials
+    (setter do gerador), o tamanho mínimo e se as exigências de classe das políticas são satisfazíveis.
+    Cada pool mantém até high_water senhas em memória: acima de max_pools, o usado há mais tempo é descartado.
+    """
+    def __init__(
+        self,
+        policies: Iterable[PasswordPolicy] | None = None,
+        high_water: int = 1024,
+        batch_size: int = 256,
+        max_pools: int = 64,
+    ) -> None:
+        if max_pools < 1:
+            raise ValueError("max_pools must be at least 1.")
+        self.policies = tuple(policies) if policies is not None else (BasicPolicy(), MinLengthPolicy(), NoSequentialPolicy())
+        self.high_water = high_water
+        self.batch_size = batch_size
+        self.max_pools = max_pools
+        self._pools: dict[PoolKey, PasswordPool] = {} # ordem de uso: o primeiro é o usado há mais tempo
+
+    def pool(
+        self,
+        length: int,
+        specials: str = "!@#$%&*/?",
+        policies: Iterable[PasswordPolicy] | None = None,
+        unique_chars: bool = True,
+    ) -> PasswordPool:
+        key: PoolKey = (length, specials, tuple(policies) if policies is not None else self.policies, unique_chars)
+        pool = self._pools.pop(key, None)
+        if pool is None:
+            gen = PasswordGenerator(policies=list(key[2]))
+            gen.specials = specials # pelo setter: valida e reconstrói o alfabeto
+            pool = PasswordPool(gen, length, unique_chars, self.high_water, batch_size=self.batch_size)
+            if unique_chars and length > len(gen.alphabet_all):
+                raise ValueError("unique_chars requires length <= alphabet size.")
+            plan = gen._class_plan()
+            if (plan.unique_count(length) if unique_chars else plan.count(length)) == 0:
+                raise ValueError("Policies cannot be satisfied with this alphabet and length.")
+            if len(self._pools) >= self.max_pools:
+                oldest = next(iter(self._pools))
+                self._pools.pop(oldest).stop()
+        self._pools[key] = pool
+        return pool
+
+    async def get(self, length: int, specials: str = "!@#$%&*/?", unique_chars: bool = True) -> str:
+        return await self.pool(length, specials, unique_chars=unique_chars).get()
+
+    def stats(self) -> dict[str, dict]:
+        return {
+            f"length={length} specials={specials} unique={unique} policies=[{', '.join(map(repr, policies))}]":
+                pool.stats.snapshot()
+            for (length, specials, policies, unique), pool in self._pools.items()
+        }
+
+    async def close(self) -> None:
+        for pool in self._pools.values():
+            await pool.close()
+
+# ------------------ Servidor local ------------------
+
+async def _handle(manager: PoolManager, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    try:
+        while line := await reader.readline():
+            try: # UnicodeDecodeError também é ValueError: linha não UTF-8 responde ERROR sem derrubar a conexão
+                parts = line.decode("utf-8").split()
+                if not parts:
+                    continue
+                if parts[0].upper() == "STATS":
+                    reply = json.dumps(manager.stats())
+                else:
+                    reply = await manager.get(int(parts[0]), *parts[1:2])
+            except ValueError as exc:
+                reply = f"ERROR {exc}"
+            writer.write(reply.encode("utf-8") + b"\n")
+            await writer.drain()
+    finally:
+        writer.close()
+
+
+async def serve(manager: PoolManager, host: str = "127.0.0.1", port: int = 8765, unix_path: str | None = None) -> None:
+    """Atende até ser cancelado; unix_path tem prioridade sobre host/port."""
+    def handler(r: asyncio.StreamReader, w: asyncio.StreamWriter):
+        return _handle(manager, r, w)
+
+    if unix_path is not None:
+        server = await asyncio.start_unix_server(handler, path=unix_path)
+    else:
+        server = await asyncio.start_server(handler, host, port)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await manager.close()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Servidor local de senhas pré-geradas.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", default=None, help="caminho de socket Unix (em vez de TCP)")
+    parser.add_argument("--high-water", type=int, default=1024)
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(PoolManager(high_water=args.high_water), args.host, args.port, args.unix))
+    except KeyboardInterrupt:
+        pass
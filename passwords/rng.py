@@ -1,4 +1,7 @@
-import secrets
+import os
+import weakref
+from abc import ABC, abstractmethod
+from random import SystemRandom  # a mesma classe exposta por secrets.SystemRandom, sem importar secrets/hmac
 from typing import Sequence
 from .contracts import RandomSource
 
@@ -9,12 +12,267 @@ Implementação do contrato de aleatoriedade definido em RandomSource.
 1) A senha inicial é gerada com _random_token() dentro de PasswordGenerator, atribuindo RandomSource com SecretsRandom a
 partir do alfabeto completo em _rebuild_alphabet().
 2) Em seguida, o método _shuffle() utiliza o método shuffle() do SecretsRandom para embaralhar a senha.
+3) Para geração em lote (generate_many), indices() e randbelow() consomem um buffer de entropia lido em blocos
+grandes, evitando uma chamada ao sistema por caractere.
+
+Fontes disponíveis (todas cumprem BulkRandomSource):
+- SecretsRandom: padrão; choice/shuffle via SystemRandom (os.urandom) e buffer de os.urandom para o lote.
+- BufferedRandom: CSPRNG com buffer pré-carregado, opcionalmente reabastecido por uma thread em segundo plano.
+- DeterministicRandom: HMAC-DRBG (SHA-256) semeado, reprodutível -> apenas para testes de carga, nunca produção.
+Fontes do sistema (SecretsRandom, BufferedRandom) nunca compartilham entropia já lida: o buffer é descartado no
+processo filho após um fork (os.register_at_fork) e não entra no pickle; DeterministicRandom é copiada com o estado,
+como qualquer gerador semeado.
 """
 
-class SecretsRandom:
-    def __init__(self) -> None:
-        self._rng = secrets.SystemRandom()
+_SYSTEM_SOURCES: "weakref.WeakSet[_ByteStreamRandom]" = weakref.WeakSet() # instâncias a reiniciar após fork
+
+
+def _after_fork_in_child() -> None:
+    for source in list(_SYSTEM_SOURCES):
+        source._after_fork()
+
+
+if hasattr(os, "register_at_fork"): # POSIX
+    os.register_at_fork(after_in_child=_after_fork_in_child)
+
+class _ByteStreamRandom(ABC):
+    """
+    Base comum: transforma um fluxo de bytes (_fill) em sorteios uniformes sem viés.
+    As subclasses só decidem de onde vêm os bytes.
+    """
+    def __init__(self, buffer_size: int = 4096) -> None:
+        self._buffer_size = buffer_size
+        self._pool = b""  # entropia já lida e ainda não consumida
+        self._pos = 0
+
+    @abstractmethod
+    def _fill(self, n: int) -> bytes:
+        """n bytes novos da fonte."""
+
+    def _drop_buffer(self) -> None:
+        self._pool = b""
+        self._pos = 0
+
+    def _after_fork(self) -> None:
+        """No processo filho: pai e filho não podem sortear a partir dos mesmos bytes."""
+        self._drop_buffer()
+
+    # ---------- Entropia em bloco ----------
+    def _take(self, n: int) -> bytes:
+        """Retorna n bytes do buffer, relendo a fonte em blocos de pelo menos buffer_size."""
+        end = self._pos + n
+        if end > len(self._pool):
+            rest = self._pool[self._pos:]
+            self._pool = rest + self._fill(max(n - len(rest), self._buffer_size))
+            self._pos, end = 0, n
+        out = self._pool[self._pos:end]
+        self._pos = end
+        return out
+
+    def randbelow(self, n: int) -> int:
+        """Inteiro uniforme em [0, n) por amostragem com rejeição sobre o buffer."""
+        if n <= 0:
+            raise ValueError("randbelow requires a positive upper bound.")
+        nbytes = max(1, ((n - 1).bit_length() + 7) // 8)
+        span = 1 << (8 * nbytes)
+        limit = span - span % n  # valores >= limit introduziriam viés no módulo
+        while True:
+            v = int.from_bytes(self._take(nbytes), "big")
+            if v < limit:
+                return v % n
+
+    def randbytes(self, n: int) -> bytes:
+        """n bytes aleatórios do buffer (matéria-prima para sorteios vetorizados)."""
+        return self._take(n)
+
+    def index_bytes(self, k: int, count: int) -> bytes:
+        """Igual a indices(), mas devolve os índices como bytes (k <= 256), sem criar objetos int."""
+        if not 0 < k <= 256:
+            raise ValueError("index_bytes requires an alphabet size between 1 and 256.")
+        limit = 256 - 256 % k
+        table = bytes(b % k for b in range(256))
+        rejected = bytes(range(limit, 256))
+        out = bytearray()
+        while len(out) < count:
+            need = count - len(out)
+            # sobra proporcional à taxa de rejeição para quase sempre resolver em uma leitura
+            raw = self._take(need * 256 // limit + 16)
+            out += raw.translate(table, rejected)
+        return bytes(out[:count])
+
+    def indices(self, k: int, count: int) -> list[int]:
+        """
+        Sorteia count índices uniformes em [0, k) com poucas leituras grandes de entropia.
+        - k <= 256: cada byte vira um índice; bytes >= limite são descartados (rejeição sem viés),
+          e o descarte e o módulo são feitos em C por bytes.translate.
+        - k > 256: cai em randbelow() para cada índice (ainda sem syscall por sorteio).
+        """
+        if k <= 0:
+            raise ValueError("indices requires a positive alphabet size.")
+        if k > 256:
+            return [self.randbelow(k) for _ in range(count)]
+        return list(self.index_bytes(k, count))
+
+    def choice(self, seq: Sequence[str]) -> str:
+        if not seq:
+            raise IndexError("Cannot choose from an empty sequence.")
+        return seq[self.randbelow(len(seq))]
+
+    def shuffle(self, x: list[str]) -> None:
+        for i in range(len(x) - 1, 0, -1):  # Fisher–Yates
+            j = self.randbelow(i + 1)
+            x[i], x[j] = x[j], x[i]
+
+    def sample(self, seq: Sequence[str], k: int) -> list[str]:
+        """k elementos distintos (por posição) de seq, via Fisher–Yates parcial."""
+        pool = list(seq)
+        n = len(pool)
+        if not 0 <= k <= n:
+            raise ValueError("Sample larger than population or is negative.")
+        for i in range(k):
+            j = i + self.randbelow(n - i)
+            pool[i], pool[j] = pool[j], pool[i]
+        return pool[:k]
+
+
+class SecretsRandom(_ByteStreamRandom):
+    def __init__(self, buffer_size: int = 4096) -> None:
+        super().__init__(buffer_size)
+        self._rng = SystemRandom()
+        _SYSTEM_SOURCES.add(self)
+
+    def __getstate__(self) -> dict:
+        """Pickle sem o buffer de entropia (nem o SystemRandom, que não tem estado): a cópia lê o próprio os.urandom."""
+        return {"buffer_size": self._buffer_size}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(state["buffer_size"])
+
+    def _fill(self, n: int) -> bytes:
+        return os.urandom(n)
+
     def choice(self, seq: Sequence[str]) -> str:
         return self._rng.choice(seq)
+
     def shuffle(self, x: list[str]) -> None:
         self._rng.shuffle(x)
+
+
+class BufferedRandom(_ByteStreamRandom):
+    """
+    CSPRNG (os.urandom) com buffer grande pré-carregado.
+    - background=True: uma thread daemon mantém até `prefetch` blocos prontos numa fila, então o consumo
+      raramente espera pela leitura do sistema.
+    - Cada instância deve ser usada por uma única thread consumidora; crie uma por worker.
+    - A thread termina em close() (ou ao sair do with); se a instância for descartada sem close(), um
+      weakref.finalize a encerra na coleta. Depois de close(), os blocos já prontos são consumidos e o restante
+      vem direto de os.urandom.
+    - Após um fork, o filho descarta buffer e fila herdados e recria a própria thread (ver _after_fork).
+    """
+    def __init__(self, buffer_size: int = 1 << 16, background: bool = True, prefetch: int = 2) -> None:
+        super().__init__(buffer_size)
+        self._blocks: "queue.Queue[bytes] | None" = None
+        self._prefetch = prefetch
+        self._closed = False
+        self._restart = False # filho de um fork: recriar a thread no próximo _fill
+        if background:
+            self._start()
+        _SYSTEM_SOURCES.add(self)
+
+    def _start(self) -> None:
+        import queue, threading  # import tardio: só esta fonte usa threads (partida rápida do CLI)
+        self._blocks = queue.Queue(maxsize=self._prefetch)
+        self._stop = threading.Event()
+        # a thread não guarda referência à instância: senão ela nunca seria coletada
+        self._worker = threading.Thread(
+            target=_refill_loop, args=(self._blocks, self._stop, self._buffer_size), name="BufferedRandom", daemon=True
+        )
+        self._worker.start()
+        weakref.finalize(self, self._stop.set)
+
+    def _after_fork(self) -> None:
+        """
+        No filho, a thread de reabastecimento não existe e a fila (com travas possivelmente tomadas por ela no
+        instante do fork) guarda blocos que o pai também vai consumir: buffer e fila são descartados e a thread é
+        recriada no primeiro _fill (não dentro do gancho de fork, antes de threading se refazer no filho).
+        """
+        self._drop_buffer()
+        if self._blocks is not None:
+            self._blocks = None # fechada: o restante vem direto de os.urandom, como depois de close()
+            self._restart = not self._closed
+
+    def _fill(self, n: int) -> bytes:
+        if self._restart:
+            self._restart = False
+            self._start()
+        if self._blocks is None or n > self._buffer_size:
+            return os.urandom(n)
+        if self._closed: # fechada: a thread não repõe mais, get() bloquearia para sempre
+            import queue
+            try:
+                return self._blocks.get_nowait()
+            except queue.Empty:
+                return os.urandom(n)
+        return self._blocks.get()
+
+    def close(self) -> None:
+        """Encerra a thread de reabastecimento (se houver); a instância continua utilizável."""
+        self._closed = True
+        if self._blocks is not None:
+            self._stop.set()
+
+    def __enter__(self) -> "BufferedRandom":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+def _refill_loop(blocks, stop, size: int) -> None:
+    import queue
+    while not stop.is_set():
+        block = os.urandom(size)
+        while not stop.is_set():
+            try:
+                blocks.put(block, timeout=0.1)
+                break
+            except queue.Full:
+                continue
+
+
+class DeterministicRandom(_ByteStreamRandom):
+    """
+    HMAC-DRBG (NIST SP 800-90A, SHA-256, sem reseed/entrada adicional) construído sobre hmac/hashlib.
+    Mesma semente -> mesma sequência de senhas: útil para testes de carga reprodutíveis.
+    Não use para senhas reais.
+    """
+    def __init__(self, seed: bytes | str | int, buffer_size: int = 4096) -> None:
+        import hashlib, hmac  # import tardio: o OpenSSL só é carregado por quem usa esta fonte
+        super().__init__(buffer_size)
+        self._new, self._digestmod = hmac.new, hashlib.sha256
+        if isinstance(seed, int):
+            seed = seed.to_bytes(max(1, (seed.bit_length() + 7) // 8), "big", signed=False)
+        elif isinstance(seed, str):
+            seed = seed.encode("utf-8")
+        self._key = b"\x00" * 32
+        self._v = b"\x01" * 32
+        self._update(seed)
+
+    def _hmac(self, data: bytes) -> bytes:
+        return self._new(self._key, data, self._digestmod).digest()
+
+    def _update(self, provided: bytes = b"") -> None:
+        self._key = self._hmac(self._v + b"\x00" + provided)
+        self._v = self._hmac(self._v)
+        if provided:
+            self._key = self._hmac(self._v + b"\x01" + provided)
+            self._v = self._hmac(self._v)
+
+    def _fill(self, n: int) -> bytes:
+        out = bytearray()
+        while len(out) < n:
+            self._v = self._hmac(self._v)
+            out += self._v
+        self._update()
+        return bytes(out[:n])
+
@@ -0,0 +1,108 @@
+import math
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from .contracts import RandomSource
+
+# ------------------ Modelos por posição ------------------
+
+"""
+Mini-linguagem para formatos fixos exigidos por sistemas externos, compilada uma vez em tabelas por posição:
+  l minúscula | u maiúscula | a letra | d dígito | x letra ou dígito | s especial | * qualquer do alfabeto
+  [abc] um dos caracteres listados | \\c o caractere c literal | {n} após qualquer item: n posições iguais
+  espaços são ignorados (legibilidade); espaço literal: "\\ ".
+Ex.: "u{2} x{6} s d{3}" -> 2 maiúsculas, 6 alfanuméricos, 1 especial, 3 dígitos (12 caracteres).
+As classes vêm de alphabet_letters, alphabet_digits e specials do gerador. Cada posição vira um alfabeto próprio
+(e uma tabela bytes.translate quando cabe em latin-1): gerar é um sorteio indexado por posição, sem rejeição.
+O formato é a regra: as políticas do gerador não são aplicadas às senhas de um modelo.
+"""
+
+_TOKEN = re.compile(r"\s*(?:(?P<cls>[luadxs*])|\[(?P<set>[^\]]*)\]|\\(?P<lit>.))(?:\{(?P<rep>\d+)\})?\s*", re.S)
+
+
+@dataclass(frozen=True)
+class Template:
+    """Modelo compilado: positions[i] é o alfabeto (sem repetições) da posição i."""
+    source: str
+    positions: tuple[str, ...]
+
+    @property
+    def length(self) -> int:
+        return len(self.positions)
+
+    def valid_count(self) -> int:
+        """Número exato de senhas que o modelo produz (produto dos tamanhos dos alfabetos)."""
+        return math.prod(map(len, self.positions))
+
+    def exact_entropy_bits(self) -> float:
+        """log2(valid_count): cada posição é um sorteio uniforme e independente."""
+        return sum(math.log2(len(alpha)) for alpha in self.positions)
+
+    def draw(self, rng: RandomSource) -> str:
+        return "".join(alpha if len(alpha) == 1 else rng.choice(alpha) for alpha in self.positions)
+
+    def draw_many(self, rng: RandomSource, count: int) -> list[str]:
+        """
+        count senhas: uma coluna por posição, sorteada de uma vez (index_bytes + translate pela tabela da posição,
+        ou indices()) e transposta. Fontes sem sorteio em lote caem em draw().
+        """
+        if getattr(rng, "index_bytes", None) is None:
+            return [self.draw(rng) for _ in range(count)]
+        columns = [_column(rng, alpha, count) for alpha in self.positions]
+        return list(map("".join, zip(*columns)))
+
+
+@lru_cache(maxsize=None)
+def _table(alpha: str) -> bytes | None:
+    """Tabela de translate índice -> caractere; None quando o alfabeto não cabe num byte por índice e caractere."""
+    if len(alpha) > 256:
+        return None
+    try:
+        return alpha.encode("latin-1").ljust(256, b"\0")
+    except UnicodeEncodeError:
+        return None
+
+
+def _column(rng, alpha: str, count: int) -> str:
+    if len(alpha) == 1:
+        return alpha * count
+    table = _table(alpha)
+    if table is not None:
+        return rng.index_bytes(len(alpha), count).translate(table).decode("latin-1")
+    return "".join(map(alpha.__getitem__, rng.indices(len(alpha), count)))
+
+
+@lru_cache(maxsize=256)
+def compile_template(template: str, letters: str, digits: str, specials: str) -> Template:
+    """Compila (e memoiza por modelo e alfabetos) a mini-linguagem em um alfabeto por posição."""
+    classes = {
+        "l": "".join(ch for ch in letters if ch.islower()),
+        "u": "".join(ch for ch in letters if ch.isupper()),
+        "a": letters,
+        "d": digits,
+        "x": letters + digits,
+        "s": specials,
+        "*": letters + digits + specials,
+    }
+    positions: list[str] = []
+    pos = 0
+    while pos < len(template):
+        match = _TOKEN.match(template, pos)
+        if match is None or match.end() == pos:
+            if template[pos:].strip() == "":
+                break
+            raise ValueError(f"Invalid template at position {pos}: {template[pos:pos + 10]!r}.")
+        if match["cls"] is not None:
+            alpha = classes[match["cls"]]
+        elif match["set"] is not None:
+            alpha = match["set"]
+        else:
+            alpha = match["lit"]
+        alpha = "".join(dict.fromkeys(alpha)) # repetidos dariam peso maior a um caractere
+        if not alpha:
+            raise ValueError(f"Empty character class at position {pos} of template {template!r}.")
+        positions += [alpha] * (int(match["rep"]) if match["rep"] is not None else 1)
+        pos = match.end()
+    if not positions:
+        raise ValueError("Template must produce at least one character.")
+    return Template(template, tuple(positions))
@@ -0,0 +1,137 @@
+import hashlib
+import os
+import struct
+import sys
+from array import array
+from typing import Callable, Iterable
+
+# ------------------ Unicidade global entre execuções ------------------
+
+"""
+Guarda de unicidade para o provisionamento em massa: lembra as senhas já emitidas e força a regeração de repetidas.
+- Cada senha vira um digest de 8 bytes (blake2b com salt do arquivo e chave opcional) guardado num array('Q') com
+  endereçamento aberto e sondagem linear: ~16 bytes por senha com carga <= 0.5, contra ~100 bytes de um set de str.
+  O valor 0 marca posição vazia (um digest 0 é gravado como 1).
+- Dois digests iguais de senhas diferentes (probabilidade ~n²/2^65) só causam uma regeração desnecessária.
+- save()/load() persistem o conjunto, então a unicidade vale entre execuções incrementais.
+  O arquivo permite testar palpites de senha offline: guarde-o como dado sensível ou use key= secreta.
+"""
+
+_MAGIC = b"PGUNIQ01"
+_HEADER = struct.Struct("<8s16sQQ") # magic, salt, capacidade (posições), itens
+
+
+class DigestSet:
+    def __init__(self, capacity: int = 1024, key: bytes = b"", salt: bytes | None = None) -> None:
+        size = 8
+        while size < 2 * capacity:
+            size <<= 1
+        self.key = key
+        self.salt = os.urandom(16) if salt is None else salt
+        self.collisions = 0 # senhas recusadas por já terem sido emitidas
+        self._slots = array("Q", bytes(8 * size))
+        self._mask = size - 1
+        self._len = 0
+
+    def _digest(self, pw: str) -> int:
+        digest = hashlib.blake2b(pw.encode("utf-8"), digest_size=8, key=self.key, salt=self.salt).digest()
+        return int.from_bytes(digest, "little") or 1
+
+    def _find(self, h: int) -> int:
+        """Posição de h, ou a posição vazia onde ele entraria."""
+        slots, mask = self._slots, self._mask
+        i = h & mask
+        while slots[i] and slots[i] != h:
+            i = (i + 1) & mask
+        return i
+
+    def _grow(self) -> None:
+        old = self._slots
+        self._slots = array("Q", bytes(16 * len(old)))
+        self._mask = len(self._slots) - 1
+        for h in old:
+            if h:
+                self._slots[self._find(h)] = h
+
+    # ---------- API ----------
+    def add(self, pw: str) -> bool:
+        """Registra pw; False se ela (ou um digest igual) já tinha sido emitida."""
+        h = self._digest(pw)
+        i = self._find(h)
+        if self._slots[i]:
+            self.collisions += 1
+            return False
+        self._slots[i] = h
+        self._len += 1
+        if 2 * self._len > len(self._slots):
+            self._grow()
+        return True
+
+    def __contains__(self, pw: str) -> bool:
+        return bool(self._slots[self._find(self._digest(pw))])
+
+    def __len__(self) -> int:
+        return self._len
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._slots) * self._slots.itemsize
+
+    def admit(
+        self,
+        passwords: Iterable[str],
+        regenerate: Callable[[int], list[str]],
+        max_rounds: int = 100,
+    ) -> list[str]:
+        """
+        Registra passwords e troca as já emitidas (inclusive repetidas dentro do próprio lote) por senhas novas
+        de regenerate(n), mantendo as posições das demais.
+        """
+        out = list(passwords)
+        pending = [i for i, pw in enumerate(out) if not self.add(pw)]
+        for _ in range(max_rounds):
+            if not pending:
+                return out
+            retry = []
+            for i, pw in zip(pending, regenerate(len(pending))):
+                out[i] = pw
+                if not self.add(pw):
+                    retry.append(i)
+            pending = retry
+        if pending:
+            raise ValueError("Failed to generate unseen passwords after maximum attempts.")
+        return out
+
+    # ---------- Persistência ----------
+    def save(self, path: str | os.PathLike) -> None:
+        """Grava de forma atômica (arquivo temporário + os.replace)."""
+        slots = self._slots
+        if sys.byteorder == "big":  # arquivo sempre little-endian
+            slots = array("Q", slots)
+            slots.byteswap()
+        tmp = f"{path}.tmp"
+        with open(tmp, "wb") as fh:
+            fh.write(_HEADER.pack(_MAGIC, self.salt, len(slots), self._len))
+            slots.tofile(fh)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str | os.PathLike, key: bytes = b"") -> "DigestSet":
+        """Recarrega um conjunto salvo; key precisa ser a mesma usada na gravação."""
+        with open(path, "rb") as fh:
+            magic, salt, size, count = _HEADER.unpack(fh.read(_HEADER.size))
+            if magic != _MAGIC:
+                raise ValueError(f"{path} is not a password digest set file.")
+            guard = cls(key=key, salt=salt)
+            guard._slots = array("Q")
+            guard._slots.fromfile(fh, size)
+        if sys.byteorder == "big":
+            guard._slots.byteswap()
+        guard._mask = size - 1
+        guard._len = count
+        return guard
+
+    @classmethod
+    def open(cls, path: str | os.PathLike, capacity: int = 1024, key: bytes = b"") -> "DigestSet":
+        """load() se o arquivo existe, senão um conjunto novo (primeira execução)."""
+        return cls.load(path, key) if os.path.exists(path) else cls(capacity, key)
@@ -0,0 +1,154 @@
+from dataclasses import dataclass
+from .policies import CompiledPolicies, _SUCCESSOR
+
+try:
+    import numpy as np
+except ImportError as exc:  # dependência opcional: só é exigida por backend="numpy"
+    raise ImportError("backend='numpy' requires numpy (pip install numpy).") from exc
+
+# ------------------ Motor vetorizado (NumPy) ------------------
+
+"""
+Geração e validação em lote sobre uma matriz uint8 (linhas = senhas, colunas = índices no alfabeto).
+1) Os candidatos saem de uma única leitura de entropia (index_bytes) já como matriz.
+2) As políticas compiladas (CompiledPolicies) viram operações sobre o lote inteiro:
+   - MinLengthPolicy: comparação do comprimento (constante no lote);
+   - BasicPolicy: OR das máscaras de classe por linha (tabela índice -> bits);
+   - NoSequentialPolicy: "passos" entre vizinhos (sucessor do código anterior == código atual) e
+     janelas de run_len - 1 passos consecutivos.
+3) Linhas reprovadas são descartadas e sorteadas de novo em bloco; só as aprovadas viram str.
+Políticas desconhecidas continuam sendo chamadas via validate() nas sobreviventes.
+O caminho em Python puro (PasswordGenerator.generate) continua sendo a implementação de referência.
+constructive=True com unique_chars=False não tem equivalente vetorizado (o sorteio aqui é uniforme + rejeição):
+generate_batch recusa a combinação em vez de ignorá-la; com unique_chars=True o resultado é o mesmo do caminho
+construtivo (ver PasswordGenerator.generate). unique_chars=True com shuffle_final=False (senha agrupada por classe)
+também não tem equivalente aqui: PasswordGenerator usa o caminho em Python puro nesse caso.
+"""
+
+@dataclass(frozen=True)
+class _Tables:
+    chars: "np.ndarray"   # índice -> caractere ('<U1')
+    codes: "np.ndarray"   # índice -> código do caractere
+    bits: "np.ndarray"    # índice -> máscara de classes (mesma tabela de CompiledPolicies)
+    succ: "np.ndarray"    # índice -> código do sucessor na sequência proibida (-1 se não houver)
+    in_seq: "np.ndarray"  # índice -> caractere pertence a alguma sequência proibida
+
+
+def _tables(alphabet: str, engine: CompiledPolicies) -> _Tables:
+    return _Tables(
+        chars=np.array(list(alphabet), dtype="<U1"),
+        codes=np.array([ord(ch) for ch in alphabet], dtype=np.int32),
+        bits=np.array([engine.table[ch] for ch in alphabet], dtype=np.int64),
+        succ=np.array([ord(_SUCCESSOR[ch]) if _SUCCESSOR.get(ch) else -1 for ch in alphabet], dtype=np.int32),
+        in_seq=np.array([ch in _SUCCESSOR for ch in alphabet], dtype=bool),
+    )
+
+
+def _require_bulk(rng: object) -> None:
+    if not (hasattr(rng, "index_bytes") and hasattr(rng, "randbytes")):
+        raise ValueError("backend='numpy' requires a random source with index_bytes()/randbytes() (see passwords/rng.py).")
+
+
+def _draw(rng, k: int, rows: int, length: int) -> "np.ndarray":
+    if k <= 256:
+        raw = rng.index_bytes(k, rows * length)
+        return np.frombuffer(raw, dtype=np.uint8).reshape(rows, length)
+    return np.array(rng.indices(k, rows * length), dtype=np.int32).reshape(rows, length)
+
+
+def _random_keys(rng, rows: int, cols: int) -> "np.ndarray":
+    # chaves de 64 bits: empates (que enviesariam a ordem) têm probabilidade desprezível
+    return np.frombuffer(rng.randbytes(rows * cols * 8), dtype=np.uint64).reshape(rows, cols)
+
+
+def _unique_draw(rng, k: int, rows: int, length: int) -> "np.ndarray":
+    """Cada linha é o prefixo de uma permutação aleatória do alfabeto: amostra uniforme sem reposição."""
+    order = np.argsort(_random_keys(rng, rows, k), axis=1)[:, :length]
+    return order.astype(np.uint8 if k <= 256 else np.int32)
+
+
+def _permute(rng, batch: "np.ndarray") -> "np.ndarray":
+    """Embaralhamento independente de cada linha (equivalente vetorizado de _shuffle)."""
+    order = np.argsort(_random_keys(rng, *batch.shape), axis=1)
+    return np.take_along_axis(batch, order, axis=1)
+
+
+def validate_batch(batch: "np.ndarray", tables: _Tables, engine: CompiledPolicies) -> "np.ndarray":
+    """Máscara booleana das linhas que passam nas políticas compiladas (exceto engine.others)."""
+    rows, length = batch.shape
+    ok = np.full(rows, length >= engine.min_len)
+
+    if engine.required:
+        seen = np.bitwise_or.reduce(tables.bits[batch], axis=1)
+        ok &= (seen & engine.required) == engine.required
+
+    run_len = engine.run_len
+    if run_len is not None:
+        steps = tables.succ[batch[:, :-1]] == tables.codes[batch[:, 1:]] if 1 < run_len <= length else None
+        in_seq = tables.in_seq[batch] if run_len == 1 else None
+        ok &= run_free(steps, in_seq, run_len, rows)
+    return ok
+
+
+def run_free(steps: "np.ndarray | None", in_seq: "np.ndarray | None", run_len: int, rows: int | None = None) -> "np.ndarray":
+    """
+    Linhas sem corrida de run_len caracteres (regra de _no_runs), a partir de:
+    - steps[i, p]: o caractere p + 1 é o sucessor do caractere p (só usado quando run_len > 1);
+    - in_seq[i, p]: o caractere p pertence a alguma sequência (só usado quando run_len == 1).
+    """
+    if rows is None:
+        rows = (steps if steps is not None else in_seq).shape[0]
+    if run_len <= 0:
+        return np.zeros(rows, dtype=bool)
+    if run_len == 1:
+        return ~in_seq.any(axis=1)
+    if steps is None or run_len - 1 > steps.shape[1]:
+        return np.ones(rows, dtype=bool)
+    width = steps.shape[1] - (run_len - 1) + 1
+    window = steps[:, :width].copy()
+    for s in range(1, run_len - 1):
+        window &= steps[:, s:s + width]
+    return ~window.any(axis=1)
+
+
+def to_strings(batch: "np.ndarray", tables: _Tables) -> list[str]:
+    rows, length = batch.shape
+    if not rows:
+        return []
+    if not length:
+        return [""] * rows
+    chars = np.ascontiguousarray(tables.chars[batch])
+    return chars.view(f"<U{length}").ravel().tolist()
+
+
+def generate_batch(gen, count: int, length: int, unique_chars: bool, max_tries: int, shuffle_final: bool) -> list[str]:
+    """Equivalente vetorizado de PasswordGenerator._generate_batch."""
+    if gen.constructive and not unique_chars:
+        raise ValueError("constructive=True with unique_chars=False is not supported by backend='numpy'.")
+    rng = gen.rng
+    _require_bulk(rng)
+    alphabet = gen.alphabet_all
+    k = len(alphabet)
+    if unique_chars and length > k:
+        raise ValueError("unique_chars requires length <= alphabet size.")
+
+    engine = gen._policy_engine()
+    tables = _tables(alphabet, engine)
+
+    out: list[str] = []
+    for _ in range(max_tries):
+        missing = count - len(out)
+        if not missing:
+            break
+        batch = _unique_draw(rng, k, missing, length) if unique_chars else _draw(rng, k, missing, length)
+        batch = batch[validate_batch(batch, tables, engine)]
+        if shuffle_final and not unique_chars:  # no modo único a linha já é uma permutação aleatória
+            batch = _permute(rng, batch)
+        words = to_strings(batch, tables)
+        if engine.others:
+            words = [w for w in words if all(policy.validate(w) for policy in engine.others)]
+        out += words
+
+    if len(out) < count:
+        raise ValueError("Failed to generate a valid password after maximum attempts.")
+    return out
@@ -0,0 +1,234 @@
+import hmac
+import sqlite3
+import time
+from pathlib import Path
+from typing import Iterable, Iterator
+from passwords.hashing import HashParams, HashRecord, hash_many, verify
+
+# ------------------ Armazenamento indexado (SQLite) ------------------
+
+"""
+Repositório persistente de credenciais, substituindo a reescrita completa de Cadastros a cada execução.
+- Chave estável (servico, usuario) com índice único -> consultas pontuais e upsert sem varrer a tabela.
+- WAL + synchronous=NORMAL: leitores não bloqueiam o escritor e cada lote custa um único fsync.
+- Escritas em lote: executemany dentro de uma única transação por chamada.
+- atualizado_em: instante da última troca de senha, em segundos Unix (inteiro, UTC), com índice próprio para que
+  a rotação selecione as senhas vencidas sem varrer a tabela.
+- origem: hash (inteiro de 64 bits) da linha de entrada que gerou a credencial; quando a linha muda na fonte,
+  a credencial é rotacionada (ver changed()).
+- hash_params: com parâmetros, as escritas gravam só hash, salt e parametros (passwords/hashing.py) e senha fica
+  nula; verify() confere uma senha contra qualquer das duas formas.
+"""
+
+Credential = tuple[str, str, str | None, int] # (servico, usuario, senha, atualizado_em); senha nula se com hash
+TrackedCredential = tuple[str, str, str, int, int | None] # Credential + origem (None mantém a gravada)
+
+_TABLE = """
+CREATE TABLE IF NOT EXISTS {nome} (
+    servico       TEXT    NOT NULL,
+    usuario       TEXT    NOT NULL,
+    senha         TEXT,
+    atualizado_em INTEGER NOT NULL,
+    origem        INTEGER,
+    hash          BLOB,
+    salt          BLOB,
+    parametros    TEXT
+)
+"""
+
+_INDEXES = """
+CREATE UNIQUE INDEX IF NOT EXISTS ux_credenciais_chave ON credenciais (servico, usuario);
+CREATE INDEX IF NOT EXISTS ix_credenciais_atualizado ON credenciais (atualizado_em);
+"""
+
+class CredentialStore:
+    def __init__(self, path: str | Path = "Cadastros.db", hash_params: HashParams | None = None) -> None:
+        self.path = Path(path)
+        self.hash_params = hash_params
+        self._conn = sqlite3.connect(self.path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(_TABLE.format(nome="credenciais"))
+        self._migrate()
+        self._conn.executescript(_INDEXES)
+
+    def _migrate(self) -> None:
+        """
+        Bancos antigos: a coluna origem é acrescentada (nula) sem reescrever a tabela; bancos com senha NOT NULL
+        (anteriores às colunas de hash) são copiados uma única vez para o esquema atual.
+        """
+        info = {row[1]: row for row in self._conn.execute("PRAGMA table_info(credenciais)")}
+        if "origem" not in info:
+            with self._conn:
+                self._conn.execute("ALTER TABLE credenciais ADD COLUMN origem INTEGER")
+        if info["senha"][3]: # notnull
+            with self._conn:
+                self._conn.execute("BEGIN")
+                self._conn.execute(_TABLE.format(nome="_credenciais_nova"))
+                self._conn.execute(
+                    "INSERT INTO _credenciais_nova (servico, usuario, senha, atualizado_em, origem) "
+                    "SELECT servico, usuario, senha, atualizado_em, origem FROM credenciais ORDER BY rowid"
+                )
+                self._conn.execute("DROP TABLE credenciais")
+                self._conn.execute("ALTER TABLE _credenciais_nova RENAME TO credenciais")
+
+    def _secrets(self, rows: list[tuple]) -> list[tuple[str | None, bytes | None, bytes | None, str | None]]:
+        """(senha, hash, salt, parametros) de cada linha: a senha em claro ou, com hash_params, só o hash."""
+        senhas = [row[2] for row in rows]
+        if self.hash_params is None:
+            return [(senha, None, None, None) for senha in senhas]
+        return [(None, r.hash, r.salt, r.params) for r in hash_many(senhas, self.hash_params)]
+
+    # ---------- Ciclo de vida ----------
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> "CredentialStore":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    # ---------- Escrita em lote ----------
+    def upsert_many(self, rows: Iterable[Credential]) -> int:
+        """Insere ou atualiza (por chave) todas as linhas numa única transação. Retorna quantas foram gravadas."""
+        rows = list(rows)
+        secrets = self._secrets(rows) # hash fora da transação: o banco não fica travado durante o PBKDF2/scrypt
+        with self._conn:
+            cur = self._conn.executemany(
+                """
+                INSERT INTO credenciais (servico, usuario, senha, hash, salt, parametros, atualizado_em)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (servico, usuario) DO UPDATE SET
+                    senha = excluded.senha,
+                    hash = excluded.hash,
+                    salt = excluded.salt,
+                    parametros = excluded.parametros,
+                    atualizado_em = excluded.atualizado_em
+                """,
+                ((s, u, *secret, t) for (s, u, _, t), secret in zip(rows, secrets)),
+            )
+        return cur.rowcount
+
+    def rotate_many(self, rows: Iterable[TrackedCredential]) -> int:
+        """
+        Como upsert_many, gravando também a origem da linha; origem None preserva a já gravada
+        (rotação por idade, sem mudança na fonte).
+        """
+        rows = list(rows)
+        secrets = self._secrets(rows)
+        with self._conn:
+            cur = self._conn.executemany(
+                """
+                INSERT INTO credenciais (servico, usuario, senha, hash, salt, parametros, atualizado_em, origem)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (servico, usuario) DO UPDATE SET
+                    senha = excluded.senha,
+                    hash = excluded.hash,
+                    salt = excluded.salt,
+                    parametros = excluded.parametros,
+                    atualizado_em = excluded.atualizado_em,
+                    origem = COALESCE(excluded.origem, credenciais.origem)
+                """,
+                ((s, u, *secret, t, o) for (s, u, _, t, o), secret in zip(rows, secrets)),
+            )
+        return cur.rowcount
+
+    # ---------- Consultas ----------
+    def get(self, servico: str, usuario: str) -> Credential | None:
+        """Consulta pontual pelo índice único."""
+        return self._conn.execute(
+            "SELECT servico, usuario, senha, atualizado_em FROM credenciais WHERE servico = ? AND usuario = ?",
+            (servico, usuario),
+        ).fetchone()
+
+    def verify(self, servico: str, usuario: str, senha: str) -> bool:
+        """Confere senha contra a credencial gravada (hash com os parâmetros da linha, ou senha em claro)."""
+        row = self._conn.execute(
+            "SELECT senha, hash, salt, parametros FROM credenciais WHERE servico = ? AND usuario = ?",
+            (servico, usuario),
+        ).fetchone()
+        if row is None:
+            return False
+        stored, digest, salt, params = row
+        if digest is not None:
+            return verify(senha, HashRecord(digest, salt, params))
+        return stored is not None and hmac.compare_digest(stored.encode("utf-8"), senha.encode("utf-8"))
+
+    def missing(self, keys: Iterable[tuple[str, str]]) -> list[tuple[str, str]]:
+        """
+        Chaves (servico, usuario) ainda sem credencial, na ordem recebida e sem repetição.
+        As chaves vão para uma tabela temporária e um único LEFT JOIN usa o índice único.
+        """
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return []
+        with self._conn:
+            self._conn.execute("CREATE TEMP TABLE IF NOT EXISTS _chaves (ordem INTEGER, servico TEXT, usuario TEXT)")
+            self._conn.execute("DELETE FROM _chaves")
+            self._conn.executemany(
+                "INSERT INTO _chaves VALUES (?, ?, ?)",
+                ((i, s, u) for i, (s, u) in enumerate(keys)),
+            )
+            rows = self._conn.execute(
+                """
+                SELECT k.servico, k.usuario FROM _chaves k
+                LEFT JOIN credenciais c ON c.servico = k.servico AND c.usuario = k.usuario
+                WHERE c.servico IS NULL ORDER BY k.ordem
+                """
+            ).fetchall()
+        return rows
+
+    def changed(self, rows: Iterable[tuple[str, str, int]]) -> list[tuple[str, str, int, bool]]:
+        """
+        Recebe (servico, usuario, origem) e devolve, na ordem recebida, as chaves ausentes ou cuja origem gravada
+        difere: (servico, usuario, origem, nova), com nova=True para chaves ainda sem credencial.
+        Origem nula (linhas gravadas antes da coluna existir) é adotada sem rotação.
+        """
+        rows = list({(s, u): (s, u, o) for s, u, o in rows}.values()) # última ocorrência de cada chave vence
+        if not rows:
+            return []
+        with self._conn:
+            self._conn.execute(
+                "CREATE TEMP TABLE IF NOT EXISTS _origens (ordem INTEGER, servico TEXT, usuario TEXT, origem INTEGER)"
+            )
+            self._conn.execute("DELETE FROM _origens")
+            self._conn.executemany(
+                "INSERT INTO _origens VALUES (?, ?, ?, ?)",
+                ((i, s, u, o) for i, (s, u, o) in enumerate(rows)),
+            )
+            self._conn.execute(
+                """
+                UPDATE credenciais SET origem = k.origem FROM _origens k
+                WHERE credenciais.origem IS NULL AND credenciais.servico = k.servico AND credenciais.usuario = k.usuario
+                """
+            )
+            found = self._conn.execute(
+                """
+                SELECT k.servico, k.usuario, k.origem, c.servico IS NULL FROM _origens k
+                LEFT JOIN credenciais c ON c.servico = k.servico AND c.usuario = k.usuario
+                WHERE c.servico IS NULL OR c.origem IS NOT k.origem ORDER BY k.ordem
+                """
+            ).fetchall()
+        return [(s, u, o, bool(nova)) for s, u, o, nova in found]
+
+    def expired(self, before: int, limit: int | None = None) -> list[tuple[str, str]]:
+        """Chaves com atualizado_em < before, das mais antigas para as mais novas (pelo índice de atualizado_em)."""
+        return self._conn.execute(
+            "SELECT servico, usuario FROM credenciais WHERE atualizado_em < ? ORDER BY atualizado_em LIMIT ?",
+            (before, -1 if limit is None else limit),
+        ).fetchall()
+
+    def iter_chunks(self, size: int = 100_000) -> Iterator[list[Credential]]:
+        """Percorre a tabela inteira em lotes de size linhas (cursor com fetchmany: memória limitada ao lote)."""
+        cur = self._conn.execute("SELECT servico, usuario, senha, atualizado_em FROM credenciais ORDER BY rowid")
+        while rows := cur.fetchmany(size):
+            yield rows
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM credenciais").fetchone()[0]
+
+
+def now() -> int:
+    """Instante atual no formato de atualizado_em."""
+    return int(time.time())
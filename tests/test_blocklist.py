@@ -0,0 +1,14 @@
+from passwords.blocklist import build_bloom_from_wordlist, open_bloom
+
+
+def test_wordlist_with_non_utf8_lines(tmp_path):
+    wordlist = tmp_path / "rockyou.txt"
+    wordlist.write_bytes(b"senha123\ncontrase\xf1a\n\xff\xfe\n")
+    assert build_bloom_from_wordlist(wordlist, tmp_path / "bloom.bin") == 3
+    bloom = open_bloom(str(tmp_path / "bloom.bin"))
+    try:
+        assert "senha123" in bloom
+        assert b"contrase\xf1a".decode("utf-8", "surrogateescape") in bloom
+        assert b"\xff\xfe".decode("utf-8", "surrogateescape") in bloom
+    finally:
+        bloom.close()
@@ -0,0 +1,25 @@
+import random
+
+import pytest
+
+from passwords.generator import PasswordGenerator
+
+
+class ProtocolOnlyRandom:
+    """Só o contrato RandomSource (choice/shuffle), sem randbelow nem sorteios em lote."""
+    def __init__(self, seed: int = 0) -> None:
+        self._rng = random.Random(seed)
+
+    def choice(self, seq):
+        return self._rng.choice(seq)
+
+    def shuffle(self, x):
+        self._rng.shuffle(x)
+
+
+@pytest.mark.parametrize("length", [11, 30, 40])
+def test_protocol_only_source_draws_long_passwords(length):
+    unique = PasswordGenerator(rng=ProtocolOnlyRandom())
+    constructive = PasswordGenerator(rng=ProtocolOnlyRandom(), constructive=True)
+    assert len(unique.generate(length)) == length
+    assert len(constructive.generate(length, unique_chars=False)) == length
@@ -0,0 +1,25 @@
+import sqlite3
+
+from database import auditar_tabela, ler_tabela_em_blocos
+from store import CredentialStore
+
+
+def test_csv_audit_reads_passwords_as_text(tmp_path):
+    caminho = tmp_path / "Cadastros"
+    caminho.write_text("Serviço,Usuário,Senha\nx,a,NA\ny,b,null\nz,c,0123456\n", encoding="utf-8")
+    (df,) = ler_tabela_em_blocos(caminho)
+    assert df["Senha"].tolist() == ["NA", "null", "0123456"]
+    assert auditar_tabela(caminho, progresso=None).linhas_gravadas == 3
+
+
+def test_db_audit_does_not_write(tmp_path):
+    caminho = tmp_path / "Cadastros.db"
+    with CredentialStore(caminho) as store:
+        store.upsert_many([("x", "a", "Abc123!@#xyz", 0)])
+    conn = sqlite3.connect(caminho)
+    conn.execute("PRAGMA journal_mode=DELETE")
+    conn.close()
+    antes = caminho.read_bytes()
+    assert auditar_tabela(caminho, progresso=None).linhas_gravadas == 1
+    assert caminho.read_bytes() == antes
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["Cadastros.db"]
@@ -0,0 +1,8 @@
+from passwords.generator import PasswordGenerator
+
+
+def test_unique_chars_accepts_shuffle_final_false():
+    gen = PasswordGenerator()
+    for pw in [gen.generate(12, shuffle_final=False), *gen.generate_many(20, 12, shuffle_final=False)]:
+        assert len(set(pw)) == 12
+        assert gen._passes_policies(pw)
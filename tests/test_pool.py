@@ -0,0 +1,24 @@
+import asyncio
+
+from passwords.pool import PoolManager, _handle
+
+
+def test_non_utf8_line_replies_error_and_keeps_connection():
+    async def cenario():
+        manager = PoolManager(high_water=8, batch_size=4)
+        server = await asyncio.start_server(lambda r, w: _handle(manager, r, w), "127.0.0.1", 0)
+        reader, writer = await asyncio.open_connection(*server.sockets[0].getsockname()[:2])
+        try:
+            writer.write(b"\xff\xfe 12\n12\n")
+            await writer.drain()
+            erro = await asyncio.wait_for(reader.readline(), 5)
+            senha = await asyncio.wait_for(reader.readline(), 5)
+        finally:
+            writer.close()
+            server.close()
+            await manager.close()
+        return erro, senha
+
+    erro, senha = asyncio.run(cenario())
+    assert erro.startswith(b"ERROR ")
+    assert len(senha.rstrip(b"\n")) == 12
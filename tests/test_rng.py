@@ -0,0 +1,65 @@
+import os
+import pickle
+
+import pytest
+
+from passwords.generator import PasswordGenerator
+from passwords.rng import BufferedRandom, SecretsRandom
+
+fork = pytest.mark.skipif(not hasattr(os, "fork"), reason="requer os.fork")
+
+
+def _in_child(draw, timeout: float = 10.0) -> bytes:
+    """Executa draw() num filho (fork) e devolve o repr do resultado; falha se o filho travar."""
+    r, w = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(r)
+        try:
+            os.write(w, repr(draw()).encode())
+        finally:
+            os._exit(0)
+    os.close(w)
+    import select
+    out = b""
+    while True:
+        ready, _, _ = select.select([r], [], [], timeout)
+        if not ready:
+            os.kill(pid, 9)
+            os.waitpid(pid, 0)
+            pytest.fail("forked child hung")
+        chunk = os.read(r, 65536)
+        if not chunk:
+            break
+        out += chunk
+    os.close(r)
+    os.waitpid(pid, 0)
+    return out
+
+
+@fork
+@pytest.mark.parametrize("make", [SecretsRandom, lambda: BufferedRandom(buffer_size=1024)])
+def test_forked_children_do_not_share_entropy(make):
+    gen = PasswordGenerator(rng=make())
+    gen.generate_many(2, 12)  # enche o buffer no pai antes do fork
+    first = _in_child(lambda: gen.generate_many(3, 12, unique_chars=False))
+    second = _in_child(lambda: gen.generate_many(3, 12, unique_chars=False))
+    assert first and second and first != second
+
+
+@fork
+def test_buffered_random_refills_in_forked_child():
+    rng = BufferedRandom(buffer_size=1024, prefetch=2)
+    rng.randbytes(10)
+    # bem mais que os blocos herdados: sem a thread recriada, _fill esperaria para sempre
+    out = _in_child(lambda: len(b"".join(rng.randbytes(100) for _ in range(200))))
+    assert out == b"20000"
+    rng.close()
+
+
+def test_secrets_random_pickles_without_buffer():
+    rng = SecretsRandom()
+    rng.randbelow(10)
+    copy = pickle.loads(pickle.dumps(rng))
+    assert copy._pool == b""
+    assert 0 <= copy.randbelow(10) < 10